@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark de l'étape CPU : parsing des flux et extraction des pages depuis un pool de threads réseau,
+avec le parsing dans les threads (sérialisé par le GIL) ou délégué au pool de processus.
+Le gain attendu croît avec le nombre de cœurs ; sur une machine à un cœur, seul le surcoût du
+transfert entre processus est mesuré.
+
+Usage : python -m benchmarks.bench_cpu_stage --pages 300 --feeds 50 --threads 24
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from email.utils import formatdate
+from typing import Callable, List
+
+from loguru import logger
+
+from benchmarks.bench_extractor import generated_corpus
+from src.parse_worker import extract_article_text, parse_feed_entries
+
+
+def generated_feed(index: int, entries: int = 30) -> bytes:
+    items = ''.join(
+        f"<item><title>Post {index}-{i} about Python performance</title>"
+        f"<link>https://example.com/{index}/{i}</link><guid>https://example.com/{index}/{i}</guid>"
+        f"<pubDate>{formatdate(1_750_000_000 - i * 3600, usegmt=True)}</pubDate>"
+        f"<category>python</category><description>&lt;p&gt;Summary {i} of a long article&lt;/p&gt;</description></item>"
+        for i in range(entries)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed {index}</title>{items}</channel></rss>'.encode()
+
+
+def run_tasks(threads: int, tasks: List[Callable[[], object]]) -> float:
+    """Exécute les tâches depuis un pool de threads (comme le scraper) et retourne la durée"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for future in [executor.submit(task) for task in tasks]:
+            future.result()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=300)
+    parser.add_argument('--feeds', type=int, default=50)
+    parser.add_argument('--threads', type=int, default=24, help='Threads réseau simulés')
+    parser.add_argument('--workers', type=int, default=0, help='Processus de parsing (0 = un par cœur)')
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    pages = generated_corpus(args.pages)
+    feeds = [generated_feed(i) for i in range(args.feeds)]
+    workers = args.workers or os.cpu_count() or 1
+
+    def tasks(call: Callable) -> List[Callable[[], object]]:
+        return (
+            [lambda feed=feed: call(parse_feed_entries, feed) for feed in feeds]
+            + [lambda url=url, html=html: call(extract_article_text, html, url, 'lxml') for _, url, html in pages]
+        )
+
+    in_threads = run_tasks(args.threads, tasks(lambda fn, *fn_args: fn(*fn_args)))
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        # Démarrage des processus (imports) hors mesure, comme pour le pool partagé du scraper
+        list(pool.map(parse_feed_entries, feeds[:workers]))
+        in_processes = run_tasks(args.threads, tasks(lambda fn, *fn_args: pool.submit(fn, *fn_args).result()))
+
+    total = len(feeds) + len(pages)
+    print(f"{len(feeds)} feeds + {len(pages)} pages, {args.threads} threads, {workers} processes ({os.cpu_count()} cores)")
+    print(f"  threads    {in_threads:8.3f}s  {total / in_threads:8.1f} items/s")
+    print(f"  processes  {in_processes:8.3f}s  {total / in_processes:8.1f} items/s")
+    print(f"  speedup    {in_threads / in_processes:.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
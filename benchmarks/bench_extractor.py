@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Benchmark de l'extraction du contenu des articles : ancien chemin (readability + BeautifulSoup)
+contre l'extracteur lxml à un seul parsing. Mesure le débit et la parité du texte extrait.
+
+Corpus : un dossier de pages .html sauvegardées (index.json optionnel : fichier -> URL, pour les règles par site).
+Ou directement le stockage des pages brutes du scraper (--store data/raw_html), sans accès réseau.
+Sans corpus, des pages générées sont utilisées (conteneur <article>, règle de site, page sans conteneur).
+
+Usage :
+  python -m benchmarks.bench_extractor --record corpus/ --limit 100   # sauvegarde des pages réelles
+  python -m benchmarks.bench_extractor --corpus corpus/ --repeat 3
+  python -m benchmarks.bench_extractor --store data/raw_html
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import List, Tuple
+
+from loguru import logger
+
+from benchmarks.fixture_server import WORDS, FixtureConfig, build_article
+from src.content_extractor import extract_main_text, extract_text_legacy
+from src.raw_html_store import RawHtmlStore
+
+
+def _paragraphs(rng: random.Random, count: int) -> str:
+    return ''.join(
+        f"<p>{' '.join(rng.choice(WORDS) for _ in range(40)).capitalize()}.</p>"
+        for _ in range(count)
+    )
+
+
+def generated_corpus(pages: int) -> List[Tuple[str, str, bytes]]:
+    """Pages générées : (nom, url, html) réparties entre les trois chemins de l'extracteur"""
+    rng = random.Random(42)
+    config = FixtureConfig(page_paragraphs=30)
+    corpus = []
+    for i in range(pages):
+        layout = i % 3
+        if layout == 0:
+            corpus.append((f'article_{i}', f'https://example.com/{i}', build_article(i, 0, config)))
+        elif layout == 1:
+            html = (
+                "<html><head><script>var a = 1;</script></head><body><nav>Menu Search</nav>"
+                f"<div class='post-content entry'><h1>Post {i}</h1>{_paragraphs(rng, 30)}</div>"
+                "<div class='sidebar'>Related posts Subscribe</div><footer>Footer</footer></body></html>"
+            )
+            corpus.append((f'site_rule_{i}', f'https://blog.logrocket.com/post-{i}/', html.encode('utf-8')))
+        else:
+            html = (
+                "<html><head><style>p{}</style></head><body><div id='menu'>Home About</div>"
+                f"<div id='content'><div class='text'><h2>Page {i}</h2>{_paragraphs(rng, 30)}</div></div>"
+                "<div class='comments'>No comments yet</div></body></html>"
+            )
+            corpus.append((f'no_container_{i}', f'https://unknown.example/{i}', html.encode('utf-8')))
+    return corpus
+
+
+def load_corpus(directory: str) -> List[Tuple[str, str, bytes]]:
+    index_path = os.path.join(directory, 'index.json')
+    urls = {}
+    if os.path.exists(index_path):
+        with open(index_path) as f:
+            urls = json.load(f)
+
+    corpus = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.html'):
+            with open(os.path.join(directory, name), 'rb') as f:
+                corpus.append((name, urls.get(name, ''), f.read()))
+    return corpus
+
+
+def store_corpus(directory: str, limit: int = None) -> List[Tuple[str, str, bytes]]:
+    """Pages brutes conservées par le scraper (nom = URL)"""
+    store = RawHtmlStore(root=directory, enabled=True)
+    corpus = []
+    for url in sorted(store.urls())[:limit]:
+        html = store.get(url)
+        if html is not None:
+            corpus.append((url, url, html))
+    return corpus
+
+
+def record_corpus(directory: str, limit: int) -> int:
+    """Sauvegarde des pages d'articles réelles à partir des flux configurés (accès réseau)"""
+    from src.enhanced_scraper import EnhancedFullstackScraper
+
+    scraper = EnhancedFullstackScraper()
+    os.makedirs(directory, exist_ok=True)
+    index = {}
+    for domain in scraper.sources:
+        for url in scraper.fetch_plan.urls_for_domain(domain):
+            for _, article in scraper._fetch_feed_articles(url)[:3]:
+                if len(index) >= limit:
+                    break
+                try:
+                    _, body, _ = scraper.http.get_bounded(
+                        article['url'],
+                        headers=scraper._get_optimized_headers(article['url']),
+                        timeout=scraper.request_timeout,
+                        max_bytes=scraper.article_max_bytes,
+                        allowed_types=scraper.article_content_types
+                    )
+                except Exception as e:
+                    logger.warning(f"Skipping {article['url']}: {e}")
+                    continue
+                name = f"{len(index):04d}.html"
+                with open(os.path.join(directory, name), 'wb') as f:
+                    f.write(body)
+                index[name] = article['url']
+
+    with open(os.path.join(directory, 'index.json'), 'w') as f:
+        json.dump(index, f, indent=2)
+    return len(index)
+
+
+def token_parity(reference: str, candidate: str) -> float:
+    """Similarité de Jaccard sur les mots (1.0 = même vocabulaire)"""
+    ref_tokens, cand_tokens = set(reference.lower().split()), set(candidate.lower().split())
+    if not ref_tokens and not cand_tokens:
+        return 1.0
+    return len(ref_tokens & cand_tokens) / len(ref_tokens | cand_tokens)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', help='Dossier de pages .html sauvegardées')
+    parser.add_argument('--store', help='Dossier du stockage des pages brutes du scraper')
+    parser.add_argument('--pages', type=int, default=150, help='Pages générées sans --corpus')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--record', help='Sauvegarder des pages réelles dans ce dossier puis quitter')
+    parser.add_argument('--limit', type=int, default=100, help='Pages à sauvegarder avec --record')
+    parser.add_argument('--json', help='Fichier de sortie JSON')
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    if args.record:
+        print(f"{record_corpus(args.record, args.limit)} pages saved to {args.record}")
+        return 0
+
+    if args.store:
+        corpus = store_corpus(args.store)
+    elif args.corpus:
+        corpus = load_corpus(args.corpus)
+    else:
+        corpus = generated_corpus(args.pages)
+    if not corpus:
+        print('Empty corpus')
+        return 1
+
+    timings = {}
+    outputs = {}
+    for name, extract in (
+        ('legacy', lambda html, url: extract_text_legacy(html)),
+        ('lxml', lambda html, url: extract_main_text(html, url)[0] or ''),
+    ):
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            texts = [extract(html, url) for _, url, html in corpus]
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best
+        outputs[name] = texts
+
+    methods = Counter(extract_main_text(html, url)[1] for _, url, html in corpus)
+    parities = [token_parity(ref, cand) for ref, cand in zip(outputs['legacy'], outputs['lxml'])]
+    worst = sorted(zip(parities, (name for name, _, _ in corpus)))[:5]
+
+    print(f"{len(corpus)} pages, best of {args.repeat}")
+    for name, seconds in timings.items():
+        print(f"  {name:<7} {seconds:8.3f}s  {len(corpus) / seconds:8.1f} pages/s")
+    print(f"  speedup {timings['legacy'] / timings['lxml']:.1f}x")
+    print(f"  parity  mean {sum(parities) / len(parities):.3f}  min {min(parities):.3f}")
+    print(f"  methods {dict(methods)}")
+    print(f"  lowest parity: {', '.join(f'{name} ({parity:.2f})' for parity, name in worst)}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'pages': len(corpus),
+                'seconds': timings,
+                'parity_mean': sum(parities) / len(parities),
+                'parity_min': min(parities),
+                'methods': dict(methods),
+            }, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark du parsing des flux : feedparser sur le document entier contre la lecture iterparse
+arrêtée après les N premières entrées (plafond par poids de source : 5, 10 ou 15).
+Mesure le temps, le pic mémoire (tracemalloc) et la parité des champs lus par le scraper.
+
+Flux générés en RSS 2.0 et Atom, avec le contenu HTML complet de chaque article (comme
+planet.python.org ou infoq), ou dossier de flux sauvegardés (--feeds, fichiers .xml).
+
+Usage : python -m benchmarks.bench_feed_reader --entries 300 --limit 10
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from email.utils import formatdate
+from typing import Callable, List, Tuple
+
+import feedparser
+from loguru import logger
+
+from benchmarks.fixture_server import WORDS
+from src.feed_reader import read_feed_entries
+from src.parse_worker import compact_entry, parse_feed_entries
+
+
+def _html_body(index: int, paragraphs: int = 15) -> str:
+    words = [WORDS[(index * 7 + i) % len(WORDS)] for i in range(60)]
+    return ''.join(f"<p>{' '.join(words[j:] + words[:j])}.</p>" for j in range(paragraphs))
+
+
+def generated_rss(entries: int) -> bytes:
+    items = ''.join(
+        f"<item><title>Post {i}: {WORDS[i % len(WORDS)]} &amp; performance</title>"
+        f"<link>https://example.com/posts/{i}</link><guid isPermaLink='false'>post-{i}</guid>"
+        f"<pubDate>{formatdate(1_750_000_000 - i * 3600, usegmt=True)}</pubDate>"
+        f"<category>python</category><category>web</category>"
+        f"<description><![CDATA[<p>Summary of post {i}</p>]]></description>"
+        f"<content:encoded><![CDATA[{_html_body(i)}]]></content:encoded></item>"
+        for i in range(entries)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0" '
+        'xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel><title>Feed</title>'
+        f'{items}</channel></rss>'
+    ).encode('utf-8')
+
+
+def generated_atom(entries: int) -> bytes:
+    items = ''.join(
+        f'<entry><title type="html">Entry {i} &lt;em&gt;{WORDS[i % len(WORDS)]}&lt;/em&gt;</title>'
+        f'<link rel="alternate" href="https://example.org/{i}"/><id>tag:example.org,2025:{i}</id>'
+        f'<published>2025-07-{1 + i % 28:02d}T10:00:00+02:00</published><updated>2025-07-{1 + i % 28:02d}T12:00:00Z</updated>'
+        f'<category term="rust"/><content type="html"><![CDATA[{_html_body(i)}]]></content></entry>'
+        for i in range(entries)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title>'
+        f'{items}</feed>'
+    ).encode('utf-8')
+
+
+def load_feeds(directory: str) -> List[Tuple[str, bytes]]:
+    feeds = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.xml'):
+            with open(os.path.join(directory, name), 'rb') as f:
+                feeds.append((name, f.read()))
+    return feeds
+
+
+def measure(parse: Callable[[bytes], list], feeds: List[Tuple[str, bytes]], repeat: int) -> Tuple[float, int]:
+    """Meilleur temps total sur `repeat` passes et pic mémoire d'une passe"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _, content in feeds:
+            parse(content)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    for _, content in feeds:
+        parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--feeds', help='Dossier de flux sauvegardés (.xml)')
+    parser.add_argument('--entries', type=int, default=300, help='Entrées par flux généré')
+    parser.add_argument('--limit', type=int, default=10, help='Entrées lues par flux (plafond par source)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    if args.feeds:
+        feeds = load_feeds(args.feeds)
+    else:
+        feeds = [('rss', generated_rss(args.entries)), ('atom', generated_atom(args.entries))]
+
+    full_time, full_peak = measure(
+        lambda content: [compact_entry(entry) for entry in feedparser.parse(content).entries][:args.limit],
+        feeds, args.repeat
+    )
+    fast_time, fast_peak = measure(lambda content: parse_feed_entries(content, args.limit), feeds, args.repeat)
+
+    mismatches, compared, fallbacks = [], 0, 0
+    for name, content in feeds:
+        reference = [compact_entry(entry) for entry in feedparser.parse(content).entries[:args.limit]]
+        candidate = read_feed_entries(content, args.limit)
+        if candidate is None:
+            fallbacks += 1
+            continue
+        for index, (ref, cand) in enumerate(zip(reference, candidate)):
+            compared += 1
+            fields = sorted(key for key in set(ref) | set(cand) if ref.get(key) != cand.get(key))
+            if fields:
+                mismatches.append(f"{name}#{index}: {', '.join(fields)}")
+
+    size = sum(len(content) for _, content in feeds)
+    print(f"{len(feeds)} feeds ({size / 1024:.0f} KiB), first {args.limit} entries, best of {args.repeat}")
+    print(f"  feedparser  {full_time * 1000:8.1f} ms  peak {full_peak / 1024:8.0f} KiB")
+    print(f"  iterparse   {fast_time * 1000:8.1f} ms  peak {fast_peak / 1024:8.0f} KiB")
+    print(f"  speedup     {full_time / fast_time:.1f}x  memory {full_peak / max(fast_peak, 1):.1f}x less")
+    print(f"  parity      {compared - len(mismatches)}/{compared} entries identical, {fallbacks} feeds fell back to feedparser")
+    for mismatch in mismatches[:10]:
+        print(f"    differs: {mismatch}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
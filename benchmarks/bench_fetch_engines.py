@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark des moteurs de fetch (threads vs asyncio) contre le serveur local
+Mesure le temps de collecte des flux et d'enrichissement selon le nombre de sources
+
+Usage : python -m benchmarks.bench_fetch_engines --sources 10 50 100 200 --latency-ms 100 --hosts 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from loguru import logger
+
+from benchmarks.fixture_server import FixtureConfig, FixtureServer
+from src import async_fetcher
+from src.database import DatabaseManager
+from src.enhanced_scraper import EnhancedFullstackScraper
+
+
+def run_engine(engine: str, sources: list, workdir: str) -> dict:
+    """Collecte puis enrichit toutes les sources avec un moteur donné"""
+    db = DatabaseManager(db_path=os.path.join(workdir, f'bench_{engine}_{len(sources)}.db'))
+    scraper = EnhancedFullstackScraper(db)
+    scraper.fetch_engine = engine
+    scraper.sources = {'bench': {'bench': sources}}
+
+    start = time.perf_counter()
+    articles = scraper._collect_from_sources('bench')
+    collect_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    enriched = scraper._enrich_articles_parallel(articles)
+    enrich_seconds = time.perf_counter() - start
+
+    full = sum(1 for article in enriched if article.get('extraction_quality') == 'full')
+    db.close()
+
+    return {
+        'engine': engine,
+        'sources': len(sources),
+        'articles': len(articles),
+        'enriched_full': full,
+        'collect_seconds': round(collect_seconds, 3),
+        'enrich_seconds': round(enrich_seconds, 3),
+        'total_seconds': round(collect_seconds + enrich_seconds, 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sources', type=int, nargs='+', default=[10, 25, 50, 100])
+    parser.add_argument('--entries', type=int, default=5, help='Entrées par flux')
+    parser.add_argument('--latency-ms', type=float, default=100)
+    parser.add_argument('--hosts', type=int, default=50, help='Nombre de hosts simulés (alias 127.0.0.x)')
+    parser.add_argument('--json', help='Fichier de sortie JSON')
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level='ERROR')
+
+    engines = ['threads']
+    if async_fetcher.is_available():
+        engines.append('async')
+    else:
+        print('aiohttp not installed: benchmarking the threaded engine only')
+
+    server = FixtureServer(
+        FixtureConfig(entries_per_feed=args.entries, latency_ms=args.latency_ms),
+        hosts=args.hosts
+    ).start()
+    results = []
+
+    # L'enrichissement à threads ouvre la base par défaut (data/) : travailler dans un dossier temporaire
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.makedirs(os.path.join(workdir, 'data'))
+        os.chdir(workdir)
+        try:
+            print(f"{'engine':<8} {'sources':>7} {'articles':>8} {'collect s':>10} {'enrich s':>9} {'total s':>8}")
+            for count in args.sources:
+                for engine in engines:
+                    result = run_engine(engine, server.sources(count), workdir)
+                    results.append(result)
+                    print(f"{result['engine']:<8} {result['sources']:>7} {result['articles']:>8} "
+                          f"{result['collect_seconds']:>10.2f} {result['enrich_seconds']:>9.2f} {result['total_seconds']:>8.2f}")
+        finally:
+            os.chdir(cwd)
+            server.stop()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'latency_ms': args.latency_ms, 'hosts': args.hosts, 'results': results}, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark des écritures SQLite concurrentes : cache du contenu enrichi écrit par les threads
+d'enrichissement (lecture du cache, extraction, sauvegarde, comme _enrich_single_article)
+pendant que d'autres threads lisent (scheduler, requêtes de l'API).
+
+Compare la configuration SQLite par défaut (journal rollback, sans busy_timeout) au profil
+de DATABASE_CONFIG (WAL, busy_timeout, synchronous=NORMAL, mmap, cache), puis ce même profil avec
+les sauvegardes déposées dans la file d'écriture différée (un seul thread écrivain, par lots).
+Les écritures perdues sont celles absentes de la base à la fin ("database is locked" avalé par
+la sauvegarde du cache) ; la latence est celle vue par le thread d'enrichissement.
+
+Usage : python -m benchmarks.bench_sqlite_concurrency --writers 24 --readers 4 --ops 100
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict
+
+from loguru import logger
+
+from src.cache_writer import CacheWriteQueue
+from src.database import DatabaseManager, EnrichedContentCache, sqlite_pragmas
+from src.sources_config import SCRAPING_CONFIG
+
+
+def run_profile(name: str, pragmas: Dict, workdir: str, writers: int, readers: int, ops: int,
+                payload: str, work_ms: float, write_behind: bool = False) -> Dict:
+    """Écritures et lectures simultanées sur une base neuve avec les pragmas donnés"""
+    db = DatabaseManager(os.path.join(workdir, f'{name}.db'), pragmas=pragmas)
+    cache_writer = CacheWriteQueue(db, enabled=write_behind)
+    latencies = []
+    errors = [0]
+    reads = [0]
+    lock = threading.Lock()
+    writers_done = threading.Event()
+
+    def write(worker: int) -> None:
+        for index in range(ops):
+            url = f'https://example.com/{worker}/{index}'
+            try:
+                start = time.perf_counter()
+                if db.get_enriched_content_from_cache(url) is None:
+                    # Téléchargement et extraction simulés, hors verrou
+                    time.sleep(work_ms / 1000)
+                    cache_writer.put({'url': url, 'content': payload, 'extraction_quality': 'full', 'cache_hours': 48})
+                with lock:
+                    latencies.append(time.perf_counter() - start - work_ms / 1000)
+            except Exception:
+                with lock:
+                    errors[0] += 1
+            finally:
+                db.close()
+
+    def read() -> None:
+        rng = random.Random()
+        while not writers_done.is_set():
+            try:
+                db.get_enriched_content_from_cache(f'https://example.com/{rng.randrange(writers)}/{rng.randrange(ops)}')
+                db.get_cache_stats()
+                with lock:
+                    reads[0] += 1
+            except Exception:
+                with lock:
+                    errors[0] += 1
+            finally:
+                db.close()
+
+    reader_threads = [threading.Thread(target=read) for _ in range(readers)]
+    writer_threads = [threading.Thread(target=write, args=(worker,)) for worker in range(writers)]
+    start = time.perf_counter()
+    for thread in reader_threads + writer_threads:
+        thread.start()
+    for thread in writer_threads:
+        thread.join()
+    cache_writer.close()
+    duration = time.perf_counter() - start
+    writers_done.set()
+    for thread in reader_threads:
+        thread.join()
+
+    stored = db.session.query(EnrichedContentCache).count()
+    db.close()
+    expected = writers * ops
+    return {
+        'name': name,
+        'duration': duration,
+        'writes_per_second': stored / duration,
+        'reads_per_second': reads[0] / duration,
+        'lost': expected - stored,
+        'errors': errors[0],
+        'p50_ms': statistics.median(latencies) * 1000 if latencies else 0.0,
+        'p95_ms': statistics.quantiles(latencies, n=20)[-1] * 1000 if len(latencies) >= 20 else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--writers', type=int, default=SCRAPING_CONFIG['io_max_workers'],
+                        help="Threads d'enrichissement (défaut : SCRAPER_IO_MAX_WORKERS)")
+    parser.add_argument('--readers', type=int, default=4, help='Threads lecteurs (scheduler, API)')
+    parser.add_argument('--ops', type=int, default=100, help='Articles par thread écrivain')
+    parser.add_argument('--payload-kb', type=int, default=15, help='Taille du contenu enregistré')
+    parser.add_argument('--work-ms', type=float, default=2, help="Durée simulée de l'extraction entre lecture et écriture")
+    args = parser.parse_args()
+
+    logger.remove()
+    # Les échecs de sauvegarde sont comptés, pas affichés
+    logger.add(sys.stderr, level='CRITICAL')
+
+    payload = ('Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 20)[:1024] * args.payload_kb
+    profiles = {'default': ({}, False), 'tuned': (sqlite_pragmas(), False), 'queued': (sqlite_pragmas(), True)}
+
+    print(f"{args.writers} writers x {args.ops} articles ({args.payload_kb} KiB), {args.readers} readers")
+    print(f"  {'profile':<8} {'duration':>9} {'writes/s':>9} {'reads/s':>9} {'lost':>6} {'errors':>7} {'p50 ms':>7} {'p95 ms':>7}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, (pragmas, write_behind) in profiles.items():
+            result = run_profile(name, pragmas, workdir, args.writers, args.readers, args.ops, payload, args.work_ms,
+                                 write_behind)
+            print(f"  {result['name']:<8} {result['duration']:>8.2f}s {result['writes_per_second']:>9.0f} "
+                  f"{result['reads_per_second']:>9.0f} {result['lost']:>6} {result['errors']:>7} "
+                  f"{result['p50_ms']:>7.1f} {result['p95_ms']:>7.1f}")
+    print(f"  tuned pragmas: {', '.join(f'{key}={value}' for key, value in profiles['tuned'][0].items())}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark du nettoyage de texte : anciennes fonctions (une re.sub par motif) contre src/text_cleaner
+Mesure le temps par texte et compare la sortie à l'ancienne. Seule différence attendue : après
+"mailto:a@b.com", l'ancien enchaînement retirait d'abord "b.com " puis "mailto:a@<mot suivant>",
+supprimant un mot du texte ; le motif fusionné retire l'adresse seule. Un texte de ~15 Ko contient
+presque toujours une adresse mailto du bruit : la sortie est donc aussi comparée sur les mêmes textes
+sans cette adresse, où elle doit être identique.
+
+Usage : python -m benchmarks.bench_text_cleaning --texts 200 --repeat 5
+"""
+
+import argparse
+import random
+import re
+import sys
+import timeit
+
+from benchmarks.fixture_server import WORDS
+from src.text_cleaner import clean_article_text, clean_summary
+
+# Implémentations d'origine (EnhancedFullstackScraper), gardées comme référence
+
+
+def legacy_advanced_text_cleaning(text: str) -> str:
+    """Nettoyage avancé du texte extrait"""
+    if not text:
+        return ""
+
+    # Supprimer les patterns de navigation et UI
+    patterns_to_remove = [
+        r'Skip to main content',
+        r'Navigation|Menu|Search|Login|Sign up',
+        r'Subscribe|Newsletter|Follow us',
+        r'This website uses cookies',
+        r'Privacy policy|Terms of service',
+        r'Share on|Tweet|Facebook|LinkedIn',
+        r'Advertisement|Sponsored|Promotion',
+        r'[Aa]ds?\s*by',
+    ]
+
+    for pattern in patterns_to_remove:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+
+    # Supprimer toutes les URLs
+    # Pattern pour matcher différents types d'URLs
+    url_patterns = [
+        r'https?://[^\s<>"{}|\\^`\[\]]+',  # URLs HTTP/HTTPS
+        r'www\.[^\s<>"{}|\\^`\[\]]+',      # URLs commençant par www.
+        r'[a-zA-Z0-9][a-zA-Z0-9-]*\.(?:com|org|net|edu|gov|mil|int|co|io|dev|app|ai|ml|xyz|tech|info|biz|name|pro|aero|museum|coop|travel|jobs|mobi|cat|tel|asia|post|test|bitnet|csnet|arpa|nato|example|invalid|localhost|localdomain|onion|local|internal|private|corp|home|host|lan|wan|web|root|mail|users|admin|oracle|ibm|apple|sony|nasa|mit|stanford|oxford|cambridge|harvard|yale|princeton|berkeley|ucla|nyu|columbia|cornell|duke|rice|cmu|gatech|purdue|umich|unc|uw|ut|osu|psu|umd|rutgers|indiana|uiuc|wisc|iowa|msu|umn|missouri|arizona|colorado|oregon|washington|nevada|utah|idaho|montana|wyoming|alaska|hawaii|maine|vermont|newhampshire|massachusetts|rhodeisland|connecticut|newyork|newjersey|pennsylvania|delaware|maryland|virginia|westvirginia|northcarolina|southcarolina|georgia|florida|alabama|mississippi|tennessee|kentucky|ohio|michigan|indiana|illinois|wisconsin|minnesota|iowa|missouri|arkansas|louisiana|texas|oklahoma|kansas|nebraska|southdakota|northdakota|colorado|newmexico|arizona|utah|nevada|idaho|montana|wyoming|california|oregon|washington|alaska|hawaii)(?:[/\s,.:;!?)}\]"]|$)',  # Domaines isolés
+        r'(?:ftp|ftps|ssh|telnet|gopher|file|mailto|news|nntp|prospero|aim|webcal|xmpp|tel|sms|bitcoin|geo|magnet|urn|spotify|lastfm|skype|facetime|callto|discord|slack|zoom|teams|meet):[^\s<>"{}|\\^`\[\]]+',  # Autres protocoles
+        r'\[link\]|\[url\]|\[Link\]|\[URL\]|\(link\)|\(url\)',  # Marqueurs de liens
+        r'<a\s+[^>]*>.*?</a>',  # Balises HTML de liens qui pourraient rester
+    ]
+
+    for pattern in url_patterns:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+
+    # Normaliser les espaces après suppression des URLs
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\n+', '\n', text)
+
+    # Supprimer les caractères de contrôle
+    text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+
+    # Nettoyer les espaces multiples qui pourraient rester après suppression d'URLs
+    text = re.sub(r' {2,}', ' ', text)
+    text = re.sub(r'^\s+|\s+$', '', text, flags=re.MULTILINE)
+
+    return text.strip()
+
+
+def legacy_remove_html_tags(text: str) -> str:
+    """Supprime les balises HTML"""
+    if not text:
+        return ""
+
+    # Supprimer les balises HTML
+    text = re.sub(r'<[^>]+>', '', text)
+    # Décoder les entités HTML courantes
+    text = text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
+    text = text.replace('&quot;', '"').replace('&#39;', "'").replace('&nbsp;', ' ')
+
+    return text
+
+def legacy_clean_text(text: str) -> str:
+    """Nettoie le texte"""
+    if not text:
+        return ""
+
+    # Supprimer les caractères de contrôle
+    text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
+    # Normaliser les espaces
+    text = re.sub(r'\s+', ' ', text)
+    # Supprimer les séparateurs répétitifs
+    text = re.sub(r'[-=_*]{4,}', '', text)
+
+    return text.strip()
+
+
+MAILTO = 'mailto:team@example.com'
+NOISE = (
+    'Menu', 'Subscribe to our Newsletter', 'Share on Twitter', 'https://example.com/path?q=1',
+    'www.example.org/page', 'docs.python.org', 'see example.io,', '[link]',
+    MAILTO,  # Seule source de différence avec l'ancien nettoyage (voir docstring)
+    'Advertisement', 'ads by Google', '\x07', '\t\t', '\n\n'
+)
+
+
+def build_texts(count: int, seed: int = 42):
+    """Textes d'articles (~15 Ko) et résumés HTML de flux avec du bruit réaliste"""
+    rng = random.Random(seed)
+    articles, summaries = [], []
+    for _ in range(count):
+        words = []
+        while sum(len(word) + 1 for word in words) < 15000:
+            words.append(rng.choice(NOISE) if rng.random() < 0.03 else rng.choice(WORDS))
+        articles.append(' '.join(words))
+        summaries.append(
+            '<p>' + ' '.join(rng.choice(WORDS) for _ in range(60)) + ' &amp; more&nbsp;<b>news</b></p>'
+            '<hr>-----<br/>\x0b' + ' '.join(rng.choice(WORDS) for _ in range(40))
+        )
+    return articles, summaries
+
+
+def bench(label: str, func, texts, repeat: int) -> float:
+    seconds = min(timeit.repeat(lambda: [func(text) for text in texts], number=1, repeat=repeat))
+    print(f"  {label:<26} {seconds * 1000 / len(texts):8.3f} ms/text")
+    return seconds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--texts', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    articles, summaries = build_texts(args.texts)
+
+    print(f"Article text ({args.texts} x ~15 KB)")
+    old = bench('legacy _advanced_text_cleaning', legacy_advanced_text_cleaning, articles, args.repeat)
+    new = bench('clean_article_text', clean_article_text, articles, args.repeat)
+    print(f"  speedup {old / new:.1f}x")
+    same = sum(legacy_advanced_text_cleaning(text) == clean_article_text(text) for text in articles)
+    print(f"  identical output: {same}/{len(articles)}")
+    without_mailto = [text.replace(MAILTO, '') for text in articles]
+    same = sum(legacy_advanced_text_cleaning(text) == clean_article_text(text) for text in without_mailto)
+    print(f"  identical output without {MAILTO}: {same}/{len(articles)}")
+
+    print(f"Feed summaries ({args.texts})")
+    old = bench('legacy remove_html + clean', lambda text: legacy_clean_text(legacy_remove_html_tags(text)),
+                summaries, args.repeat)
+    new = bench('clean_summary', clean_summary, summaries, args.repeat)
+    print(f"  speedup {old / new:.1f}x")
+    same = sum(legacy_clean_text(legacy_remove_html_tags(text)) == clean_summary(text) for text in summaries)
+    print(f"  identical output: {same}/{len(summaries)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Serveur HTTP local simulant des flux RSS et des pages d'articles pour les benchmarks
+Aucun accès réseau : les flux /feed/<n>.xml et les pages /article/<n>/<m> sont générés
+"""
+
+import multiprocessing
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+WORDS = (
+    "python performance architecture implementation database server client cache "
+    "async framework library algorithm deploy scale security pattern interface "
+    "refactor testing kubernetes container frontend backend react typescript"
+).split()
+
+
+class FixtureConfig:
+    """Paramètres du corpus généré"""
+
+    def __init__(self, entries_per_feed: int = 10, latency_ms: float = 50,
+                 error_rate: float = 0.0, page_paragraphs: int = 40, seed: int = 42):
+        self.entries_per_feed = entries_per_feed
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.page_paragraphs = page_paragraphs
+        self.seed = seed
+        # Dates des flux fixées au démarrage : un flux relu est identique, comme un vrai flux entre deux publications
+        self.epoch = time.time()
+
+
+def _sentence(rng: random.Random, words: int = 14) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def build_feed(feed_id: int, base_url: str, config: FixtureConfig) -> bytes:
+    """Flux RSS 2.0 déterministe pour un identifiant de flux"""
+    rng = random.Random(config.seed * 7919 + feed_id)
+    now = config.epoch
+    items = []
+    for entry_id in range(config.entries_per_feed):
+        published = formatdate(now - (entry_id + 1) * 3600 * (feed_id % 5 + 1), usegmt=True)
+        title = f"Feed {feed_id} {' '.join(rng.sample(WORDS, 6))} {entry_id}"
+        items.append(
+            "<item>"
+            f"<title>{title}</title>"
+            f"<link>{base_url}/article/{feed_id}/{entry_id}</link>"
+            f"<guid>{base_url}/article/{feed_id}/{entry_id}</guid>"
+            f"<pubDate>{published}</pubDate>"
+            f"<description>{' '.join(_sentence(rng) for _ in range(4))}</description>"
+            "<category>python</category>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>Fixture feed {feed_id}</title><link>{base_url}</link>"
+        f"<lastBuildDate>{formatdate(now, usegmt=True)}</lastBuildDate>"
+        + ''.join(items) +
+        "</channel></rss>"
+    ).encode('utf-8')
+
+
+def build_article(feed_id: int, entry_id: int, config: FixtureConfig) -> bytes:
+    """Page HTML d'article avec navigation, scripts et contenu principal"""
+    rng = random.Random(config.seed * 104729 + feed_id * 1000 + entry_id)
+    paragraphs = ''.join(
+        f"<p>{' '.join(_sentence(rng) for _ in range(3))} See https://example.com/{entry_id} for details.</p>"
+        for _ in range(config.page_paragraphs)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Article</title>"
+        "<script>window.tracking = {id: 1};</script><style>body{margin:0}</style></head>"
+        "<body><header><nav><a href='/'>Home</a> Menu Search Login</nav></header>"
+        f"<main><article><h1>Article {feed_id}/{entry_id}</h1>{paragraphs}</article></main>"
+        "<aside>Subscribe to our newsletter</aside><footer>Privacy policy</footer></body></html>"
+    ).encode('utf-8')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.fixture_handle(self)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def _serve(config: 'FixtureConfig', host: str, counters, port_queue) -> None:
+    """Point d'entrée du processus serveur"""
+    rng = random.Random(config.seed)
+    lock = threading.Lock()
+    server = _Server((host, 0), _Handler)
+    port = server.server_address[1]
+
+    def handle(handler: BaseHTTPRequestHandler) -> None:
+        if config.latency_ms:
+            time.sleep(config.latency_ms / 1000)
+
+        request_host = (handler.headers.get('Host') or f'127.0.0.1:{port}')
+        base_url = f"http://{request_host}"
+        parts = handler.path.strip('/').split('/')
+        with lock:
+            fail = config.error_rate and rng.random() < config.error_rate
+
+        if fail:
+            with counters.get_lock():
+                counters[2] += 1
+            handler.send_error(503)
+            return
+
+        if parts[0] == 'feed' and len(parts) == 2:
+            with counters.get_lock():
+                counters[0] += 1
+            body = build_feed(int(parts[1].split('.')[0]), base_url, config)
+            content_type = 'application/rss+xml; charset=utf-8'
+        elif parts[0] == 'article' and len(parts) == 3:
+            with counters.get_lock():
+                counters[1] += 1
+            body = build_article(int(parts[1]), int(parts[2]), config)
+            content_type = 'text/html; charset=utf-8'
+        else:
+            handler.send_error(404)
+            return
+
+        handler.send_response(200)
+        handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    server.fixture_handle = handle
+    port_queue.put(port)
+    server.serve_forever()
+
+
+class FixtureServer:
+    """
+    Serveur local servant le corpus dans un processus séparé (pas de contention GIL avec le scraper).
+    Avec `hosts` > 1, les flux sont répartis sur les alias loopback 127.0.0.x pour simuler plusieurs hosts.
+    """
+
+    def __init__(self, config: FixtureConfig = None, hosts: int = 1):
+        self.config = config or FixtureConfig()
+        self.hosts = max(1, min(hosts, 250))
+        self.port = None
+        self._context = multiprocessing.get_context('spawn')
+        self._counters = self._context.Array('l', 3)
+        self._process = None
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            'feed_requests': self._counters[0],
+            'article_requests': self._counters[1],
+            'errors': self._counters[2],
+        }
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def feed_url(self, feed_id: int) -> str:
+        host = f"127.0.0.{1 + feed_id % self.hosts}"
+        return f"http://{host}:{self.port}/feed/{feed_id}.xml"
+
+    def sources(self, feed_count: int, weight: int = 7) -> List[Dict]:
+        """Configurations de sources au format de SPECIALIZED_SOURCES"""
+        return [
+            {'url': self.feed_url(feed_id), 'weight': weight, 'type': 'blog', 'focus': 'benchmark'}
+            for feed_id in range(feed_count)
+        ]
+
+    def start(self) -> 'FixtureServer':
+        port_queue = self._context.Queue()
+        # Écoute sur toutes les adresses loopback si plusieurs hosts sont simulés
+        bind_host = '0.0.0.0' if self.hosts > 1 else '127.0.0.1'
+        self._process = self._context.Process(
+            target=_serve,
+            args=(self.config, bind_host, self._counters, port_queue),
+            daemon=True
+        )
+        self._process.start()
+        self.port = port_queue.get(timeout=30)
+        return self
+
+    def stop(self) -> None:
+        if self._process:
+            self._process.terminate()
+            self._process.join(timeout=5)
@@ -1,15 +1,23 @@
 #!/usr/bin/env python3
+"""
+Point d'entrée de l'application (scheduler et API)
+Le module doit rester importable sans effet de bord : les processus de parsing du scraper démarrent
+en 'spawn' et réimportent __main__. Imports de l'application, logs et .env sont donc dans main().
+"""
 
 import sys
-from dotenv import load_dotenv
-from loguru import logger
-from src.scheduler import PostScheduler
-
-load_dotenv()
-
-logger.add("logs/app.log", rotation="1 week", retention="1 month")
 
 def main():
+    from dotenv import load_dotenv
+    from loguru import logger
+    
+    # Avant l'import de l'application : la configuration est lue à l'import
+    load_dotenv()
+    
+    logger.add("logs/app.log", rotation="1 week", retention="1 month")
+    
+    from src.scheduler import PostScheduler
+    
     logger.info("Starting LinkedIn Auto Publisher")
     
     scheduler = PostScheduler()
@@ -24,4 +32,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -6,6 +6,9 @@ from src.linkedin_publisher import LinkedInPublisher
 from src.enhanced_scraper import EnhancedFullstackScraper
 from src.specialized_generator import SpecializedPostGenerator
 from src.websocket_service import websocket_service, generate_session_id
+from src.host_health import get_circuit_breaker
+from src.run_budget import RunDeadline
+from src.sources_config import SCRAPING_CONFIG
 from loguru import logger
 import os
 from datetime import datetime
@@ -83,6 +86,11 @@ db = DatabaseManager()
 scraper = None
 generator = None
 
+@app.teardown_appcontext
+def release_db_session(exception=None):
+    """Chaque requête a sa propre session de base, rendue au pool en fin de requête"""
+    db.close()
+
 def get_scraper():
     global scraper
     if scraper is None:
@@ -211,7 +219,8 @@ class ScrapeDomain(Resource):
         'articles': fields.List(fields.Nested(article_model)),
         'total_count': fields.Integer(),
         'domain': fields.String(),
-        'from_cache': fields.Boolean()
+        'from_cache': fields.Boolean(),
+        'partial': fields.Boolean(description="Échéance du run atteinte : seuls les articles déjà traités sont retournés")
     }))
     def post(self, domain):
         """Lance le scraping pour un domaine spécifique avec WebSocket"""
@@ -236,13 +245,20 @@ class ScrapeDomain(Resource):
             
             scraper = get_scraper()
             
-            # Passer la session WebSocket au scraper
-            scraper.set_websocket_session(session_id, websocket_service)
-            
-            if domain == 'all':
-                articles = scraper.scrape_all_sources(max_articles=max_articles, use_cache=not force_refresh)
-            else:
-                articles = scraper.scrape_domain_sources(domain, max_articles=max_articles, use_cache=not force_refresh)
+            # Scraper partagé : une requête concurrente attend la fin du run en cours
+            # (session WebSocket et statistiques du run restent celles de cette requête)
+            with scraper.run_lock:
+                # Passer la session WebSocket au scraper
+                scraper.set_websocket_session(session_id, websocket_service)
+                
+                # Un refresh forcé relit aussi les flux qui ne sont pas encore dus
+                if domain == 'all':
+                    articles = scraper.scrape_all_sources(max_articles=max_articles, use_cache=not force_refresh,
+                                                          force_poll=force_refresh)
+                else:
+                    articles = scraper.scrape_domain_sources(domain, max_articles=max_articles, use_cache=not force_refresh,
+                                                             force_poll=force_refresh)
+                partial = bool(scraper.last_run_stats.get('partial'))
             
             articles = sorted(articles, key=lambda x: x.get('relevance_score', 0), reverse=True)
             
@@ -252,7 +268,8 @@ class ScrapeDomain(Resource):
             results = {
                 'total_articles': len(articles),
                 'domain': domain,
-                'from_cache': not force_refresh
+                'from_cache': not force_refresh,
+                'partial': partial
             }
             websocket_service.complete_scraping_session(session_id, results)
             
@@ -262,7 +279,8 @@ class ScrapeDomain(Resource):
                 'articles': articles[:30],  # Limiter davantage pour l'interface
                 'total_count': len(articles),
                 'domain': domain,
-                'from_cache': not force_refresh
+                'from_cache': not force_refresh,
+                'partial': partial
             }
             
         except Exception as e:
@@ -274,6 +292,51 @@ class ScrapeDomain(Resource):
                 })
             return {'success': False, 'message': str(e)}, 500
 
+@scrape_ns.route('/health')
+class ScrapeHealth(Resource):
+    @scrape_ns.doc('scrape_health')
+    @scrape_ns.marshal_with(api.model('ScrapeHealthResponse', {
+        'circuits': fields.List(fields.Nested(api.model('HostCircuit', {
+            'host': fields.String(description='Host'),
+            'state': fields.String(description='closed, open ou half_open'),
+            'consecutive_failures': fields.Integer(),
+            'total_failures': fields.Integer(),
+            'total_successes': fields.Integer(),
+            'rejected_requests': fields.Integer(description='Requêtes ignorées circuit ouvert'),
+            'retry_in_seconds': fields.Float(description='Délai avant la requête de test'),
+            'last_error': fields.String()
+        }))),
+        'open_circuits': fields.Integer(),
+        'quarantined_feeds': fields.List(fields.Nested(api.model('QuarantinedFeed', {
+            'url': fields.String(),
+            'consecutive_failures': fields.Integer(description='Runs consécutifs en échec'),
+            'last_error': fields.String(),
+            'last_failure_at': fields.String(),
+            'quarantined_until': fields.String()
+        })))
+    }))
+    def get(self):
+        """État des circuit breakers par host et des flux en quarantaine"""
+        circuits = get_circuit_breaker().get_states()
+        now = datetime.now()
+        quarantined = [
+            {
+                'url': url,
+                'consecutive_failures': health['consecutive_failures'],
+                'last_error': health['last_error'],
+                'last_failure_at': health['last_failure_at'].isoformat() if health['last_failure_at'] else None,
+                'quarantined_until': health['quarantined_until'].isoformat()
+            }
+            for url, health in db.get_feed_health().items()
+            if health['quarantined_until'] and health['quarantined_until'] > now
+        ]
+        
+        return {
+            'circuits': circuits,
+            'open_circuits': sum(1 for circuit in circuits if circuit['state'] != 'closed'),
+            'quarantined_feeds': quarantined
+        }
+
 @scrape_ns.route('/generate-from-selection')
 class GenerateFromSelection(Resource):
     @scrape_ns.doc('generate_from_selection')
@@ -287,7 +350,8 @@ class GenerateFromSelection(Resource):
         'session_id': fields.String(),
         'post': fields.Nested(post_model),
         'posts': fields.List(fields.Nested(post_model)),
-        'message': fields.String()
+        'message': fields.String(),
+        'partial': fields.Boolean(description="Échéance atteinte : seuls les posts déjà générés sont retournés")
     }))
     def post(self):
         """Génère un ou plusieurs posts à partir d'articles sélectionnés avec WebSocket"""
@@ -318,9 +382,16 @@ class GenerateFromSelection(Resource):
             generator = get_generator()
             
             generated_posts = []
+            deadline = RunDeadline(SCRAPING_CONFIG['generation_deadline_seconds'])
             
             # Générer le nombre de posts demandé
             for i in range(numberOfPosts):
+                # Le premier post est toujours tenté ; ensuite, pas de nouvel appel LLM après l'échéance
+                if generated_posts and deadline.expired():
+                    deadline.record_abandoned('posts', numberOfPosts - i)
+                    logger.warning(f"Generation deadline reached after {i}/{numberOfPosts} posts")
+                    break
+                
                 logger.info(f"Generating post {i+1}/{numberOfPosts}")
                 
                 # Émettre le progrès de début pour ce post
@@ -371,7 +442,8 @@ class GenerateFromSelection(Resource):
                 'posts': generated_posts,
                 'domain': domain,
                 'articles_count': len(articles),
-                'posts_count': len(generated_posts)
+                'posts_count': len(generated_posts),
+                'partial': deadline.partial
             }
             websocket_service.complete_generation_session(session_id, results)
             
@@ -389,6 +461,8 @@ class GenerateFromSelection(Resource):
                     'session_id': session_id,
                     'posts': generated_posts,
                     'message': f'{len(generated_posts)} posts generated successfully'
+                               + (f' ({numberOfPosts - len(generated_posts)} skipped: deadline reached)' if deadline.partial else ''),
+                    'partial': deadline.partial
                 }
                 
         except Exception as e:
@@ -445,6 +519,7 @@ def api_info():
         'endpoints': {
             'posts': '/api/posts/',
             'scraping': '/api/scrape/',
+            'scraping_health': '/api/scrape/health',
             'domains': '/api/domains'
         }
     }
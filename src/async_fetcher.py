@@ -0,0 +1,245 @@
+"""
+Moteur de fetch asyncio pour la collecte des flux et l'enrichissement des articles
+Alternative au ThreadPoolExecutor : des centaines de requêtes en vol, bornées par host et globalement
+"""
+
+import asyncio
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from requests.structures import CaseInsensitiveDict
+from loguru import logger
+
+from .host_health import CircuitBreaker, CircuitOpenError, get_circuit_breaker
+from .http_archive import HttpArchive, get_http_archive
+from .http_client import READ_CHUNK_BYTES, ContentRejectedError, check_content_headers
+
+try:
+    import aiohttp
+except ImportError:  # Dépendance optionnelle, uniquement pour le moteur asyncio
+    aiohttp = None
+
+
+@dataclass
+class FetchRequest:
+    """Requête à exécuter par le moteur"""
+    url: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    timeout: float = 10
+    context: Any = None  # Donnée de l'appelant (config de source, article...)
+    max_bytes: Optional[int] = None  # Plafond de lecture du corps
+    accept_types: Optional[Tuple[str, ...]] = None  # Content-Types acceptés
+
+
+@dataclass
+class FetchResult:
+    """Réponse brute d'une requête"""
+    request: FetchRequest
+    status: int = 0
+    body: bytes = b''
+    headers: CaseInsensitiveDict = field(default_factory=CaseInsensitiveDict)
+    error: Optional[str] = None
+    rejected: Optional[str] = None  # Raison du rejet d'après les headers ('content_type', 'too_large')
+    truncated: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.rejected is None and (200 <= self.status < 400)
+
+
+def is_available() -> bool:
+    """Indique si le moteur asyncio peut être utilisé"""
+    return aiohttp is not None
+
+
+class AsyncFetchEngine:
+    """Exécute des lots de requêtes avec des sémaphores global et par host"""
+
+    def __init__(self, max_in_flight: int = 200, per_host_limit: int = 8,
+                 max_retries: int = 2, retry_delay: float = 1.0, circuit_breaker: CircuitBreaker = None,
+                 archive: HttpArchive = None):
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for the asyncio fetch engine")
+
+        self.max_in_flight = max_in_flight
+        self.per_host_limit = per_host_limit
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker()
+        self.archive = archive or get_http_archive()
+        # Requêtes abandonnées à l'échéance lors du dernier run()
+        self.abandoned: List[FetchRequest] = []
+
+    def run(self, requests: List[FetchRequest],
+            process: Callable[[FetchResult], Any] = None,
+            on_done: Callable[[FetchResult, Any], None] = None,
+            timeout: Optional[float] = None) -> List[Any]:
+        """
+        Exécute toutes les requêtes et retourne les résultats dans l'ordre des requêtes.
+        `process` (CPU : parsing, extraction) est exécuté dans le pool de threads de la boucle
+        dès qu'une réponse arrive, `on_done` est appelé à la fin de chaque requête.
+        Après `timeout` secondes, les requêtes en cours sont annulées et leur résultat est None.
+        """
+        self.abandoned = []
+        if not requests:
+            return []
+        return asyncio.run(self._run(requests, process, on_done, timeout))
+
+    async def _run(self, requests: List[FetchRequest], process, on_done, timeout: Optional[float] = None) -> List[Any]:
+        global_semaphore = asyncio.Semaphore(self.max_in_flight)
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        connector = aiohttp.TCPConnector(
+            limit=self.max_in_flight,
+            limit_per_host=self.per_host_limit,
+            ttl_dns_cache=300
+        )
+        loop = asyncio.get_running_loop()
+
+        async with aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar()) as session:
+            async def handle(request: FetchRequest) -> Any:
+                host = urlparse(request.url).netloc
+                host_semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+
+                result = await self._fetch_with_retry(session, request, global_semaphore, host_semaphore)
+
+                output = result
+                if process is not None:
+                    try:
+                        output = await loop.run_in_executor(None, process, result)
+                    except Exception as e:
+                        logger.debug(f"Error processing {request.url}: {e}")
+                        output = None
+
+                if on_done is not None:
+                    try:
+                        on_done(result, output)
+                    except Exception as e:
+                        logger.debug(f"Error in fetch callback for {request.url}: {e}")
+
+                return output
+
+            tasks = [asyncio.ensure_future(handle(request)) for request in requests]
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                self.abandoned = [request for request, task in zip(requests, tasks) if task in pending]
+            return [None if task.cancelled() or task.exception() else task.result() for task in tasks]
+
+    async def _fetch_with_retry(self, session, request: FetchRequest,
+                                global_semaphore: asyncio.Semaphore,
+                                host_semaphore: asyncio.Semaphore) -> FetchResult:
+        result = FetchResult(request=request)
+
+        for attempt in range(self.max_retries):
+            # Host connu comme défaillant : abandon immédiat, sans retry
+            try:
+                self.circuit_breaker.before_request(request.url)
+            except CircuitOpenError as e:
+                return FetchResult(request=request, error=str(e))
+
+            # L'attente entre deux tentatives ne doit pas occuper de slot
+            try:
+                async with global_semaphore, host_semaphore:
+                    result = await self._fetch_once(session, request)
+            except BaseException:
+                # Annulation à l'échéance (CancelledError n'est pas une Exception) : sans cela,
+                # un circuit semi-ouvert garderait sa requête de test pour toute la vie du processus
+                self.circuit_breaker.release_probe(request.url)
+                raise
+
+            if result.error is not None:
+                self.circuit_breaker.record_failure(request.url, result.error)
+            elif result.status >= 500 or result.status == 429:
+                self.circuit_breaker.record_failure(request.url, f"HTTP {result.status}")
+            else:
+                self.circuit_breaker.record_success(request.url)
+
+            if result.error is None and result.status < 400:
+                return result
+
+            if attempt < self.max_retries - 1:
+                logger.warning(f"Attempt {attempt + 1} failed for {request.url}: {result.error or result.status}")
+                await asyncio.sleep(self.retry_delay)
+
+        return result
+
+    async def _fetch_once(self, session, request: FetchRequest) -> FetchResult:
+        if self.archive is not None and self.archive.replaying:
+            return await self._replay_once(request)
+        if self.archive is not None:
+            # Corps enregistré complet (sans plafond ni filtrage par Content-Type, comme le client à threads) :
+            # plafond et filtrage sont appliqués ensuite, comme au rejeu
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            result = await self._fetch_from_network(session, replace(request, max_bytes=None, accept_types=None))
+            elapsed = loop.time() - start
+            self.archive.record(request.url, result.status, result.headers, result.body, elapsed, result.error)
+            if result.error:
+                return FetchResult(request=request, error=result.error)
+            return self._bounded_result(request, result.status, result.headers, result.body)
+        return await self._fetch_from_network(session, request)
+
+    async def _replay_once(self, request: FetchRequest) -> FetchResult:
+        """Réponse servie depuis l'archive HTTP après la latence simulée du host"""
+        archived = self.archive.next_response(request.url)
+        if archived is None:
+            return FetchResult(request=request, error=f"ClientConnectorError: URL not in HTTP archive: {request.url}")
+
+        delay = self.archive.simulated_latency(archived)
+        if request.timeout is not None and delay > request.timeout:
+            await asyncio.sleep(request.timeout)
+            return FetchResult(request=request, error=f"TimeoutError: replayed latency {delay:.2f}s exceeds timeout")
+        await asyncio.sleep(delay)
+
+        if archived.error:
+            return FetchResult(request=request, error=archived.error)
+        return self._bounded_result(request, archived.status, CaseInsensitiveDict(archived.headers), archived.body)
+
+    @staticmethod
+    def _bounded_result(request: FetchRequest, status: int, headers, body: bytes) -> FetchResult:
+        """Réponse complète (archivée) ramenée à ce qu'une lecture réseau aurait retourné : filtrage et plafond"""
+        if status < 400:
+            try:
+                check_content_headers(headers, request.accept_types, request.max_bytes)
+            except ContentRejectedError as e:
+                return FetchResult(request=request, status=status, headers=headers, rejected=e.reason)
+
+        truncated = False
+        if request.max_bytes and len(body) >= request.max_bytes:
+            body, truncated = body[:request.max_bytes], True
+        return FetchResult(request=request, status=status, body=body, headers=headers, truncated=truncated)
+
+    async def _fetch_from_network(self, session, request: FetchRequest) -> FetchResult:
+        try:
+            timeout = aiohttp.ClientTimeout(total=request.timeout)
+            async with session.get(request.url, headers=request.headers, timeout=timeout) as response:
+                headers = CaseInsensitiveDict(response.headers)
+                if response.status < 400:
+                    try:
+                        check_content_headers(headers, request.accept_types, request.max_bytes)
+                    except ContentRejectedError as e:
+                        # Le host a répondu : pas une erreur (ni retry, ni échec pour le circuit)
+                        return FetchResult(request=request, status=response.status, headers=headers, rejected=e.reason)
+
+                body = bytearray()
+                truncated = False
+                async for chunk in response.content.iter_chunked(READ_CHUNK_BYTES):
+                    body.extend(chunk)
+                    if request.max_bytes and len(body) >= request.max_bytes:
+                        # Abandon de la lecture : la connexion est fermée en sortie de contexte
+                        del body[request.max_bytes:]
+                        truncated = True
+                        break
+
+                return FetchResult(
+                    request=request,
+                    status=response.status,
+                    body=bytes(body),
+                    headers=headers,
+                    truncated=truncated
+                )
+        except Exception as e:
+            return FetchResult(request=request, error=f"{type(e).__name__}: {e}")
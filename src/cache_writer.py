@@ -0,0 +1,137 @@
+"""
+Écriture différée du cache de contenu enrichi
+Les threads d'enrichissement déposent leurs sauvegardes dans une file sans attendre la base ; un thread
+écrivain unique les regroupe et les écrit en un upsert par lot (toutes les N lignes ou après T ms).
+SQLite n'a ainsi qu'un seul écrivain pour ce cache au lieu d'un par thread d'enrichissement.
+flush() attend l'écriture de tout ce qui a été déposé (fin de run), close() vide la file et arrête
+le thread (appelé aussi à la sortie du processus).
+"""
+
+import atexit
+import queue
+import threading
+import time
+from typing import Dict, List, Optional
+from loguru import logger
+
+from .sources_config import DATABASE_CONFIG
+
+# Marqueur d'arrêt du thread écrivain
+_STOP = object()
+
+
+class CacheWriteQueue:
+    """File d'écriture différée des contenus enrichis (entrées : url, content, extraction_quality, cache_hours)"""
+
+    def __init__(self, db, batch_rows: int = None, flush_ms: float = None, enabled: bool = None):
+        self.db = db
+        self.batch_rows = max(1, batch_rows or DATABASE_CONFIG['write_batch_rows'])
+        self.flush_interval = (DATABASE_CONFIG['write_flush_ms'] if flush_ms is None else flush_ms) / 1000
+        self.enabled = DATABASE_CONFIG['write_behind'] if enabled is None else enabled
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {'queued': 0, 'written': 0, 'batches': 0, 'failed': 0}
+
+    def put(self, entry: Dict) -> None:
+        self.put_many([entry])
+
+    def put_many(self, entries: List[Dict]) -> None:
+        """Dépose des sauvegardes sans attendre (écriture directe si la file est désactivée ou fermée)"""
+        if not entries:
+            return
+        if not self.enabled or self._closed:
+            self._write(list(entries))
+            return
+        self._ensure_started()
+        with self._lock:
+            self._stats['queued'] += len(entries)
+        for entry in entries:
+            self._queue.put(entry)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Attend l'écriture de toutes les entrées déposées ; False si le délai est dépassé"""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        if not done.wait(timeout):
+            logger.warning(f"Cache write queue not flushed after {timeout}s ({self._queue.qsize()} entries pending)")
+            return False
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Écrit les entrées en attente et arrête le thread écrivain"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning(f"Cache writer still running after {timeout}s, {self._queue.qsize()} entries pending")
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, pending=self._queue.qsize())
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='cache-writer', daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        batch = []
+        flush_at = None
+        while True:
+            timeout = None if not batch else max(0.0, flush_at - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                # Délai du lot écoulé
+                self._write(batch)
+                batch = []
+                continue
+
+            if item is _STOP:
+                self._write(batch)
+                return
+            if isinstance(item, threading.Event):
+                # Demande de flush : tout ce qui précède dans la file est écrit
+                self._write(batch)
+                batch = []
+                item.set()
+                continue
+
+            if not batch:
+                flush_at = time.monotonic() + self.flush_interval
+            batch.append(item)
+            if len(batch) >= self.batch_rows:
+                self._write(batch)
+                batch = []
+
+    def _write(self, batch: List[Dict]) -> None:
+        if not batch:
+            return
+        try:
+            saved = self.db.save_enriched_contents(batch)
+        except Exception as e:
+            logger.error(f"Error writing enriched content batch: {e}")
+            saved = False
+        finally:
+            # Connexion rendue au pool entre deux lots
+            self.db.close()
+        with self._lock:
+            if saved:
+                self._stats['written'] += len(batch)
+                self._stats['batches'] += 1
+            else:
+                self._stats['failed'] += len(batch)
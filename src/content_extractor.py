@@ -0,0 +1,130 @@
+"""
+Extraction du texte principal des pages d'articles
+Un seul parsing lxml par page : règles XPath par site pour les sources connues, puis conteneurs
+sémantiques (<article>, <main>) ; readability n'est utilisé qu'en dernier recours
+"""
+
+import re
+from typing import Optional, Tuple
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+from readability import Document
+
+# Éléments sans contenu rédactionnel, retirés avant la lecture du texte
+NOISE_TAGS = (
+    'script', 'style', 'noscript', 'template', 'svg', 'nav', 'aside', 'footer', 'header',
+    'form', 'input', 'button', 'select', 'textarea', 'iframe', 'embed', 'object', 'applet',
+    'ads', 'advertisement'
+)
+
+
+class AllMatches(str):
+    """XPath dont toutes les correspondances sont concaténées (corps d'article découpé en plusieurs blocs)"""
+
+
+# Conteneur du corps d'article pour les sources à fort volume (host -> XPath par ordre de préférence)
+SITE_RULES = {
+    'blog.logrocket.com': ("//div[contains(concat(' ', normalize-space(@class), ' '), ' post-content ')]",),
+    'web.dev': ("//div[contains(concat(' ', normalize-space(@class), ' '), ' devsite-article-body ')]",),
+    'thenewstack.io': ("//div[contains(concat(' ', normalize-space(@class), ' '), ' post-content ')]",),
+    'css-tricks.com': ("//div[contains(concat(' ', normalize-space(@class), ' '), ' article-content ')]",),
+    'www.smashingmagazine.com': ("//div[contains(concat(' ', normalize-space(@class), ' '), ' c-garfield-the-cat ')]",),
+    'realpython.com': ("//div[contains(concat(' ', normalize-space(@class), ' '), ' article-body ')]",),
+    'dev.to': ("//div[@id='article-body']",),
+    # Un post Medium est découpé en plusieurs <section> (une par séparateur) : toutes sont gardées
+    'medium.com': (AllMatches('//article//section[not(ancestor::section)]'),),
+}
+
+# Conteneurs sémantiques, essayés pour toutes les pages
+SEMANTIC_XPATHS = ('//article', '//main', "//*[@role='main']")
+
+# En dessous, le conteneur trouvé est jugé incomplet (teaser, liste) : on passe à l'étape suivante
+MIN_TEXT_CHARS = 500
+
+_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+
+def parse_html(html: bytes) -> lxml.html.HtmlElement:
+    """Parse la page une seule fois ; UTF-8 par défaut, sinon l'encodage déclaré par la page"""
+    try:
+        text = html.decode('utf-8')
+    except UnicodeDecodeError:
+        return lxml.html.document_fromstring(html)
+
+    # lxml refuse une chaîne unicode portant une déclaration d'encodage
+    return lxml.html.document_fromstring(_XML_DECLARATION.sub('', text, count=1))
+
+
+def node_text(node) -> str:
+    """Texte d'un élément, morceaux séparés par une espace (équivalent de get_text(' ', strip=True))"""
+    return ' '.join(chunk.strip() for chunk in node.itertext() if chunk.strip())
+
+
+def _site_rules_for(url: str) -> Tuple[str, ...]:
+    host = re.sub(r'^https?://', '', url or '').split('/')[0].split(':')[0].lower()
+    if host in SITE_RULES:
+        return SITE_RULES[host]
+    # Sous-domaines (ex. publication.medium.com)
+    for rule_host, xpaths in SITE_RULES.items():
+        if host.endswith('.' + rule_host):
+            return xpaths
+    return ()
+
+
+def _longest_text(tree, xpaths: Tuple[str, ...]) -> Optional[str]:
+    """Texte du plus long conteneur correspondant (de tous pour AllMatches), s'il est assez fourni"""
+    for xpath in xpaths:
+        texts = [node_text(node) for node in tree.xpath(xpath)]
+        if isinstance(xpath, AllMatches):
+            texts = [' '.join(text for text in texts if text)]
+        best = max(texts, key=len, default='')
+        if len(best) >= MIN_TEXT_CHARS:
+            return best
+    return None
+
+
+def extract_text_readability(html) -> str:
+    """Repli : conteneur principal choisi par readability, texte lu avec lxml"""
+    summary = Document(html).summary(html_partial=True)
+    fragment = lxml.html.fragment_fromstring(summary, create_parent='div')
+    etree.strip_elements(fragment, *NOISE_TAGS, with_tail=False)
+    return node_text(fragment)
+
+
+def extract_main_text(html: bytes, url: str = '') -> Tuple[Optional[str], str]:
+    """
+    Texte principal d'une page HTML brute.
+    Retourne (texte, méthode) avec méthode parmi 'site_rule', 'semantic', 'readability'.
+    """
+    tree = parse_html(html)
+    etree.strip_elements(tree, etree.Comment, *NOISE_TAGS, with_tail=False)
+
+    site_rules = _site_rules_for(url)
+    text = _longest_text(tree, site_rules) if site_rules else None
+    if text:
+        return text, 'site_rule'
+
+    text = _longest_text(tree, SEMANTIC_XPATHS)
+    if text:
+        return text, 'semantic'
+
+    # Page sans conteneur exploitable : readability repart de l'arbre déjà nettoyé
+    # (sérialisé : readability-lxml 0.8 n'accepte pas d'arbre déjà parsé)
+    return extract_text_readability(lxml.html.tostring(tree)) or None, 'readability'
+
+
+def extract_text_legacy(html: bytes) -> str:
+    """
+    Ancien chemin (readability puis BeautifulSoup sur le résumé).
+    Conservé pour SCRAPER_CONTENT_EXTRACTOR=readability et comme référence du benchmark.
+    """
+    soup = BeautifulSoup(Document(html).summary(), 'html.parser')
+    for tag in soup.find_all([
+        'script', 'style', 'nav', 'aside', 'footer', 'header',
+        'form', 'input', 'button', 'select', 'textarea',
+        'iframe', 'embed', 'object', 'applet', 'ads', 'advertisement'
+    ]):
+        tag.decompose()
+    return soup.get_text(separator=' ', strip=True)
@@ -5,10 +5,12 @@ Système de filtrage avancé pour garantir la qualité du contenu
 
 import re
 import hashlib
-from typing import List, Dict, Tuple, Set
-from datetime import datetime, timedelta
+import threading
+from typing import List, Dict, Optional, Tuple, Set
+from datetime import timedelta
 from loguru import logger
 from .sources_config import QUALITY_CONFIG
+from .date_resolver import article_age
 
 class AdvancedContentFilter:
     def __init__(self):
@@ -18,76 +20,136 @@ class AdvancedContentFilter:
         
     def filter_articles(self, articles: List[Dict]) -> Tuple[List[Dict], Dict[str, int]]:
         """Filtre les articles selon des critères de qualité stricts"""
-        filtered = []
-        rejection_reasons = {
-            'duplicate_title': 0,
-            'duplicate_content': 0,
-            'low_quality_title': 0,
-            'promotional': 0,
-            'too_short': 0,
-            'too_long': 0,
-            'too_old': 0,
-            'low_score': 0,
-            'no_content': 0,
-            'spam_indicators': 0
+        state = self.new_filter_state()
+        filtered = [article for article in articles if self.filter_article(article, state) is None]
+        
+        logger.info(f"Filtering results: {len(filtered)}/{len(articles)} articles kept. Rejections: {state['rejections']}")
+        
+        return filtered, state['rejections']
+    
+    def new_filter_state(self, shared_claims: Dict = None) -> Dict:
+        """
+        État du filtrage incrémental : titres et signatures des articles acceptés, compteurs de rejet.
+        shared_claims : état dont les réservations sont partagées (pré- et post-filtrage dans deux threads)
+        """
+        claims = shared_claims or {'seen_titles': set(), 'seen_content_hashes': set(), 'claims_lock': threading.Lock()}
+        return {
+            'seen_titles': claims['seen_titles'],
+            'seen_content_hashes': claims['seen_content_hashes'],
+            'claims_lock': claims['claims_lock'],
+            'rejections': {
+                'duplicate_title': 0,
+                'duplicate_content': 0,
+                'low_quality_title': 0,
+                'promotional': 0,
+                'too_short': 0,
+                'too_long': 0,
+                'too_old': 0,
+                'low_score': 0,
+                'no_content': 0,
+                'spam_indicators': 0
+            }
         }
+    
+    def filter_article(self, article: Dict, state: Dict) -> Optional[str]:
+        """Filtre un article au fil de l'eau ; retourne la raison du rejet, ou None si l'article est accepté"""
+        return self.prefilter_article(article, state) or self.postfilter_article(article, state)
+    
+    def prefilter_article(self, article: Dict, state: Dict) -> Optional[str]:
+        """
+        Contrôles n'utilisant que le titre, le résumé RSS et les métadonnées, à faire avant l'enrichissement.
+        Seuls les doublons d'articles déjà acceptés sont écartés ici : le titre n'est réservé qu'à l'acceptation,
+        pour qu'un doublon reste candidat si le premier exemplaire est rejeté après l'enrichissement.
+        """
+        title_normalized = self._normalize_title(article.get('title', ''))
+        content_hash = self._generate_content_hash(article)
+        reason = self._prefilter_rejection_reason(article, title_normalized, content_hash, state)
+        
+        if reason:
+            return self._reject(reason, state)
+        return None
+    
+    def claim_article(self, article: Dict, state: Dict) -> Optional[str]:
+        """Réserve le titre et la signature d'un article accepté ; retourne la raison du rejet s'il est un doublon"""
+        title_normalized = self._normalize_title(article.get('title', ''))
+        content_hash = self._generate_content_hash(article)
+        with state['claims_lock']:
+            reason = self._duplicate_reason(title_normalized, content_hash, state)
+            if reason is None:
+                state['seen_titles'].add(title_normalized)
+                state['seen_content_hashes'].add(content_hash)
+        
+        if reason:
+            return self._reject(reason, state)
+        return None
+    
+    def postfilter_article(self, article: Dict, state: Dict) -> Optional[str]:
+        """Contrôles dépendant du contenu complet et du score, après enrichissement et scoring"""
+        # Vérification de base - contenu existant
+        if not self._has_valid_content(article):
+            return self._reject('no_content', state)
         
-        seen_titles = set()
-        seen_content_hashes = set()
+        # Vérification de la qualité du contenu
+        content_quality = self._check_content_quality(article)
+        if not content_quality['passed']:
+            return self._reject(content_quality['reason'], state)
         
-        for article in articles:
-            # Vérification de base - contenu existant
-            if not self._has_valid_content(article):
-                rejection_reasons['no_content'] += 1
-                continue
-            
-            # Vérification de duplication par titre
-            title_normalized = self._normalize_title(article.get('title', ''))
-            if title_normalized in seen_titles:
-                rejection_reasons['duplicate_title'] += 1
-                continue
-            
-            # Vérification de duplication sémantique
-            content_hash = self._generate_content_hash(article)
-            if content_hash in seen_content_hashes:
-                rejection_reasons['duplicate_content'] += 1
-                continue
-            
-            # Vérification de la qualité du titre
-            title_quality = self._check_title_quality(article)
-            if not title_quality['passed']:
-                rejection_reasons['low_quality_title'] += 1
-                continue
-            
-            # Vérification de la qualité du contenu
-            content_quality = self._check_content_quality(article)
-            if not content_quality['passed']:
-                rejection_reasons[content_quality['reason']] += 1
-                continue
-            
-            # Vérification anti-promotion/spam
-            if self._is_promotional_or_spam(article):
-                rejection_reasons['promotional'] += 1
-                continue
-            
-            # Vérification du score minimum
-            if article.get('quality_score', 0) < self.quality_thresholds['min_quality_score']:
-                rejection_reasons['low_score'] += 1
-                continue
-            
-            # Vérification des indicateurs de spam
-            if self._has_spam_indicators(article):
-                rejection_reasons['spam_indicators'] += 1
-                continue
-            
-            # Article accepté
-            seen_titles.add(title_normalized)
-            seen_content_hashes.add(content_hash)
-            filtered.append(article)
+        # Vérification anti-promotion/spam
+        if self._is_promotional_or_spam(article):
+            return self._reject('promotional', state)
+        
+        # Vérification du score minimum
+        if article.get('quality_score', 0) < self.quality_thresholds['min_quality_score']:
+            return self._reject('low_score', state)
+        
+        # Vérification des indicateurs de spam
+        if self._has_spam_indicators(article):
+            return self._reject('spam_indicators', state)
         
-        logger.info(f"Filtering results: {len(filtered)}/{len(articles)} articles kept. Rejections: {rejection_reasons}")
+        # Article accepté, sauf si un doublon l'a été avant lui
+        return self.claim_article(article, state)
+    
+    def _reject(self, reason: str, state: Dict) -> str:
+        state['rejections'][reason] = state['rejections'].get(reason, 0) + 1
+        return reason
+    
+    def _prefilter_rejection_reason(self, article: Dict, title_normalized: str, content_hash: str,
+                                    state: Dict) -> Optional[str]:
+        # Doublon d'un article déjà accepté
+        duplicate = self._duplicate_reason(title_normalized, content_hash, state)
+        if duplicate:
+            return duplicate
+        
+        # Vérification de la qualité du titre
+        title_quality = self._check_title_quality(article)
+        if not title_quality['passed']:
+            return 'low_quality_title'
+        
+        # Vérification de l'âge
+        if self._is_too_old(article):
+            return 'too_old'
+        
+        # Patterns promotionnels déjà présents dans le titre ou le résumé
+        # (la densité de mots promotionnels dépend du contenu complet : vérifiée après l'enrichissement)
+        if self._matches_blocklist(article.get('title', '') + ' ' + article.get('summary', '')):
+            return 'promotional'
         
-        return filtered, rejection_reasons
+        # Indicateurs de spam du titre seul
+        if self._count_title_spam_indicators(article.get('title', '')) >= 2:
+            return 'spam_indicators'
+        
+        return None
+    
+    def _duplicate_reason(self, title_normalized: str, content_hash: str, state: Dict) -> Optional[str]:
+        # Vérification de duplication par titre
+        if title_normalized in state['seen_titles']:
+            return 'duplicate_title'
+        
+        # Vérification de duplication sémantique (titre + résumé)
+        if content_hash in state['seen_content_hashes']:
+            return 'duplicate_content'
+        
+        return None
     
     def _has_valid_content(self, article: Dict) -> bool:
         """Vérifie que l'article a du contenu utilisable"""
@@ -176,15 +238,8 @@ class AdvancedContentFilter:
             return {'passed': False, 'reason': 'too_long'}
         
         # Vérification de l'âge (max 2 semaines)
-        published = article.get('published_parsed')
-        if published:
-            try:
-                publish_date = datetime(*published[:6])
-                age = datetime.now() - publish_date
-                if age > timedelta(days=self.quality_thresholds['max_age_days']):
-                    return {'passed': False, 'reason': 'too_old'}
-            except (TypeError, ValueError):
-                pass  # Ignorer les erreurs de date
+        if self._is_too_old(article):
+            return {'passed': False, 'reason': 'too_old'}
         
         # Vérification du ratio signal/bruit
         if not self._has_good_signal_to_noise(content):
@@ -192,6 +247,11 @@ class AdvancedContentFilter:
         
         return {'passed': True, 'reason': None}
     
+    def _is_too_old(self, article: Dict) -> bool:
+        """Vérifie l'âge de l'article d'après la date du flux"""
+        age = article_age(article)
+        return bool(age and age > timedelta(days=self.quality_thresholds['max_age_days']))
+    
     def _has_good_signal_to_noise(self, content: str) -> bool:
         """Vérifie le ratio signal/bruit du contenu"""
         if not content or len(content) < 100:
@@ -223,9 +283,8 @@ class AdvancedContentFilter:
         ).lower()
         
         # Vérification des patterns de blocage
-        for pattern in self.blocklist_patterns:
-            if re.search(pattern, full_text, re.IGNORECASE):
-                return True
+        if self._matches_blocklist(full_text):
+            return True
         
         # Vérification de la densité de mots-clés promotionnels
         promo_words = ['buy', 'purchase', 'sale', 'discount', 'offer', 'deal', 'free', 'trial', 'signup', 'register', 'subscribe', 'follow', 'like', 'share']
@@ -239,11 +298,27 @@ class AdvancedContentFilter:
         
         return False
     
+    def _matches_blocklist(self, text: str) -> bool:
+        """Vérifie les patterns de blocage (contenu promotionnel évident)"""
+        for pattern in self.blocklist_patterns:
+            if re.search(pattern, text, re.IGNORECASE):
+                return True
+        return False
+    
     def _has_spam_indicators(self, article: Dict) -> bool:
         """Détecte les indicateurs de spam"""
         title = article.get('title', '')
         content = article.get('content', article.get('summary', ''))
         
+        spam_indicators = self._count_title_spam_indicators(title) + (
+            # URL suspectes dans le contenu
+            len(re.findall(r'bit\.ly|tinyurl|goo\.gl|t\.co', content)) > 0
+        )
+        
+        return spam_indicators >= 2  # Au moins 2 indicateurs de spam
+    
+    def _count_title_spam_indicators(self, title: str) -> int:
+        """Compte les indicateurs de spam visibles dans le titre"""
         spam_indicators = [
             # Trop d'emojis
             len(re.findall(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]', title)) > 3,
@@ -258,13 +333,10 @@ class AdvancedContentFilter:
             len(set(title.lower().split())) / max(len(title.split()), 1) < 0.6,
             
             # Mots en majuscules excessifs
-            len([w for w in title.split() if w.isupper() and len(w) > 1]) > 2,
-            
-            # URL suspectes dans le contenu
-            len(re.findall(r'bit\.ly|tinyurl|goo\.gl|t\.co', content)) > 0
+            len([w for w in title.split() if w.isupper() and len(w) > 1]) > 2
         ]
         
-        return sum(spam_indicators) >= 2  # Au moins 2 indicateurs de spam
+        return sum(spam_indicators)
     
     def _build_blocklist_patterns(self) -> List[str]:
         """Construit la liste des patterns à bloquer"""
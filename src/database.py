@@ -1,10 +1,16 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, Float, Index
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, DateTime, Boolean, Float, Index
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
 from datetime import datetime, timedelta
 import json
+import os
+import threading
 from loguru import logger
 
+from .sources_config import DATABASE_CONFIG
+
 Base = declarative_base()
 
 class Post(Base):
@@ -93,12 +99,114 @@ class EnrichedContentCache(Base):
         Index('idx_url_expires', 'url', 'expires_at'),
     )
 
+class FeedValidator(Base):
+    __tablename__ = 'feed_validators'
+    
+    id = Column(Integer, primary_key=True)
+    url = Column(String(500), nullable=False, unique=True)
+    etag = Column(String(500))
+    last_modified = Column(String(100))
+    content_hash = Column(String(64))  # SHA-256 du corps du flux
+    feed_updated = Column(String(100))  # <updated>/<lastBuildDate> au niveau du flux
+    checked_at = Column(DateTime, default=datetime.now)
+
+class FeedHealth(Base):
+    __tablename__ = 'feed_health'
+    
+    id = Column(Integer, primary_key=True)
+    url = Column(String(500), nullable=False, unique=True)
+    consecutive_failures = Column(Integer, default=0)  # Runs consécutifs en échec
+    last_error = Column(String(500))
+    last_failure_at = Column(DateTime)
+    last_success_at = Column(DateTime)
+    quarantined_until = Column(DateTime)
+
+class FeedPollSchedule(Base):
+    __tablename__ = 'feed_poll_schedule'
+    
+    id = Column(Integer, primary_key=True)
+    url = Column(String(500), nullable=False, unique=True)
+    last_polled_at = Column(DateTime)
+    next_poll_at = Column(DateTime, index=True)
+    avg_interval_hours = Column(Float)  # Intervalle de publication estimé (moyenne lissée)
+    last_entry_at = Column(DateTime)  # Date (UTC) de l'entrée la plus récente vue
+    polls = Column(Integer, default=0)
+
+class SeenEntry(Base):
+    __tablename__ = 'feed_seen_entries'
+    
+    id = Column(Integer, primary_key=True)
+    entry_key = Column(String(64), nullable=False, unique=True)  # SHA-256 (URL du flux + GUID ou lien canonique)
+    feed_url = Column(String(500), nullable=False)
+    article_url = Column(String(500))
+    fingerprint = Column(String(64), nullable=False)  # SHA-256 du titre, lien, résumé et date de mise à jour
+    accepted_articles = Column(Text)  # JSON : domaine -> article accepté (sérialisé)
+    first_seen_at = Column(DateTime, default=datetime.now)
+    last_seen_at = Column(DateTime, default=datetime.now, index=True)
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+def sqlite_pragmas() -> dict:
+    """Pragmas appliqués à chaque nouvelle connexion SQLite, d'après DATABASE_CONFIG"""
+    return {
+        'journal_mode': DATABASE_CONFIG['sqlite_journal_mode'],
+        'synchronous': DATABASE_CONFIG['sqlite_synchronous'],
+        'busy_timeout': DATABASE_CONFIG['sqlite_busy_timeout_ms'],
+        'cache_size': -DATABASE_CONFIG['sqlite_cache_mb'] * 1024,  # Négatif : taille en Kio
+        'mmap_size': DATABASE_CONFIG['sqlite_mmap_mb'] * 1024 * 1024,
+    }
+
+def _pragma_listener(pragmas: dict):
+    def apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f'PRAGMA {name}={value}')
+        finally:
+            cursor.close()
+    return apply_pragmas
+
+def get_engine(db_path: str, pragmas: dict = None):
+    """
+    Moteur partagé du processus pour un fichier de base, et registre de sessions par thread associé.
+    Le schéma est créé une seule fois, à la création du moteur, avec les pragmas de connexion
+    (`pragmas`, sqlite_pragmas() par défaut) : un appel ultérieur pour le même fichier réutilise le moteur tel quel.
+    """
+    key = os.path.abspath(db_path)
+    with _engines_lock:
+        if key not in _engines:
+            engine = create_engine(
+                f'sqlite:///{db_path}',
+                poolclass=QueuePool,
+                pool_size=DATABASE_CONFIG['pool_size'],
+                max_overflow=DATABASE_CONFIG['max_overflow'],
+                pool_timeout=DATABASE_CONFIG['pool_timeout'],
+                # Connexions du pool réutilisées par d'autres threads (jamais par deux à la fois)
+                connect_args={'check_same_thread': False}
+            )
+            event.listen(engine, 'connect', _pragma_listener(sqlite_pragmas() if pragmas is None else pragmas))
+            Base.metadata.create_all(engine)
+            _engines[key] = (engine, scoped_session(sessionmaker(bind=engine)))
+        return _engines[key]
+
 class DatabaseManager:
-    def __init__(self, db_path='data/linkedin_posts.db'):
-        self.engine = create_engine(f'sqlite:///{db_path}')
-        Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+    """
+    Accès à la base. Toutes les instances d'un même fichier partagent le moteur et son pool de connexions ;
+    chaque thread (worker du scraper, requête Flask) a sa propre session, rendue au pool par close().
+    """
+    
+    # Taille des lots pour les requêtes IN (limite de paramètres de SQLite)
+    IN_QUERY_BATCH_SIZE = 500
+    
+    def __init__(self, db_path='data/linkedin_posts.db', pragmas: dict = None):
+        self.db_path = db_path
+        self.engine, self._sessions = get_engine(db_path, pragmas)
+    
+    @property
+    def session(self):
+        """Session du thread courant (créée au premier accès)"""
+        return self._sessions()
     
     def save_post(self, post_data: dict):
         # Convert source_articles to a simpler format for JSON serialization
@@ -242,13 +350,12 @@ class DatabaseManager:
             return 'general'
     
     def save_articles_to_cache(self, articles: list, cache_duration_hours: int = 6):
-        """Sauvegarde une liste d'articles dans le cache"""
-        cache_expiry = datetime.now() + timedelta(hours=cache_duration_hours)
+        """Sauvegarde une liste d'articles dans le cache (upsert groupé, une seule transaction)"""
+        now = datetime.now()
+        cache_expiry = now + timedelta(hours=cache_duration_hours)
+        rows = []
         
         for article in articles:
-            # Vérifier si l'article existe déjà
-            existing = self.session.query(CachedArticle).filter_by(url=article['url']).first()
-            
             # Extraire les données selon le nouveau format optimisé
             summary = article.get('summary', '')
             
@@ -273,41 +380,47 @@ class DatabaseManager:
             if isinstance(domains, list):
                 domains = domains[:5]  # Limiter à 5 technologies
             
-            if existing:
-                # Mettre à jour l'article existant
-                existing.title = article['title']
-                existing.summary = summary
-                existing.relevance_score = reliability
-                existing.domain_matches = article.get('domain_matches', 0)
-                existing.scraped_at = article.get('scraped_at', datetime.now())
-                existing.cache_expires_at = cache_expiry
-                existing.source_category = category
-                existing.source_reliability = reliability
-                existing.source_domains = json.dumps(domains)
-            else:
-                # Créer un nouvel article en cache
-                cached_article = CachedArticle(
-                    url=article['url'],
-                    title=article['title'],
-                    source=article['source'],
-                    source_category=category,
-                    source_reliability=reliability,
-                    source_domains=json.dumps(domains),
-                    published=article.get('published', datetime.now()),
-                    summary=summary,
-                    relevance_score=reliability,
-                    domain_matches=article.get('domain_matches', 0),
-                    scraped_at=article.get('scraped_at', datetime.now()),
-                    cache_expires_at=cache_expiry
-                )
-                self.session.add(cached_article)
+            rows.append({
+                'url': article['url'],
+                'title': article['title'],
+                'source': article['source'],
+                'source_category': category,
+                'source_reliability': reliability,
+                'source_domains': json.dumps(domains),
+                'published': article.get('published', now),
+                'summary': summary,
+                'relevance_score': reliability,
+                'domain_matches': article.get('domain_matches', 0),
+                'scraped_at': article.get('scraped_at', now),
+                'cache_expires_at': cache_expiry,
+            })
         
+        # Article déjà en cache : source et date de publication conservées
+        self._bulk_upsert(CachedArticle, rows, update=(
+            'title', 'summary', 'relevance_score', 'domain_matches', 'scraped_at', 'cache_expires_at',
+            'source_category', 'source_reliability', 'source_domains'
+        ), label='articles')
+    
+    def _bulk_upsert(self, model, rows: list, update: tuple, label: str, key: str = 'url') -> bool:
+        """
+        INSERT ... ON CONFLICT DO UPDATE exécuté en executemany dans une seule transaction,
+        au lieu d'un SELECT puis d'un INSERT ou UPDATE par ligne. Les erreurs sont journalisées,
+        pas levées : un cache non sauvegardé ne fait pas échouer le scraping.
+        """
+        if not rows:
+            return True
+        statement = sqlite_insert(model.__table__)
+        statement = statement.on_conflict_do_update(
+            index_elements=[key], set_={column: statement.excluded[column] for column in update}
+        )
         try:
+            self.session.execute(statement, rows)
             self.session.commit()
+            return True
         except Exception as e:
             self.session.rollback()
-            print(f"Error saving articles to cache: {e}")
-            # Ne pas faire échouer le scraping pour des erreurs de cache
+            logger.error(f"Error saving {label} to cache: {e}")
+            return False
     
     def clear_expired_cache(self):
         """Nettoie les articles expirés du cache"""
@@ -344,50 +457,280 @@ class DatabaseManager:
             }
         return None
     
+    def get_enriched_contents(self, urls: list) -> dict:
+        """Contenus enrichis non expirés des URLs demandées, indexés par URL (une requête par lot)"""
+        urls = list(dict.fromkeys(urls))
+        now = datetime.now()
+        contents = {}
+        for start in range(0, len(urls), self.IN_QUERY_BATCH_SIZE):
+            rows = self.session.query(
+                EnrichedContentCache.url, EnrichedContentCache.content, EnrichedContentCache.extraction_quality
+            ).filter(
+                EnrichedContentCache.url.in_(urls[start:start + self.IN_QUERY_BATCH_SIZE]),
+                EnrichedContentCache.expires_at > now
+            ).all()
+            for url, content, extraction_quality in rows:
+                contents[url] = {
+                    'content': content,
+                    'extraction_quality': extraction_quality,
+                    'from_cache': True
+                }
+        return contents
+    
     def save_enriched_content_to_cache(self, url: str, content: str, extraction_quality: str, cache_hours: int = 24):
         """Sauvegarde le contenu enrichi dans le cache"""
-        expires_at = datetime.now() + timedelta(hours=cache_hours)
+        self.save_enriched_contents([
+            {'url': url, 'content': content, 'extraction_quality': extraction_quality, 'cache_hours': cache_hours}
+        ])
+    
+    def save_enriched_contents(self, entries: list) -> bool:
+        """
+        Sauvegarde un lot de contenus enrichis en un upsert groupé
+        (entrées : url, content, extraction_quality, cache_hours)
+        """
+        now = datetime.now()
+        rows = [{
+            'url': entry['url'],
+            'content': entry['content'],
+            'extraction_quality': entry['extraction_quality'],
+            'cached_at': now,
+            'expires_at': now + timedelta(hours=entry.get('cache_hours', 24)),
+        } for entry in entries]
+        return self._bulk_upsert(
+            EnrichedContentCache, rows, update=('content', 'extraction_quality', 'cached_at', 'expires_at'),
+            label='enriched content'
+        )
+    
+    def clear_expired_enriched_cache(self):
+        """Nettoie le cache du contenu enrichi expiré"""
+        self.session.query(EnrichedContentCache).filter(
+            EnrichedContentCache.expires_at < datetime.now()
+        ).delete()
+        self.session.commit()
+    
+    def get_feed_validators(self, urls: list = None) -> dict:
+        """Récupère les validateurs HTTP des flux RSS, indexés par URL"""
+        query = self.session.query(FeedValidator)
+        if urls:
+            query = query.filter(FeedValidator.url.in_(urls))
         
-        # Vérifier si l'entrée existe déjà
-        existing = self.session.query(EnrichedContentCache).filter(
-            EnrichedContentCache.url == url
-        ).first()
+        return {
+            validator.url: {
+                'etag': validator.etag,
+                'last_modified': validator.last_modified,
+                'content_hash': validator.content_hash,
+                'feed_updated': validator.feed_updated,
+                'checked_at': validator.checked_at
+            }
+            for validator in query.all()
+        }
+    
+    def save_feed_validators(self, validators: dict):
+        """Sauvegarde les validateurs HTTP des flux RSS en une seule transaction"""
+        if not validators:
+            return
         
-        if existing:
-            existing.content = content
-            existing.extraction_quality = extraction_quality
-            existing.cached_at = datetime.now()
-            existing.expires_at = expires_at
-        else:
-            cached_content = EnrichedContentCache(
-                url=url,
-                content=content,
-                extraction_quality=extraction_quality,
-                expires_at=expires_at
-            )
-            self.session.add(cached_content)
+        existing = {
+            validator.url: validator
+            for validator in self.session.query(FeedValidator).filter(
+                FeedValidator.url.in_(list(validators.keys()))
+            ).all()
+        }
+        
+        for url, data in validators.items():
+            validator = existing.get(url)
+            if validator is None:
+                validator = FeedValidator(url=url)
+                self.session.add(validator)
+            validator.etag = data.get('etag')
+            validator.last_modified = data.get('last_modified')
+            validator.content_hash = data.get('content_hash')
+            validator.feed_updated = data.get('feed_updated')
+            validator.checked_at = data.get('checked_at', datetime.now())
         
         try:
             self.session.commit()
         except Exception as e:
             self.session.rollback()
-            logger.error(f"Error saving enriched content to cache: {e}")
+            logger.error(f"Error saving feed validators: {e}")
     
-    def clear_expired_enriched_cache(self):
-        """Nettoie le cache du contenu enrichi expiré"""
-        self.session.query(EnrichedContentCache).filter(
-            EnrichedContentCache.expires_at < datetime.now()
+    def get_feed_health(self, urls: list = None) -> dict:
+        """Récupère l'état de santé des flux RSS, indexé par URL"""
+        query = self.session.query(FeedHealth)
+        if urls:
+            query = query.filter(FeedHealth.url.in_(urls))
+        
+        return {
+            health.url: {
+                'consecutive_failures': health.consecutive_failures or 0,
+                'last_error': health.last_error,
+                'last_failure_at': health.last_failure_at,
+                'last_success_at': health.last_success_at,
+                'quarantined_until': health.quarantined_until
+            }
+            for health in query.all()
+        }
+    
+    def save_feed_health(self, feed_health: dict):
+        """Sauvegarde l'état de santé des flux RSS en une seule transaction"""
+        if not feed_health:
+            return
+        
+        existing = {
+            health.url: health
+            for health in self.session.query(FeedHealth).filter(
+                FeedHealth.url.in_(list(feed_health.keys()))
+            ).all()
+        }
+        
+        for url, data in feed_health.items():
+            health = existing.get(url)
+            if health is None:
+                health = FeedHealth(url=url)
+                self.session.add(health)
+            health.consecutive_failures = data.get('consecutive_failures', 0)
+            health.last_error = (data.get('last_error') or '')[:500] or None
+            health.last_failure_at = data.get('last_failure_at')
+            health.last_success_at = data.get('last_success_at')
+            health.quarantined_until = data.get('quarantined_until')
+        
+        try:
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Error saving feed health: {e}")
+    
+    def get_feed_poll_schedule(self, urls: list = None) -> dict:
+        """Récupère le planning de polling des flux RSS, indexé par URL"""
+        query = self.session.query(FeedPollSchedule)
+        if urls:
+            query = query.filter(FeedPollSchedule.url.in_(urls))
+        
+        return {
+            schedule.url: {
+                'last_polled_at': schedule.last_polled_at,
+                'next_poll_at': schedule.next_poll_at,
+                'avg_interval_hours': schedule.avg_interval_hours,
+                'last_entry_at': schedule.last_entry_at,
+                'polls': schedule.polls or 0
+            }
+            for schedule in query.all()
+        }
+    
+    def save_feed_poll_schedule(self, schedules: dict):
+        """Sauvegarde le planning de polling des flux RSS en une seule transaction"""
+        if not schedules:
+            return
+        
+        existing = {
+            schedule.url: schedule
+            for schedule in self.session.query(FeedPollSchedule).filter(
+                FeedPollSchedule.url.in_(list(schedules.keys()))
+            ).all()
+        }
+        
+        for url, data in schedules.items():
+            schedule = existing.get(url)
+            if schedule is None:
+                schedule = FeedPollSchedule(url=url)
+                self.session.add(schedule)
+            schedule.last_polled_at = data.get('last_polled_at')
+            schedule.next_poll_at = data.get('next_poll_at')
+            schedule.avg_interval_hours = data.get('avg_interval_hours')
+            schedule.last_entry_at = data.get('last_entry_at')
+            schedule.polls = data.get('polls', 0)
+        
+        try:
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Error saving feed poll schedule: {e}")
+    
+    def get_seen_entry_fingerprints(self) -> dict:
+        """Empreintes des entrées de flux déjà traitées, indexées par clé d'entrée"""
+        rows = self.session.query(SeenEntry.entry_key, SeenEntry.fingerprint).all()
+        return {entry_key: fingerprint for entry_key, fingerprint in rows}
+    
+    def get_seen_entry_articles(self, keys: list) -> dict:
+        """Articles acceptés des entrées demandées : clé -> domaine -> article (JSON décodé)"""
+        articles = {}
+        for start in range(0, len(keys), self.IN_QUERY_BATCH_SIZE):
+            rows = self.session.query(SeenEntry.entry_key, SeenEntry.accepted_articles).filter(
+                SeenEntry.entry_key.in_(keys[start:start + self.IN_QUERY_BATCH_SIZE]),
+                SeenEntry.accepted_articles.isnot(None)
+            ).all()
+            for entry_key, accepted in rows:
+                articles[entry_key] = json.loads(accepted)
+        return articles
+    
+    def get_seen_entry_articles_for_feeds(self, urls: list) -> dict:
+        """Articles acceptés des entrées des flux demandés : URL du flux -> clé -> domaine -> article (JSON décodé)"""
+        urls = list(dict.fromkeys(urls))
+        articles = {}
+        for start in range(0, len(urls), self.IN_QUERY_BATCH_SIZE):
+            rows = self.session.query(SeenEntry.feed_url, SeenEntry.entry_key, SeenEntry.accepted_articles).filter(
+                SeenEntry.feed_url.in_(urls[start:start + self.IN_QUERY_BATCH_SIZE]),
+                SeenEntry.accepted_articles.isnot(None)
+            ).all()
+            for feed_url, entry_key, accepted in rows:
+                articles.setdefault(feed_url, {})[entry_key] = json.loads(accepted)
+        return articles
+    
+    def save_seen_entries(self, entries: dict, accepted: dict = None, touched: set = None):
+        """
+        Met à jour l'index des entrées vues en une seule transaction :
+        entrées nouvelles ou modifiées, articles acceptés par domaine, date de passage des entrées inchangées
+        """
+        accepted = accepted or {}
+        now = datetime.now()
+        keys = list(set(entries) | set(accepted) | set(touched or ()))
+        
+        existing = {}
+        for start in range(0, len(keys), self.IN_QUERY_BATCH_SIZE):
+            for seen in self.session.query(SeenEntry).filter(
+                SeenEntry.entry_key.in_(keys[start:start + self.IN_QUERY_BATCH_SIZE])
+            ).all():
+                existing[seen.entry_key] = seen
+        
+        for entry_key in keys:
+            seen = existing.get(entry_key)
+            data = entries.get(entry_key)
+            if seen is None:
+                if data is None:
+                    continue
+                seen = SeenEntry(entry_key=entry_key, first_seen_at=now)
+                self.session.add(seen)
+            
+            if data:
+                seen.feed_url = data['feed_url']
+                seen.article_url = data.get('article_url')
+                seen.fingerprint = data['fingerprint']
+                if data.get('reset_accepted'):
+                    seen.accepted_articles = None
+            
+            if entry_key in accepted:
+                by_domain = json.loads(seen.accepted_articles) if seen.accepted_articles else {}
+                by_domain.update(accepted[entry_key])
+                seen.accepted_articles = json.dumps(by_domain)
+            
+            seen.last_seen_at = now
+        
+        try:
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Error saving seen feed entries: {e}")
+    
+    def clear_expired_seen_entries(self, retention_days: int):
+        """Oublie les entrées absentes des flux depuis plus de `retention_days` jours"""
+        self.session.query(SeenEntry).filter(
+            SeenEntry.last_seen_at < datetime.now() - timedelta(days=retention_days)
         ).delete()
         self.session.commit()
     
     def close(self):
-        """Ferme la session de base de données"""
-        if self.session:
-            try:
-                self.session.close()
-            except Exception as e:
-                logger.error(f"Error closing database session: {e}")
-    
-    def __del__(self):
-        """Destructeur pour s'assurer que la session est fermée"""
-        self.close()
\ No newline at end of file
+        """Ferme la session du thread courant et rend sa connexion au pool"""
+        try:
+            self._sessions.remove()
+        except Exception as e:
+            logger.error(f"Error closing database session: {e}")
\ No newline at end of file
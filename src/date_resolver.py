@@ -0,0 +1,153 @@
+"""
+Résolution des dates de publication des entrées de flux
+Toutes les dates sont ramenées en UTC naïf (comme les struct_time de feedparser) : les calculs d'âge
+se font contre `utc_now()` quel que soit le fuseau d'origine ou celui du serveur.
+Chaînes RFC 822 / ISO 8601 parsées par la bibliothèque standard, dateutil en dernier recours,
+avec un cache LRU sur la chaîne brute (les mêmes dates reviennent souvent dans un flux).
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, Optional
+
+from dateutil import parser as date_parser
+
+# Dates plausibles pour une entrée sans date de flux (extraites de l'URL ou du titre)
+MIN_PLAUSIBLE_DATE = datetime(2020, 1, 1)
+
+# Champs de date d'une entrée feedparser, par ordre de préférence
+PARSED_DATE_FIELDS = ('published_parsed', 'updated_parsed')
+STRING_DATE_FIELDS = ('published', 'updated', 'date')
+
+URL_DATE_PATTERNS = (
+    re.compile(r'/(\d{4})/(\d{1,2})/(\d{1,2})/'),  # /2025/07/10/
+    re.compile(r'/(\d{4})-(\d{1,2})-(\d{1,2})/'),  # /2025-07-10/
+    re.compile(r'(\d{4})(\d{2})(\d{2})'),          # 20250710
+    re.compile(r'(\d{4})/(\d{1,2})/'),             # /2025/07/ (premier du mois)
+)
+
+TITLE_DATE_PATTERN = re.compile(
+    r'\d{1,2}/\d{1,2}/\d{4}'                       # 07/10/2025
+    r'|\d{4}-\d{1,2}-\d{1,2}'                      # 2025-07-10
+    r'|(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?'
+    r'|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2},?\s+\d{4}',
+    re.IGNORECASE
+)
+
+
+def utc_now() -> datetime:
+    """Heure courante en UTC naïf, référence de tous les calculs d'âge"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    # Une date sans fuseau est supposée UTC
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=4096)
+def parse_date_string(raw: str) -> Optional[datetime]:
+    """Date d'une chaîne de flux en UTC naïf, ou None si illisible"""
+    raw = raw.strip()
+    if not raw:
+        return None
+
+    if raw[:4].isdigit() and raw[4:5] == '-':
+        # ISO 8601 (Atom) : "2025-07-10T08:00:00Z"
+        try:
+            return _to_naive_utc(datetime.fromisoformat(raw[:-1] + '+00:00' if raw.endswith('Z') else raw))
+        except ValueError:
+            pass
+    else:
+        # RFC 822 (RSS) : "Thu, 10 Jul 2025 08:00:00 GMT"
+        try:
+            return _to_naive_utc(parsedate_to_datetime(raw))
+        except (TypeError, ValueError, IndexError):
+            pass
+
+    try:
+        return _to_naive_utc(date_parser.parse(raw))
+    except (ValueError, OverflowError, TypeError):
+        return None
+
+
+def feed_entry_date(entry: Dict) -> Optional[datetime]:
+    """Date déclarée par le flux pour une entrée (champs parsés par feedparser, puis champs texte)"""
+    for field in PARSED_DATE_FIELDS:
+        value = entry.get(field)
+        if value:
+            try:
+                return datetime(*value[:6])
+            except (TypeError, ValueError):
+                continue
+
+    for field in STRING_DATE_FIELDS:
+        value = entry.get(field)
+        if value and isinstance(value, str):
+            parsed = parse_date_string(value)
+            if parsed:
+                return parsed
+
+    return None
+
+
+def _plausible(date: datetime) -> bool:
+    return MIN_PLAUSIBLE_DATE <= date <= utc_now()
+
+
+def date_from_url_or_title(entry: Dict) -> Optional[datetime]:
+    """Date devinée depuis l'URL ou le titre d'une entrée sans date de flux"""
+    url = entry.get('link', '') or entry.get('id', '')
+    if url:
+        for pattern in URL_DATE_PATTERNS:
+            match = pattern.search(url)
+            if not match:
+                continue
+            groups = [int(group) for group in match.groups()]
+            try:
+                date = datetime(groups[0], groups[1], groups[2] if len(groups) == 3 else 1)
+            except ValueError:
+                continue
+            if _plausible(date):
+                return date
+
+    title = entry.get('title', '')
+    if title:
+        match = TITLE_DATE_PATTERN.search(title)
+        if match:
+            date = parse_date_string(match.group(0))
+            if date and _plausible(date):
+                return date
+
+    return None
+
+
+def resolve_entry_date(entry: Dict) -> Optional[datetime]:
+    """Date de publication d'une entrée en UTC naïf : date du flux, sinon URL ou titre"""
+    return feed_entry_date(entry) or date_from_url_or_title(entry)
+
+
+def age_of(published: Optional[datetime], now: datetime = None) -> Optional[timedelta]:
+    """Âge d'une date résolue (UTC naïf) ; None si la date est absente"""
+    if not isinstance(published, datetime):
+        return None
+    return (now or utc_now()) - _to_naive_utc(published)
+
+
+def article_age(article: Dict, now: datetime = None) -> Optional[timedelta]:
+    """Âge d'un article d'après sa date résolue, ou à défaut le struct_time de feedparser"""
+    published = article.get('published')
+    if isinstance(published, datetime):
+        return age_of(published, now)
+
+    published_parsed = article.get('published_parsed')
+    if published_parsed:
+        try:
+            return age_of(datetime(*published_parsed[:6]), now)
+        except (TypeError, ValueError):
+            return None
+    return None
@@ -3,40 +3,117 @@ Scraper amélioré avec focus sur la qualité et la diversité des articles
 Intègre le nouveau système de scoring et de filtrage
 """
 
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from loguru import logger
 import time
 from typing import List, Dict, Optional, Set, Tuple, Any
-import re
 from urllib.parse import urljoin
-import feedparser
 from src.database import DatabaseManager
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future
 import hashlib
-from readability import Document
+import queue
+import threading
 
 # Import des nouveaux modules
-from .sources_config import SPECIALIZED_SOURCES, QUALITY_CONFIG
+from .sources_config import SPECIALIZED_SOURCES, QUALITY_CONFIG, SCRAPING_CONFIG
 from .quality_scorer import QualityScorer
 from .diversity_manager import DiversityManager
 from .content_filter import AdvancedContentFilter
+from .feed_validators import FeedValidatorStore, compute_content_hash, extract_feed_updated
+from .http_client import ContentRejectedError, get_http_client
+from .text_cleaner import clean_summary
+from .date_resolver import age_of, article_age, resolve_entry_date, utc_now
+from . import async_fetcher
+from .async_fetcher import AsyncFetchEngine, FetchRequest
+from .fetch_plan import FetchPlan, compile_fetch_plan
+from .host_health import CircuitOpenError, FeedHealthStore
+from .poll_schedule import PollScheduleStore, entry_dates_from_feed
+from .seen_entries import SeenEntryIndex
+from .raw_html_store import RawHtmlStore
+from .cache_writer import CacheWriteQueue
+from .run_budget import RunDeadline, completed_within
+from .parse_worker import extract_article_text, parse_feed_entries
+from .scrape_executor import get_domain_executor, get_io_executor, run_cpu_task
+
+# Délai accordé aux pipelines de domaine après l'échéance pour la diversité et le tri des articles déjà traités
+DOMAIN_GRACE_SECONDS = 5
+
+# Attente maximale de l'écriture des sauvegardes du cache en fin de run
+CACHE_FLUSH_TIMEOUT_SECONDS = 30
 
 class EnhancedFullstackScraper:
     """Scraper amélioré avec focus sur qualité, diversité et nouveautés"""
     
-    def __init__(self, db_manager: DatabaseManager = None):
+    def __init__(self, db_manager: DatabaseManager = None, sources: Dict = None):
+        # Une session par thread (scoped_session de DatabaseManager) : les domaines parallèles lisent sans verrou
         self.db = db_manager or DatabaseManager()
+        
+        # Un seul run à la fois par instance : l'état du run (flux récupérés, états persistés,
+        # last_run_stats) est porté par le scraper, partagé par les requêtes de l'API
+        self.run_lock = threading.RLock()
         self.cache_duration_hours = 12
         self.request_timeout = 10
         self.max_retries = 2
         
         # Nouveaux composants
-        self.sources = SPECIALIZED_SOURCES
+        self.sources = sources or SPECIALIZED_SOURCES
+        self._fetch_plan = None
+        self._fetch_plan_sources = None
+        
+        # Flux récupérés pendant le run courant (URL -> Future des entrées)
+        self._feed_results: Dict[str, Future] = {}
+        self._feed_results_lock = threading.Lock()
+        
+        # Pages d'articles : plafond de lecture et types de contenu acceptés
+        self.article_max_bytes = SCRAPING_CONFIG['article_max_bytes']
+        self.article_content_types = SCRAPING_CONFIG['article_content_types']
+        self._download_stats = self._new_download_stats()
+        self._download_stats_lock = threading.Lock()
+        self.content_extractor = SCRAPING_CONFIG['content_extractor']
+        self.feed_reader = SCRAPING_CONFIG['feed_reader']
+        
+        # Pages brutes conservées localement : réextraction sans retéléchargement (ou hors ligne)
+        self.raw_html = RawHtmlStore()
+        self.raw_html_reuse_hours = SCRAPING_CONFIG['raw_html_reuse_hours']
+        self.raw_html_offline = SCRAPING_CONFIG['raw_html_offline']
+        
+        # Sauvegardes du contenu enrichi écrites par lots par un thread dédié (les workers n'attendent pas la base)
+        self.cache_writer = CacheWriteQueue(self.db)
         self.quality_scorer = QualityScorer()
         self.diversity_manager = DiversityManager()
         self.content_filter = AdvancedContentFilter()
+        self.feed_validators = FeedValidatorStore(self.db)
+        
+        # Quarantaine des flux en échec sur plusieurs runs (le circuit breaker par host est dans le client HTTP)
+        self.feed_health = FeedHealthStore(self.db)
+        
+        # Polling adaptatif : chaque flux n'est relu que lorsqu'il est dû d'après sa cadence de publication
+        self.poll_schedule = PollScheduleStore(self.db)
+        self.adaptive_polling = SCRAPING_CONFIG['adaptive_polling']
+        self._force_poll = False
+        self._recording = False
+        
+        # Entrées déjà traitées lors des runs précédents (empreinte et articles acceptés)
+        self.seen_entries = SeenEntryIndex(self.db)
+        
+        # Client HTTP partagé (pools de connexions keep-alive par host)
+        self.http = get_http_client()
+        self._http_stats_at_start = {}
+        
+        # Moteur de fetch : 'threads' (par défaut) ou 'async'
+        self.fetch_engine = SCRAPING_CONFIG['fetch_engine']
+        if self.fetch_engine == 'async' and not async_fetcher.is_available():
+            logger.warning("aiohttp is not installed, falling back to the threaded fetch engine")
+            self.fetch_engine = 'threads'
+        
+        # 'stages' (barrière entre chaque étape) ou 'streaming' (moteur à threads uniquement)
+        self.pipeline_mode = SCRAPING_CONFIG['pipeline_mode']
+        
+        # Échéance du run courant (SCRAPER_RUN_DEADLINE_SECONDS), propagée à chaque étape
+        self._deadline = RunDeadline()
+        
+        # Statistiques du dernier run complet
+        self.last_run_stats = {}
         
         # WebSocket session pour le suivi des progrès
         self.websocket_session_id = None
@@ -61,15 +138,22 @@ class EnhancedFullstackScraper:
             except Exception as e:
                 logger.debug(f"Error emitting progress: {e}")
     
-    def scrape_all_sources(self, max_articles: int = 20, use_cache: bool = False) -> List[Dict]:
+    def scrape_all_sources(self, max_articles: int = 20, use_cache: bool = False, force_poll: bool = False,
+                           deadline: RunDeadline = None) -> List[Dict]:
         """
         Scrape toutes les sources avec focus qualité et diversité
+        force_poll : relire et reparser tous les flux, même ceux qui ne sont pas encore dus ou inchangés
+        deadline : échéance du run (par défaut SCRAPER_RUN_DEADLINE_SECONDS) ; à expiration,
+        les articles déjà traités sont retournés et last_run_stats['partial'] est vrai
+        Un run lancé pendant un autre attend la fin de celui-ci.
         """
+        with self.run_lock:
+            return self._scrape_all_sources(max_articles, force_poll, deadline)
+    
+    def _scrape_all_sources(self, max_articles: int, force_poll: bool, deadline: Optional[RunDeadline]) -> List[Dict]:
         logger.info(f"Starting enhanced scraping for {max_articles} high-quality articles")
         
-        # Nettoyer le cache expiré
-        self.db.clear_expired_cache()
-        self.db.clear_expired_enriched_cache()
+        self._begin_run(force_poll, deadline)
         
         # Collecter les articles par domaine
         domain_results = {}
@@ -86,7 +170,9 @@ class EnhancedFullstackScraper:
         if remaining > 0:
             domain_targets['backend'] += remaining  # Donner le reste au backend
         
-        # Scraper chaque domaine
+        # Scraper les domaines en parallèle : la durée totale est celle du domaine le plus lent
+        domain_executor = get_domain_executor()
+        future_to_domain = {}
         for domain, target_count in domain_targets.items():
             logger.info(f"Scraping {domain} domain (target: {target_count} articles)...")
             self._emit_progress({
@@ -95,8 +181,13 @@ class EnhancedFullstackScraper:
                 'target_articles': target_count,
                 'total_domains': len(domain_targets)
             })
-            
-            domain_result = self.scrape_domain(domain, target_count)
+            future_to_domain[domain_executor.submit(self.scrape_domain, domain, target_count)] = domain
+        
+        # Les pipelines respectent l'échéance ; le délai de grâce couvre leur sélection finale
+        for future in completed_within(future_to_domain, self._deadline.extended(DOMAIN_GRACE_SECONDS), stage='domains'):
+            domain = future_to_domain[future]
+            # scrape_domain capture ses propres erreurs
+            domain_result = future.result()
             domain_results[domain] = domain_result
             
             self._emit_progress({
@@ -106,6 +197,14 @@ class EnhancedFullstackScraper:
                 'quality_stats': domain_result.get('stats', {})
             })
         
+        # Ordre des domaines stable pour l'agrégation, quel que soit l'ordre de fin
+        domain_results = {
+            domain: domain_results.get(domain, {
+                'status': 'error', 'domain': domain, 'error': 'Run deadline exceeded', 'articles': []
+            })
+            for domain in domain_targets
+        }
+        
         # Combiner tous les articles
         all_articles = []
         total_stats = {
@@ -113,10 +212,16 @@ class EnhancedFullstackScraper:
             'after_scoring': 0,
             'after_filtering': 0,
             'final_selection': 0,
-            'rejections': {}
+            'feeds_skipped_unchanged': 0,
+            'feed_fetches_saved': 0,
+            'enrichment_fetches_avoided': 0,
+            'rejections': {},
+            'stage_seconds': {}
         }
         
         for domain, result in domain_results.items():
+            total_stats['feeds_skipped_unchanged'] += result.get('stats', {}).get('feeds_skipped_unchanged', 0)
+            
             if result.get('status') == 'success':
                 all_articles.extend(result.get('articles', []))
                 
@@ -124,7 +229,10 @@ class EnhancedFullstackScraper:
                 domain_stats = result.get('stats', {})
                 total_stats['total_collected'] += domain_stats.get('total_collected', 0)
                 total_stats['after_scoring'] += domain_stats.get('after_scoring', 0)
+                total_stats['enrichment_fetches_avoided'] += domain_stats.get('enrichment_fetches_avoided', 0)
                 total_stats['after_filtering'] += domain_stats.get('after_filtering', 0)
+                # Domaines en parallèle : durées par domaine, non additionnées
+                total_stats['stage_seconds'][domain] = domain_stats.get('stage_seconds', {})
                 
                 # Agréger les rejections
                 for reason, count in domain_stats.get('rejections', {}).items():
@@ -136,6 +244,29 @@ class EnhancedFullstackScraper:
         # Limiter au nombre cible
         final_articles = all_articles[:max_articles]
         total_stats['final_selection'] = len(final_articles)
+        # Une seule requête par URL sur l'ensemble des domaines du run
+        total_stats['feed_fetches_saved'] = (
+            sum(self.fetch_plan.domain_bindings_count(domain) for domain in domain_targets)
+            - len(self._feed_results)
+        )
+        total_stats['feeds_quarantined'] = self.feed_health.quarantine_skipped_count()
+        total_stats['feeds_not_due'] = self.poll_schedule.not_due_count()
+        total_stats['open_circuits'] = [
+            circuit['host'] for circuit in self.http.circuit_breaker.get_states() if circuit['state'] != 'closed'
+        ]
+        total_stats['http'] = self._http_stats_since_start()
+        with self._download_stats_lock:
+            total_stats['downloads'] = dict(self._download_stats)
+        total_stats['seen_entries'] = self.seen_entries.get_stats()
+        total_stats['raw_html'] = self.raw_html.get_stats()
+        if self.http.archive is not None:
+            total_stats['http_archive'] = self.http.archive.get_stats()
+        total_stats['partial'] = self._deadline.partial
+        total_stats['abandoned'] = self._deadline.abandoned
+        self.last_run_stats = total_stats
+        
+        self._finish_run()
+        total_stats['cache_writes'] = self.cache_writer.get_stats()
         
         # Préparer pour le générateur
         prepared_articles = self._prepare_for_generator(final_articles)
@@ -146,9 +277,15 @@ class EnhancedFullstackScraper:
         
         return prepared_articles
     
-    def scrape_domain_sources(self, domain: str, max_articles: int = 20, use_cache: bool = False) -> List[Dict]:
+    def scrape_domain_sources(self, domain: str, max_articles: int = 20, use_cache: bool = False,
+                              force_poll: bool = False, deadline: RunDeadline = None) -> List[Dict]:
         """Scrape spécifiquement un domaine (compatibilité avec l'ancienne API)"""
-        result = self.scrape_domain(domain, max_articles)
+        with self.run_lock:
+            self._begin_run(force_poll, deadline)
+            result = self.scrape_domain(domain, max_articles)
+            self.last_run_stats = dict(result.get('stats', {}), partial=self._deadline.partial,
+                                       abandoned=self._deadline.abandoned)
+            self._finish_run()
         if result.get('status') == 'success':
             return self._prepare_for_generator(result.get('articles', []))
         return []
@@ -157,12 +294,50 @@ class EnhancedFullstackScraper:
         """Scrape un domaine avec le nouveau système qualité/diversité"""
         try:
             logger.info(f"Starting enhanced scraping for {domain}")
+            started_at = time.perf_counter()
             
-            # 1. Collecter les articles de toutes les sources spécialisées
-            all_articles = self._collect_from_sources(domain)
-            logger.info(f"Collected {len(all_articles)} raw articles for {domain}")
+            # 1-4. Collecter, enrichir, scorer et filtrer les articles des sources spécialisées
+            if self.pipeline_mode == 'streaming' and self.fetch_engine != 'async':
+                pipeline = self._run_streaming_pipeline(domain, started_at)
+            else:
+                pipeline = self._run_stage_pipeline(domain, started_at)
             
-            if not all_articles:
+            # Mémoriser les articles acceptés pour les réhydrater tant que leur entrée ne change pas
+            for article in pipeline['filtered']:
+                self.seen_entries.record_accepted(article, domain)
+            self.seen_entries.record_rehydrated(pipeline['rehydrated'])
+            
+            domain_urls = self.fetch_plan.urls_for_domain(domain)
+            feeds_skipped = self.feed_validators.skipped_count(domain_urls)
+            fetches_saved = self.fetch_plan.domain_bindings_count(domain) - len(domain_urls)
+            feeds_quarantined = self.feed_health.quarantine_skipped_count(domain_urls)
+            feeds_not_due = self.poll_schedule.not_due_count(domain_urls)
+            entries_unchanged = self.seen_entries.unchanged_count(domain_urls)
+            if feeds_skipped:
+                logger.info(f"Skipped {feeds_skipped} unchanged feeds for {domain}")
+            if feeds_quarantined:
+                logger.info(f"Skipped {feeds_quarantined} quarantined feeds for {domain}")
+            if feeds_not_due:
+                logger.info(f"Skipped {feeds_not_due} feeds not due for polling for {domain}")
+            
+            if not pipeline['collected'] and (feeds_skipped or feeds_not_due or entries_unchanged):
+                # Flux ou entrées inchangés depuis le run précédent, ou flux pas encore dus
+                return {
+                    'status': 'success',
+                    'domain': domain,
+                    'articles': [],
+                    'stats': {
+                        'total_collected': 0,
+                        'feeds_skipped_unchanged': feeds_skipped,
+                        'entries_unchanged': entries_unchanged,
+                        'feeds_not_due': feeds_not_due,
+                        'feeds_quarantined': feeds_quarantined,
+                        'feed_fetches_saved': fetches_saved,
+                        'rejections': {}
+                    }
+                }
+            
+            if not pipeline['collected']:
                 return {
                     'status': 'error',
                     'domain': domain,
@@ -170,17 +345,8 @@ class EnhancedFullstackScraper:
                     'articles': []
                 }
             
-            # 2. Enrichir avec le contenu complet en parallèle
-            enriched_articles = self._enrich_articles_parallel(all_articles)
-            logger.info(f"Enriched {len(enriched_articles)} articles with full content")
-            
-            # 3. Scorer chaque article pour la qualité
-            scored_articles = self._score_articles(enriched_articles, domain)
-            logger.info(f"Scored {len(scored_articles)} articles")
-            
-            # 4. Filtrer selon les critères de qualité
-            filtered_articles, rejection_stats = self.content_filter.filter_articles(scored_articles)
-            logger.info(f"Filtered to {len(filtered_articles)} articles. Rejections: {rejection_stats}")
+            filtered_articles = pipeline['filtered']
+            stage_started = time.perf_counter()
             
             # 5. Assurer la diversité technologique
             diverse_articles = self.diversity_manager.ensure_diversity(
@@ -196,18 +362,31 @@ class EnhancedFullstackScraper:
                 key=lambda x: x.get('quality_score', 0), 
                 reverse=True
             )
+            self._record_stage(pipeline, 'select', stage_started)
             
             return {
                 'status': 'success',
                 'domain': domain,
                 'articles': final_articles,
                 'stats': {
-                    'total_collected': len(all_articles),
-                    'after_enrichment': len(enriched_articles),
-                    'after_scoring': len(scored_articles),
+                    'total_collected': pipeline['collected'],
+                    'after_prefilter': pipeline['prefiltered'],
+                    'enrichment_fetches_avoided': pipeline['enrichment_fetches_avoided'],
+                    'after_enrichment': pipeline['enriched'],
+                    'after_scoring': pipeline['scored'],
                     'after_filtering': len(filtered_articles),
                     'final_selection': len(final_articles),
-                    'rejections': rejection_stats
+                    'feeds_skipped_unchanged': feeds_skipped,
+                    'entries_unchanged': entries_unchanged,
+                    'articles_rehydrated': pipeline['rehydrated'],
+                    'feeds_not_due': feeds_not_due,
+                    'feeds_quarantined': feeds_quarantined,
+                    'feed_fetches_saved': fetches_saved,
+                    'first_scored_seconds': pipeline['first_scored_seconds'],
+                    'stage_seconds': pipeline['stage_seconds'],
+                    'pipeline_mode': pipeline['mode'],
+                    'partial': self._deadline.partial,
+                    'rejections': pipeline['rejections']
                 }
             }
             
@@ -220,180 +399,610 @@ class EnhancedFullstackScraper:
                 'articles': []
             }
     
-    def _collect_from_sources(self, domain: str) -> List[Dict]:
-        """Collecte parallèle depuis toutes les sources du domaine"""
-        domain_sources = self.sources.get(domain, {})
-        all_articles = []
+    def _run_stage_pipeline(self, domain: str, started_at: float) -> Dict:
+        """Pipeline par étapes : chaque étape attend que tout le domaine ait terminé la précédente"""
+        pipeline = self._new_pipeline_result('stages')
         
-        if not domain_sources:
-            logger.warning(f"No sources found for domain: {domain}")
-            return []
+        # 1. Collecter les articles de toutes les sources spécialisées
+        stage_started = time.perf_counter()
+        all_articles = self._collect_from_sources(domain)
+        stage_started = self._record_stage(pipeline, 'collect', stage_started)
+        pipeline['collected'] = len(all_articles)
+        logger.info(f"Collected {len(all_articles)} raw articles for {domain}")
+        
+        if not all_articles:
+            return pipeline
+        
+        # 2. Écarter avant l'enrichissement ce qui est rejetable sur le titre et le résumé
+        filter_state = self.content_filter.new_filter_state()
+        candidates = [
+            article for article in all_articles
+            if self._prefilter_article(article, filter_state, pipeline)
+        ]
+        logger.info(f"Pre-filtered to {len(candidates)} articles before enrichment "
+                    f"({pipeline['enrichment_fetches_avoided']} enrichment fetches avoided)")
+        
+        # Articles acceptés lors d'un run précédent : ni enrichis, ni refiltrés (rescorés à la liaison)
+        rehydrated = [article for article in candidates if article.get('rehydrated')]
+        if rehydrated:
+            candidates = [article for article in candidates if not article.get('rehydrated')]
+            pipeline['rehydrated'] = len(rehydrated)
+            logger.info(f"Rehydrated {len(rehydrated)} previously accepted articles for {domain}")
+        stage_started = self._record_stage(pipeline, 'prefilter', stage_started)
         
-        # Aplatir les sources par technologie
-        flat_sources = []
-        for tech, sources in domain_sources.items():
-            for source in sources:
-                source_with_tech = source.copy()
-                source_with_tech['technology'] = tech
-                flat_sources.append(source_with_tech)
+        # 3. Enrichir avec le contenu complet en parallèle
+        enriched_articles = self._enrich_articles_parallel(candidates)
+        stage_started = self._record_stage(pipeline, 'enrich', stage_started)
+        pipeline['enriched'] = len(enriched_articles)
+        logger.info(f"Enriched {len(enriched_articles)} articles with full content")
         
-        logger.info(f"Scraping {len(flat_sources)} sources for {domain}")
+        # 4. Scorer chaque article pour la qualité
+        pipeline['first_scored_seconds'] = round(time.perf_counter() - started_at, 3)
+        scored_articles = self._score_articles(enriched_articles, domain)
+        stage_started = self._record_stage(pipeline, 'score', stage_started)
+        pipeline['scored'] = len(scored_articles)
+        logger.info(f"Scored {len(scored_articles)} articles")
+        
+        # 5. Filtrer selon les critères dépendant du contenu complet
+        pipeline['filtered'] = rehydrated + [
+            article for article in scored_articles
+            if self._postfilter_article(article, filter_state) is None
+        ]
+        self._record_stage(pipeline, 'filter', stage_started)
+        pipeline['rejections'] = filter_state['rejections']
+        logger.info(f"Filtered to {len(pipeline['filtered'])} articles. Rejections: {pipeline['rejections']}")
+        
+        return pipeline
+    
+    def _run_streaming_pipeline(self, domain: str, started_at: float) -> Dict:
+        """
+        Pipeline en flux : chaque article est enrichi, scoré puis filtré dès que son flux répond.
+        Le nombre d'articles en cours est borné (contre-pression sur la collecte) ;
+        seule la sélection de diversité, après ce pipeline, attend tout le domaine.
+        """
+        pipeline = self._new_pipeline_result('streaming')
+        # Le pré-filtrage est fait par ce thread, le post-filtrage par le thread de filtrage
+        prefilter_state = self.content_filter.new_filter_state()
+        
+        urls = self.fetch_plan.urls_for_domain(domain)
+        if not urls:
+            logger.warning(f"No sources found for domain: {domain}")
+            return pipeline
+        
+        logger.info(f"Streaming {len(urls)} unique feeds for {domain} "
+                    f"({self.fetch_plan.domain_bindings_count(domain)} source bindings)")
         
         self._emit_progress({
             'type': 'sources_started',
             'domain': domain,
-            'sources_count': len(flat_sources)
+            'sources_count': len(urls)
         })
         
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_source = {}
-            
-            for source in flat_sources:
-                future = executor.submit(self._scrape_single_source, source)
-                future_to_source[future] = source
+        executor = get_io_executor()
+        queue_size = SCRAPING_CONFIG['pipeline_queue_size']
+        in_flight = threading.BoundedSemaphore(queue_size)
+        scored_queue = queue.Queue(maxsize=queue_size)
+        # Réservations des titres partagées avec le pré-filtrage (articles réhydratés, acceptés)
+        filter_state = self.content_filter.new_filter_state(shared_claims=prefilter_state)
+        
+        # Un seul consommateur pour le post-filtrage : ses compteurs ne sont pas partagés
+        filter_thread = threading.Thread(
+            target=self._filter_stream,
+            args=(domain, scored_queue, in_flight, filter_state, pipeline, started_at),
+            name=f'scrape-filter-{domain}',
+            daemon=True
+        )
+        filter_thread.start()
+        
+        stage_started = time.perf_counter()
+        try:
+            future_to_url = {
+                executor.submit(self._get_feed_articles, url): url
+                for url in urls
+            }
             
+            article_futures = []
+            rehydrated = []
             completed_sources = 0
-            for future in as_completed(future_to_source, timeout=60):
+            for future in completed_within(future_to_url, self._deadline, cap=60, stage='feeds'):
+                url = future_to_url[future]
+                completed_sources += 1
                 try:
-                    source = future_to_source[future]
-                    articles = future.result()
-                    
-                    if articles:
-                        # Ajouter les métadonnées de source
-                        for article in articles:
-                            article['technology'] = source.get('technology', 'general')
-                            article['source_config'] = source
-                        all_articles.extend(articles)
-                    
-                    completed_sources += 1
-                    
-                    self._emit_progress({
-                        'type': 'source_completed',
-                        'domain': domain,
-                        'source_name': source.get('url', 'Unknown'),
-                        'technology': source.get('technology', 'general'),
-                        'articles_found': len(articles) if articles else 0,
-                        'completed_sources': completed_sources,
-                        'total_sources': len(flat_sources)
-                    })
-                    
+                    articles = self._bind_feed_articles(url, future.result(), domain)
                 except Exception as e:
-                    source = future_to_source[future]
-                    logger.error(f"Error scraping {source.get('url', 'Unknown')}: {e}")
-                    completed_sources += 1
-                    
-                    self._emit_progress({
-                        'type': 'source_error',
-                        'domain': domain,
-                        'source_name': source.get('url', 'Unknown'),
-                        'error': str(e),
-                        'completed_sources': completed_sources,
-                        'total_sources': len(flat_sources)
-                    })
+                    logger.error(f"Error scraping {url}: {e}")
+                    self._emit_source_progress(domain, url, None, completed_sources, len(urls), error=str(e))
+                    continue
+                
+                self._emit_source_progress(domain, url, articles, completed_sources, len(urls))
+                
+                candidates = []
+                for article in articles:
+                    pipeline['collected'] += 1
+                    if not self._prefilter_article(article, prefilter_state, pipeline):
+                        continue
+                    if article.get('rehydrated'):
+                        # Accepté lors d'un run précédent : directement retenu
+                        rehydrated.append(article)
+                        continue
+                    candidates.append(article)
+                
+                # Cache consulté une fois par flux plutôt qu'une fois par article
+                cached_contents = self._load_enriched_cache([
+                    article['url'] for article in candidates if not self._is_too_old_for_enrichment(article)
+                ])
+                for article in candidates:
+                    # Bloque tant que les étapes suivantes sont saturées (jamais au-delà de l'échéance)
+                    if not in_flight.acquire(timeout=self._deadline.remaining()):
+                        self._deadline.record_abandoned('articles', 1)
+                        continue
+                    article_futures.append(executor.submit(
+                        self._stream_article, article, domain, scored_queue, cached_contents.get(article['url'])
+                    ))
+            # Étapes simultanées : collecte (jusqu'au dernier flux), puis fin du traitement des articles en vol
+            stage_started = self._record_stage(pipeline, 'collect', stage_started)
+            
+            for future in completed_within(article_futures, self._deadline, cap=180, stage='articles'):
+                future.result()
+        finally:
+            scored_queue.put(None)
+            filter_thread.join()
+        self._record_stage(pipeline, 'drain', stage_started)
         
-        return all_articles
+        pipeline['filtered'].extend(rehydrated)
+        pipeline['rehydrated'] = len(rehydrated)
+        
+        for reason, count in prefilter_state['rejections'].items():
+            pipeline['rejections'][reason] = pipeline['rejections'].get(reason, 0) + count
+        
+        logger.info(f"Streamed {pipeline['collected']} articles for {domain}: {len(pipeline['filtered'])} kept, "
+                    f"{pipeline['enrichment_fetches_avoided']} enrichment fetches avoided. "
+                    f"Rejections: {pipeline['rejections']}")
+        
+        return pipeline
+    
+    def _stream_article(self, article: Dict, domain: str, scored_queue: queue.Queue,
+                        cached_content: Optional[Dict] = None) -> None:
+        """Enrichit (ou reprend du cache préchargé) et score un article collecté, puis le transmet au filtrage"""
+        try:
+            if self._skip_enrichment_if_too_old(article):
+                pass
+            elif cached_content:
+                self._apply_cached_content(article, cached_content)
+            else:
+                article = self._enrich_single_article(article, check_cache=False) or article
+            self._score_article(article, domain)
+            
+            self._emit_progress({
+                'type': 'article_progress',
+                'domain': domain,
+                'stage': 'scored',
+                'title': article.get('title', '')[:100],
+                'extraction_quality': article.get('extraction_quality'),
+                'quality_score': article.get('quality_score', 0)
+            })
+        finally:
+            scored_queue.put(article)
+    
+    def _filter_stream(self, domain: str, scored_queue: queue.Queue, in_flight: threading.BoundedSemaphore,
+                       filter_state: Dict, pipeline: Dict, started_at: float) -> None:
+        """Étape de filtrage du pipeline en flux"""
+        while True:
+            article = scored_queue.get()
+            if article is None:
+                break
+            
+            try:
+                pipeline['enriched'] += 1
+                pipeline['scored'] += 1
+                if pipeline['first_scored_seconds'] is None:
+                    pipeline['first_scored_seconds'] = round(time.perf_counter() - started_at, 3)
+                
+                rejection_reason = self._postfilter_article(article, filter_state)
+                if rejection_reason is None:
+                    pipeline['filtered'].append(article)
+                
+                self._emit_progress({
+                    'type': 'article_progress',
+                    'domain': domain,
+                    'stage': 'filtered',
+                    'title': article.get('title', '')[:100],
+                    'accepted': rejection_reason is None,
+                    'rejection_reason': rejection_reason,
+                    'processed_articles': pipeline['scored'],
+                    'collected_articles': pipeline['collected']
+                })
+            except Exception as e:
+                logger.debug(f"Error filtering article {article.get('title', 'Unknown')}: {e}")
+            finally:
+                in_flight.release()
+        
+        pipeline['rejections'] = dict(filter_state['rejections'])
+    
+    def _prefilter_article(self, article: Dict, filter_state: Dict, pipeline: Dict) -> bool:
+        """Pré-filtre un article collecté ; retourne True s'il doit être enrichi (ou, réhydraté, retenu)"""
+        reason = self.content_filter.prefilter_article(article, filter_state)
+        if reason is None and article.get('rehydrated'):
+            # Accepté lors d'un run précédent, sans post-filtrage : son titre est réservé dès maintenant
+            reason = self.content_filter.claim_article(article, filter_state)
+        if reason is None:
+            pipeline['prefiltered'] += 1
+            return True
+        
+        # Les articles trop anciens ou réhydratés n'auraient pas été téléchargés de toute façon
+        if not article.get('rehydrated') and not self._is_too_old_for_enrichment(article):
+            pipeline['enrichment_fetches_avoided'] += 1
+        return False
+    
+    def _postfilter_article(self, article: Dict, filter_state: Dict) -> Optional[str]:
+        """Post-filtre un article enrichi et scoré ; son entrée, tranchée, pourra être persistée dans l'index"""
+        reason = self.content_filter.postfilter_article(article, filter_state)
+        self.seen_entries.record_decided(article, failed=article.get('extraction_quality') == 'error')
+        return reason
+    
+    def _new_pipeline_result(self, mode: str) -> Dict:
+        return {
+            'mode': mode,
+            'collected': 0,
+            'enriched': 0,
+            'scored': 0,
+            'prefiltered': 0,
+            'filtered': [],
+            'rejections': {},
+            'enrichment_fetches_avoided': 0,
+            'rehydrated': 0,
+            'first_scored_seconds': None,
+            'stage_seconds': {}
+        }
+    
+    @staticmethod
+    def _record_stage(pipeline: Dict, stage: str, stage_started: float) -> float:
+        """Enregistre la durée d'une étape du pipeline ; retourne le début de l'étape suivante"""
+        now = time.perf_counter()
+        pipeline['stage_seconds'][stage] = round(now - stage_started, 3)
+        return now
+    
+    def _begin_run(self, force_poll: bool = False, deadline: RunDeadline = None) -> None:
+        """Prépare un run de scraping (nettoyage du cache, chargement des états persistés)"""
+        # L'échéance court dès le début du run, chargement des états compris
+        self._deadline = deadline or RunDeadline(SCRAPING_CONFIG['run_deadline_seconds'])
+        
+        # Nettoyer le cache expiré
+        self.db.clear_expired_cache()
+        self.db.clear_expired_enriched_cache()
+        if self.seen_entries.enabled:
+            self.db.clear_expired_seen_entries(self.seen_entries.retention_days)
+        
+        self.feed_validators.load()
+        self.feed_health.load()
+        self.poll_schedule.load()
+        self.seen_entries.load()
+        self.raw_html.load()
+        if self.raw_html_offline:
+            logger.info(f"Offline enrichment: article content extracted from {len(self.raw_html.urls())} locally stored pages only")
+        # Enregistrement d'une archive HTTP : tout est téléchargé (ni requêtes conditionnelles, ni flux ou
+        # entrées ignorés comme inchangés, ni caches de contenu) pour qu'elle se rejoue sur une machine sans données
+        self._recording = self.http.archive is not None and self.http.archive.recording
+        self._force_poll = force_poll or self._recording
+        self._http_stats_at_start = self.http.get_stats()
+        if self.http.archive is not None and self.http.archive.replaying:
+            # Chaque run rejoué repart des premières réponses enregistrées
+            self.http.archive.rewind()
+        
+        with self._feed_results_lock:
+            self._feed_results = {}
+        
+        with self._download_stats_lock:
+            self._download_stats = self._new_download_stats()
+    
+    def _finish_run(self) -> None:
+        """Persiste les états accumulés pendant le run"""
+        if self._deadline.partial:
+            # Entrées abandonnées à l'échéance, non persistées : leurs flux sont relus en entier au run suivant
+            self.feed_validators.discard()
+            self.poll_schedule.discard()
+        else:
+            self.feed_validators.flush()
+            self.poll_schedule.flush()
+        self.feed_health.flush()
+        self.seen_entries.flush(partial=self._deadline.partial)
+        self.raw_html.flush()
+        self.cache_writer.flush(timeout=CACHE_FLUSH_TIMEOUT_SECONDS)
+        if self.http.archive is not None:
+            self.http.archive.flush()
+    
+    @staticmethod
+    def _new_download_stats() -> Dict[str, int]:
+        return {
+            'pages_downloaded': 0,
+            'bytes_downloaded': 0,
+            'cache_hits': 0,
+            'truncated': 0,
+            'rejected_content_type': 0,
+            'rejected_too_large': 0
+        }
     
-    def _scrape_single_source(self, source_config: Dict) -> List[Dict]:
-        """Scrape une source individuelle avec retry"""
-        url = source_config.get('url')
-        if not url:
+    def _record_download(self, body: Optional[bytes] = None, truncated: bool = False, rejected: str = None,
+                         cached: bool = False) -> None:
+        """Compteurs de téléchargement des pages d'articles pour le run (cached : contenu déjà extrait en cache)"""
+        with self._download_stats_lock:
+            if cached:
+                self._download_stats['cache_hits'] += 1
+                return
+            if rejected:
+                self._download_stats[f'rejected_{rejected}'] += 1
+                return
+            self._download_stats['pages_downloaded'] += 1
+            self._download_stats['bytes_downloaded'] += len(body or b'')
+            self._download_stats['truncated'] += int(truncated)
+    
+    def _http_stats_since_start(self) -> Dict[str, int]:
+        """Connexions ouvertes et réutilisées depuis le début du run"""
+        current = self.http.get_stats()
+        return {
+            key: current.get(key, 0) - self._http_stats_at_start.get(key, 0)
+            for key in ('connections_opened', 'requests', 'connections_reused')
+        }
+    
+    @property
+    def fetch_plan(self) -> FetchPlan:
+        """Plan de fetch compilé une fois pour la configuration de sources courante"""
+        if self._fetch_plan is None or self._fetch_plan_sources is not self.sources:
+            self._fetch_plan = compile_fetch_plan(self.sources)
+            self._fetch_plan_sources = self.sources
+            logger.info(f"Fetch plan compiled: {len(self._fetch_plan.unique_urls)} unique feeds for "
+                        f"{self._fetch_plan.total_bindings} source bindings")
+        return self._fetch_plan
+    
+    def _collect_from_sources(self, domain: str) -> List[Dict]:
+        """Collecte parallèle depuis toutes les sources du domaine (une requête par URL unique)"""
+        all_articles = []
+        
+        urls = self.fetch_plan.urls_for_domain(domain)
+        if not urls:
+            logger.warning(f"No sources found for domain: {domain}")
             return []
         
-        for attempt in range(self.max_retries):
+        logger.info(f"Scraping {len(urls)} unique feeds for {domain} "
+                    f"({self.fetch_plan.domain_bindings_count(domain)} source bindings)")
+        
+        self._emit_progress({
+            'type': 'sources_started',
+            'domain': domain,
+            'sources_count': len(urls)
+        })
+        
+        if self.fetch_engine == 'async':
+            return self._collect_from_sources_async(domain, urls)
+        
+        # Pool réseau partagé entre les domaines : la concurrence est bornée globalement
+        executor = get_io_executor()
+        future_to_url = {
+            executor.submit(self._get_feed_articles, url): url
+            for url in urls
+        }
+        
+        completed_sources = 0
+        for future in completed_within(future_to_url, self._deadline, cap=60, stage='feeds'):
+            url = future_to_url[future]
             try:
-                response = requests.get(
-                    url, 
-                    headers=self.headers, 
-                    timeout=self.request_timeout
-                )
-                response.raise_for_status()
+                # Distribuer les entrées du flux à chaque liaison du domaine
+                articles = self._bind_feed_articles(url, future.result(), domain)
+                all_articles.extend(articles)
                 
-                feed = feedparser.parse(response.content)
-                if not hasattr(feed, 'entries') or not feed.entries:
-                    return []
+                completed_sources += 1
+                self._emit_source_progress(domain, url, articles, completed_sources, len(urls))
                 
-                articles = []
-                # Prendre plus d'articles par source pour avoir plus de choix
-                # Ajuster selon le poids de la source (sources prioritaires = plus d'articles)
-                source_weight = source_config.get('weight', 7)
-                max_articles_from_source = 5 if source_weight < 8 else 10 if source_weight < 9 else 15
+            except Exception as e:
+                logger.error(f"Error scraping {url}: {e}")
+                completed_sources += 1
+                self._emit_source_progress(domain, url, None, completed_sources, len(urls), error=str(e))
+        
+        return all_articles
+    
+    def _collect_from_sources_async(self, domain: str, urls: List[str]) -> List[Dict]:
+        """Collecte des sources du domaine avec le moteur asyncio"""
+        all_articles = []
+        completed = {'sources': 0}
+        
+        # Les flux déjà récupérés pendant ce run (autre domaine) ne sont pas refetchés
+        owned = self._claim_feed_urls(urls)
+        for url in list(owned):
+            skip_reason = self._feed_skip_reason(url)
+            if skip_reason:
+                owned.pop(url).set_result(self._skipped_without_request(url, skip_reason))
+        
+        requests_to_run = [
+            FetchRequest(
+                url=url,
+                headers=self._get_feed_headers(url),
+                timeout=self._deadline.request_timeout(self.request_timeout)
+            )
+            for url in owned
+        ]
+        
+        def process(result):
+            if result.error or result.status >= 400:
+                return None
+            # Même chemin de parsing que le moteur à threads
+            return self._process_feed_response(result.request.url, result.status, result.body, result.headers)
+        
+        def on_done(result, feed_articles):
+            url = result.request.url
+            owned[url].set_result(feed_articles or [])
+            completed['sources'] += 1
+            
+            if result.error or result.status >= 400:
+                error = result.error or f"HTTP {result.status}"
+                logger.error(f"Failed to scrape {url} after {self.max_retries} attempts: {error}")
+                self.feed_health.record_failure(url, error)
+                self._emit_source_progress(domain, url, None, completed['sources'], len(urls), error=error)
+            else:
+                self.feed_health.record_success(url)
+                articles = self._bind_feed_articles(url, feed_articles or [], domain)
+                self._emit_source_progress(domain, url, articles, completed['sources'], len(urls))
+        
+        engine = self._get_async_engine(self.max_retries)
+        try:
+            engine.run(requests_to_run, process, on_done, timeout=self._deadline.remaining(60))
+            self._deadline.record_abandoned('feeds', len(engine.abandoned))
+        finally:
+            # Ne jamais laisser un flux réservé sans résultat
+            for future in owned.values():
+                if not future.done():
+                    future.set_result([])
+        
+        for url in urls:
+            all_articles.extend(self._bind_feed_articles(url, self._feed_results[url].result(), domain))
+        
+        return all_articles
+    
+    def _get_async_engine(self, max_retries: int) -> AsyncFetchEngine:
+        return AsyncFetchEngine(
+            max_in_flight=SCRAPING_CONFIG['async_max_in_flight'],
+            per_host_limit=SCRAPING_CONFIG['async_per_host_limit'],
+            max_retries=max_retries,
+            archive=self.http.archive
+        )
+    
+    def _emit_source_progress(self, domain: str, url: str, articles: Optional[List[Dict]],
+                              completed_sources: int, total_sources: int, error: str = None) -> None:
+        """Émet la progression d'une source terminée ou en erreur"""
+        if error:
+            self._emit_progress({
+                'type': 'source_error',
+                'domain': domain,
+                'source_name': url,
+                'error': error,
+                'completed_sources': completed_sources,
+                'total_sources': total_sources
+            })
+            return
+        
+        technologies = sorted({binding.technology for binding in self.fetch_plan.bindings_for(url, domain)})
+        self._emit_progress({
+            'type': 'source_completed',
+            'domain': domain,
+            'source_name': url,
+            'technology': ', '.join(technologies) or 'general',
+            'articles_found': len(articles) if articles else 0,
+            'unchanged': self.feed_validators.skip_reason(url) is not None,
+            'completed_sources': completed_sources,
+            'total_sources': total_sources
+        })
+    
+    def _claim_feed_urls(self, urls: List[str]) -> Dict[str, Future]:
+        """Réserve les flux pas encore récupérés ce run ; retourne ceux que l'appelant doit fetcher"""
+        owned = {}
+        with self._feed_results_lock:
+            for url in urls:
+                if url not in self._feed_results:
+                    owned[url] = self._feed_results[url] = Future()
+        return owned
+    
+    def _get_feed_articles(self, url: str) -> List[Tuple[int, Dict]]:
+        """Entrées d'un flux, téléchargé au plus une fois par run"""
+        owned = self._claim_feed_urls([url])
+        if url in owned:
+            try:
+                owned[url].set_result(self._fetch_feed_articles(url))
+            except Exception as e:
+                owned[url].set_exception(e)
+        
+        # Flux récupéré par un autre domaine : on ne l'attend pas au-delà de l'échéance
+        return self._feed_results[url].result(timeout=self._deadline.remaining())
+    
+    def _bind_feed_articles(self, url: str, feed_articles: List[Tuple[int, Dict]], domain: str) -> List[Dict]:
+        """Copie les entrées d'un flux pour chaque liaison (technologie, poids, focus) du domaine"""
+        articles = []
+        
+        for binding in self.fetch_plan.bindings_for(url, domain):
+            source_config = binding.source_config()
+            for entry_index, feed_article in feed_articles:
+                if entry_index >= binding.max_entries:
+                    continue
                 
-                for entry in feed.entries[:max_articles_from_source]:
-                    try:
-                        # Valider l'entrée
-                        if not entry.get('title') or not entry.get('link'):
-                            continue
-                        
-                        article = {
-                            'title': entry.get('title', '').strip(),
-                            'url': entry.get('link', ''),
-                            'source': source_config.get('url', 'Unknown'),
-                            'source_name': source_config.get('type', 'Unknown'),
-                            'published_parsed': entry.get('published_parsed'),
-                            'summary': self._clean_text(
-                                self._remove_html_tags(entry.get('summary', ''))
-                            )[:800],
-                            'content': '',  # Sera enrichi plus tard
-                            'scraped_at': datetime.now(),
-                            'tags': []
-                        }
-                        
-                        # Extraire les tags si disponibles
-                        if hasattr(entry, 'tags'):
-                            article['tags'] = [
-                                tag.term for tag in entry.tags 
-                                if hasattr(tag, 'term')
-                            ][:5]
-                        
-                        # Parser la date de publication avec fallback sur différents champs
-                        parsed_date = None
-                        
-                        # Essayer dans l'ordre de préférence : published_parsed, updated_parsed, puis les champs string
-                        date_fields = [
-                            ('published_parsed', 'parsed'),
-                            ('updated_parsed', 'parsed'), 
-                            ('published', 'string'),
-                            ('updated', 'string'),
-                            ('date', 'string')
-                        ]
-                        
-                        for field_name, field_type in date_fields:
-                            if entry.get(field_name):
-                                try:
-                                    if field_type == 'parsed' and entry.get(field_name):
-                                        parsed_date = datetime(*entry[field_name][:6])
-                                        break
-                                    elif field_type == 'string' and entry.get(field_name):
-                                        from dateutil import parser as date_parser
-                                        parsed_date = date_parser.parse(entry[field_name])
-                                        break
-                                except (TypeError, ValueError, Exception) as e:
-                                    logger.debug(f"Failed to parse {field_name} for {entry.get('title', 'unknown')[:30]}: {e}")
-                                    continue
-                        
-                        if parsed_date:
-                            article['published'] = parsed_date
-                        else:
-                            # Tentative d'extraction de date depuis l'URL ou le contenu
-                            extracted_date = self._extract_date_from_url_or_content(entry)
-                            if extracted_date:
-                                article['published'] = extracted_date
-                                logger.debug(f"Extracted date from URL/content for {entry.get('title', 'unknown')[:50]}: {extracted_date}")
-                            else:
-                                logger.warning(f"No valid date found for {entry.get('title', 'unknown')[:50]} - skipping article")
-                                continue  # Ignorer l'article si aucune date valide n'est trouvée
-                        
-                        articles.append(article)
-                        
-                    except Exception as e:
-                        logger.debug(f"Error parsing entry from {url}: {e}")
+                if 'accepted_by_domain' in feed_article:
+                    # Entrée inchangée : seul l'article accepté pour ce domaine et cette technologie est repris
+                    stored = feed_article['accepted_by_domain'].get(domain)
+                    if not stored or stored.get('technology') != binding.technology:
                         continue
+                    article = dict(stored, entry_key=feed_article['entry_key'], rehydrated=True)
+                    article['source_config'] = source_config
+                    # Rescoré (sans téléchargement) : la fraîcheur décroît d'un run à l'autre
+                    articles.append(self._score_article(article, domain))
+                    continue
                 
-                return articles
+                article = feed_article.copy()
+                article['tags'] = list(feed_article.get('tags', []))
+                article['source_name'] = source_config.get('type', 'Unknown')
+                article['technology'] = binding.technology
+                article['source_config'] = source_config
+                articles.append(article)
+        
+        return articles
+    
+    def _feed_skip_reason(self, url: str) -> Optional[str]:
+        """Flux ignorés sans requête : en quarantaine, ou pas encore dus d'après leur cadence de publication"""
+        if self.feed_health.is_quarantined(url):
+            self.feed_health.record_quarantine_skip(url)
+            logger.debug(f"Skipping quarantined feed: {url}")
+            return 'quarantined'
+        
+        if self.adaptive_polling and self._can_skip_feeds() and not self.poll_schedule.is_due(url):
+            self.poll_schedule.record_not_due(url)
+            logger.debug(f"Skipping feed not due yet: {url}")
+            return 'not_due'
+        
+        return None
+    
+    def _skipped_without_request(self, url: str, skip_reason: str) -> List[Tuple[int, Dict]]:
+        """
+        Entrées d'un flux ignoré sans requête : un flux pas encore dû garde ses articles déjà acceptés
+        (le polling suit la cadence de publication sans retirer ce que le flux a apporté)
+        """
+        if skip_reason == 'not_due':
+            return self._skipped_feed_articles(url)
+        return []
+    
+    def _fetch_feed_articles(self, url: str) -> List[Tuple[int, Dict]]:
+        """Télécharge et parse un flux avec retry"""
+        skip_reason = self._feed_skip_reason(url)
+        if skip_reason:
+            return self._skipped_without_request(url, skip_reason)
+        
+        for attempt in range(self.max_retries):
+            if self._deadline.expired():
+                logger.debug(f"Deadline reached, not fetching {url}")
+                return []
+            try:
+                response = self.http.get(
+                    url,
+                    headers=self._get_feed_headers(url),
+                    timeout=self._deadline.request_timeout(self.request_timeout)
+                )
+                if response.status_code != 304:
+                    response.raise_for_status()
                 
+                feed_articles = self._process_feed_response(
+                    url,
+                    response.status_code,
+                    response.content,
+                    response.headers
+                )
+                self.feed_health.record_success(url)
+                return feed_articles
+            
+            except CircuitOpenError as e:
+                # Host connu comme défaillant : ni retry ni attente
+                logger.warning(f"Skipping {url}: {e}")
+                self.feed_health.record_failure(url, str(e))
+                return []
+            
             except Exception as e:
                 if attempt == self.max_retries - 1:
                     logger.error(f"Failed to scrape {url} after {self.max_retries} attempts: {e}")
+                    self.feed_health.record_failure(url, str(e))
                     return []
                 else:
                     logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
@@ -401,68 +1010,145 @@ class EnhancedFullstackScraper:
         
         return []
     
-    def _extract_date_from_url_or_content(self, entry: Dict) -> Optional[datetime]:
-        """Extrait une date à partir de l'URL ou du contenu de l'entrée RSS"""
-        import re
-        from dateutil import parser as date_parser
-        
-        # Patterns de dates couramment trouvés dans les URLs
-        date_patterns = [
-            r'/(\d{4})/(\d{1,2})/(\d{1,2})/',  # /2025/07/10/
-            r'/(\d{4})-(\d{1,2})-(\d{1,2})/',  # /2025-07-10/
-            r'(\d{4})(\d{2})(\d{2})',          # 20250710
-            r'(\d{4})/(\d{1,2})/',             # /2025/07/
+    def _can_skip_feeds(self) -> bool:
+        """
+        Un flux n'est ignoré sans être relu (304, corps ou date inchangés, flux pas encore dû) que hors relecture
+        forcée, et si les articles qu'il apporte peuvent être servis sans le relire : ils sont réhydratés depuis
+        l'index des entrées vues. Index désactivé, les flux sont toujours requêtés et reparsés.
+        """
+        return not self._force_poll and self.seen_entries.enabled
+    
+    def _get_feed_headers(self, url: str) -> Dict[str, str]:
+        """Headers de requête d'un flux, conditionnels si on a des validateurs du run précédent et qu'il peut être ignoré"""
+        headers = dict(self.headers)
+        if self._can_skip_feeds():
+            headers.update(self.feed_validators.conditional_headers(url))
+        return headers
+    
+    def _process_feed_response(self, url: str, status_code: int, content: bytes, headers) -> List[Tuple[int, Dict]]:
+        """Traite la réponse d'un flux (validateurs, parsing) indépendamment du moteur de fetch"""
+        if status_code == 304:
+            self.feed_validators.record_skip(url, 'not_modified')
+            self.poll_schedule.record_poll(url, [])
+            logger.debug(f"Feed not modified (304): {url}")
+            return self._skipped_feed_articles(url)
+        
+        # Ignorer le parsing si le corps ou la date du flux n'ont pas changé
+        content_hash = compute_content_hash(content)
+        feed_updated = extract_feed_updated(content)
+        unchanged_reason = None
+        if self._can_skip_feeds():
+            unchanged_reason = self.feed_validators.unchanged_reason(url, content_hash, feed_updated)
+        
+        self.feed_validators.update(
+            url,
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified'),
+            content_hash=content_hash,
+            feed_updated=feed_updated
+        )
+        
+        if unchanged_reason:
+            self.feed_validators.record_skip(url, unchanged_reason)
+            self.poll_schedule.record_poll(url, [])
+            logger.debug(f"Feed unchanged ({unchanged_reason}): {url}")
+            return self._skipped_feed_articles(url)
+        
+        # Parsing dans le pool de processus, arrêté après les entrées utiles : seules les entrées compactes reviennent
+        max_entries = self.fetch_plan.max_entries(url)
+        entries = run_cpu_task(parse_feed_entries, content, max_entries, self.feed_reader)
+        if not entries:
+            self.poll_schedule.record_poll(url, [])
+            return []
+        
+        # Cadence de publication observée sur les entrées les plus récentes du flux
+        self.poll_schedule.record_poll(url, entry_dates_from_feed(entries))
+        
+        return self._build_articles_from_entries(entries, url, max_entries)
+    
+    def _skipped_feed_articles(self, url: str) -> List[Tuple[int, Dict]]:
+        """
+        Flux non relu : articles acceptés lors des runs précédents pour ses entrées, réhydratés par domaine
+        à la liaison. Sans eux, le flux n'apporterait plus rien tant qu'aucune de ses entrées ne change.
+        """
+        stored = self.seen_entries.accepted_articles_for_feed(url)
+        if not stored:
+            return []
+        
+        # Position dans le flux inconnue : les plus récents d'abord, pour le plafond d'entrées des liaisons
+        def newest(item):
+            return max((article.get('published') or datetime.min for article in item[1].values()), default=datetime.min)
+        
+        ordered = sorted(stored.items(), key=newest, reverse=True)
+        logger.debug(f"{len(ordered)} previously accepted entries to rehydrate from skipped feed: {url}")
+        return [
+            (entry_index, {'entry_key': entry_key, 'accepted_by_domain': by_domain})
+            for entry_index, (entry_key, by_domain) in enumerate(ordered)
         ]
+    
+    def _build_articles_from_entries(self, entries: List, url: str, max_entries: int) -> List[Tuple[int, Dict]]:
+        """Construit les articles (indépendants des liaisons) à partir des entrées parsées d'un flux"""
         
-        # Chercher dans l'URL
-        url = entry.get('link', '') or entry.get('id', '')
-        if url:
-            for pattern in date_patterns:
-                match = re.search(pattern, url)
-                if match:
-                    try:
-                        if len(match.groups()) == 3:
-                            year, month, day = match.groups()
-                            date = datetime(int(year), int(month), int(day))
-                        elif len(match.groups()) == 2:
-                            year, month = match.groups()
-                            date = datetime(int(year), int(month), 1)  # Premier du mois
-                        else:
-                            continue
-                            
-                        # Vérifier que la date est raisonnable (pas dans le futur, pas trop ancienne)
-                        now = datetime.now()
-                        if date <= now and date >= datetime(2020, 1, 1):
-                            return date
-                    except (ValueError, TypeError):
+        articles = []
+        unchanged = []
+        use_seen_index = self.seen_entries.enabled
+        # Le nombre d'entrées dépend du poids maximal des sources qui référencent ce flux
+        for entry_index, entry in enumerate(entries[:max_entries]):
+            try:
+                # Valider l'entrée
+                if not entry.get('title') or not entry.get('link'):
+                    continue
+                
+                # Entrée déjà traitée et inchangée : pas de reconstruction (sauf rafraîchissement forcé)
+                entry_key = None
+                if use_seen_index:
+                    entry_key, _, is_unchanged = self.seen_entries.classify(url, entry)
+                    if is_unchanged and not self._force_poll:
+                        unchanged.append((entry_index, entry_key))
                         continue
+                
+                article = {
+                    'title': entry.get('title', '').strip(),
+                    'url': entry.get('link', ''),
+                    'source': url,
+                    'published_parsed': entry.get('published_parsed'),
+                    # Nettoyé une seule fois ici : les étapes suivantes réutilisent ce résumé
+                    'summary': clean_summary(entry.get('summary', ''))[:800],
+                    'content': '',  # Sera enrichi plus tard
+                    'scraped_at': datetime.now(),
+                    'tags': [],
+                    'entry_key': entry_key
+                }
+                
+                # Extraire les tags si disponibles
+                if entry.get('tags'):
+                    article['tags'] = [
+                        tag['term'] for tag in entry['tags'] 
+                        if tag.get('term')
+                    ][:5]
+                
+                # Date du flux, sinon devinée depuis l'URL ou le titre (UTC naïf)
+                published = resolve_entry_date(entry)
+                if not published:
+                    logger.warning(f"No valid date found for {entry.get('title', 'unknown')[:50]} - skipping article")
+                    continue  # Ignorer l'article si aucune date valide n'est trouvée
+                article['published'] = published
+                
+                articles.append((entry_index, article))
+            
+            except Exception as e:
+                logger.debug(f"Error parsing entry from {url}: {e}")
+                continue
         
-        # Chercher dans le titre
-        title = entry.get('title', '')
-        if title:
-            # Pattern pour dates dans le titre
-            title_patterns = [
-                r'(\d{1,2})/(\d{1,2})/(\d{4})',    # 07/10/2025
-                r'(\d{4})-(\d{1,2})-(\d{1,2})',    # 2025-07-10
-                r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})',
-                r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),?\s+(\d{4})',
-            ]
-            
-            for pattern in title_patterns:
-                match = re.search(pattern, title, re.IGNORECASE)
-                if match:
-                    try:
-                        date_str = match.group(0)
-                        date = date_parser.parse(date_str)
-                        
-                        # Vérifier que la date est raisonnable
-                        now = datetime.now()
-                        if date <= now and date >= datetime(2020, 1, 1):
-                            return date
-                    except (ValueError, TypeError):
-                        continue
+        if unchanged:
+            # Articles acceptés lors d'un run précédent, réhydratés par domaine à la liaison
+            stored = self.seen_entries.accepted_articles([entry_key for _, entry_key in unchanged])
+            for entry_index, entry_key in unchanged:
+                if entry_key in stored:
+                    articles.append((entry_index, {'entry_key': entry_key, 'accepted_by_domain': stored[entry_key]}))
+            logger.debug(f"{len(unchanged)} entries unchanged since last run ({len(stored)} to rehydrate): {url}")
         
-        return None
+        return articles
     
     def _enrich_articles_parallel(self, articles: List[Dict]) -> List[Dict]:
         """Enrichit les articles avec le contenu complet en parallèle"""
@@ -470,37 +1156,15 @@ class EnhancedFullstackScraper:
             return []
         
         # Filtrer les articles trop anciens avant l'enrichissement
-        max_age_days = 30  # Ne pas enrichir les articles de plus de 30 jours
-        cutoff_date = datetime.now() - timedelta(days=max_age_days)
-        
         recent_articles = []
         for article in articles:
-            published_date = article.get('published')
-            if published_date and isinstance(published_date, datetime):
-                if published_date >= cutoff_date:
-                    recent_articles.append(article)
-                else:
-                    # Article trop ancien, on garde juste le summary
-                    article['content'] = article.get('summary', '')
-                    article['extraction_quality'] = 'too_old'
-                    article['skipped_enrichment'] = True
-                    recent_articles.append(article)
-            else:
-                # Pas de date, on enrichit par précaution
-                recent_articles.append(article)
-        
-        # Pré-charger le cache pour éviter les accès concurrents
-        cache_keys = [article['url'] for article in recent_articles if not article.get('skipped_enrichment')]
-        cached_contents = {}
+            self._skip_enrichment_if_too_old(article)
+            recent_articles.append(article)
         
-        try:
-            # Charger tout le cache en une fois
-            for url in cache_keys:
-                cached = self.db.get_enriched_content_from_cache(url)
-                if cached:
-                    cached_contents[url] = cached
-        except Exception as e:
-            logger.debug(f"Error pre-loading cache: {e}")
+        # Pré-charger le cache en une requête : les threads d'enrichissement ne le relisent pas
+        cached_contents = self._load_enriched_cache(
+            [article['url'] for article in recent_articles if not article.get('skipped_enrichment')]
+        )
         
         # Séparer les articles à enrichir de ceux déjà traités
         to_enrich = []
@@ -511,10 +1175,7 @@ class EnhancedFullstackScraper:
                 already_processed.append(article)
             elif article['url'] in cached_contents:
                 # Article déjà en cache
-                cached = cached_contents[article['url']]
-                article['content'] = cached['content']
-                article['extraction_quality'] = cached['extraction_quality']
-                article['from_cache'] = True
+                self._apply_cached_content(article, cached_contents[article['url']])
                 already_processed.append(article)
             else:
                 # Article à enrichir
@@ -525,79 +1186,139 @@ class EnhancedFullstackScraper:
         enriched = already_processed.copy()
         
         # Traitement en parallèle pour l'extraction de contenu (seulement les non-cachés)
-        if to_enrich:
-            with ThreadPoolExecutor(max_workers=8) as executor:
-                future_to_article = {
-                    executor.submit(self._enrich_single_article, article): article 
-                    for article in to_enrich
-                }
-                
-                for future in as_completed(future_to_article, timeout=180):
-                    try:
-                        enriched_article = future.result()
-                        if enriched_article:
-                            enriched.append(enriched_article)
-                    except Exception as e:
-                        article = future_to_article[future]
-                        logger.debug(f"Error enriching article {article.get('title', 'Unknown')}: {e}")
-                        # Ajouter l'article sans enrichissement
-                        article['content'] = article.get('summary', '')
-                        article['extraction_quality'] = 'error'
-                        enriched.append(article)
+        if to_enrich and self.fetch_engine == 'async':
+            enriched.extend(self._enrich_articles_async(to_enrich))
+        elif to_enrich:
+            executor = get_io_executor()
+            future_to_article = {
+                executor.submit(self._enrich_single_article, article, False): article 
+                for article in to_enrich
+            }
+            
+            for future in completed_within(future_to_article, self._deadline, cap=180, stage='articles'):
+                try:
+                    enriched_article = future.result()
+                    if enriched_article:
+                        enriched.append(enriched_article)
+                except Exception as e:
+                    article = future_to_article[future]
+                    logger.debug(f"Error enriching article {article.get('title', 'Unknown')}: {e}")
+                    # Ajouter l'article sans enrichissement
+                    article['content'] = article.get('summary', '')
+                    article['extraction_quality'] = 'error'
+                    enriched.append(article)
         
         return enriched
     
-    def _enrich_single_article(self, article: Dict) -> Optional[Dict]:
-        """Enrichit un article individuel avec cache"""
+    def _is_too_old_for_enrichment(self, article: Dict) -> bool:
+        max_age_days = 30  # Ne pas enrichir les articles de plus de 30 jours
+        
+        # Pas de date : on enrichit par précaution
+        age = article_age(article)
+        return bool(age and age > timedelta(days=max_age_days))
+    
+    def _skip_enrichment_if_too_old(self, article: Dict) -> bool:
+        """Marque les articles trop anciens pour être enrichis ; retourne True si l'article est ignoré"""
+        if self._is_too_old_for_enrichment(article):
+            # Article trop ancien, on garde juste le summary
+            article['content'] = article.get('summary', '')
+            article['extraction_quality'] = 'too_old'
+            article['skipped_enrichment'] = True
+            return True
+        
+        return False
+    
+    def _enrich_articles_async(self, articles: List[Dict]) -> List[Dict]:
+        """Télécharge et extrait le contenu des articles avec le moteur asyncio"""
+        # Pages déjà stockées localement : extraites sans requête
+        local_contents = {}
+        for article in articles:
+            body = self._local_html(article['url'])
+            if body is not None:
+                local_contents[article['url']] = self._extract_content_from_html(body, article['url'])
+        to_download = [] if self.raw_html_offline else [
+            article for article in articles if article['url'] not in local_contents
+        ]
+        
+        requests_to_run = [
+            FetchRequest(
+                url=article['url'],
+                headers=self._get_optimized_headers(article['url']),
+                timeout=self._get_content_timeout(article['url']),
+                context=article,
+                max_bytes=self.article_max_bytes,
+                accept_types=self.article_content_types
+            )
+            for article in to_download
+        ]
+        
+        def process(result):
+            if result.rejected:
+                logger.debug(f"Skipping {result.request.url}: content rejected ({result.rejected})")
+                self._record_download(rejected=result.rejected)
+                return None
+            if not result.ok:
+                logger.debug(f"Error extracting content from {result.request.url}: {result.error or result.status}")
+                return None
+            self._record_download(result.body, result.truncated)
+            self.raw_html.put(result.request.url, result.body, result.truncated)
+            return self._extract_content_from_html(result.body, result.request.url)
+        
+        # Un seul essai par article, comme le moteur à threads
+        engine = self._get_async_engine(max_retries=1)
+        contents = engine.run(requests_to_run, process, timeout=self._deadline.remaining(180))
+        self._deadline.record_abandoned('articles', len(engine.abandoned))
+        downloaded = {article['url']: content for article, content in zip(to_download, contents)}
+        # Téléchargements interrompus à l'échéance : ni résultat, ni échec mis en cache
+        abandoned_urls = {request.url for request in engine.abandoned}
+        articles = [article for article in articles if article['url'] not in abandoned_urls]
+        
+        for article in articles:
+            url = article['url']
+            content = local_contents[url] if url in local_contents else downloaded.get(url)
+            self._apply_extracted_content(article, content)
+        
+        return articles
+    
+    def _load_enriched_cache(self, urls: List[str]) -> Dict[str, Dict]:
+        """
+        Contenus enrichis en cache d'un lot d'URLs, en une requête par tranche de IN.
+        Hors ligne, le cache est ignoré pour réextraire depuis les pages locales (et à l'enregistrement).
+        """
+        if self.raw_html_offline or self._recording or not urls:
+            return {}
         try:
-            # Créer une nouvelle session pour chaque thread
-            from src.database import DatabaseManager
-            thread_db = DatabaseManager()
-            
-            # Vérifier le cache en premier
-            cached_content = thread_db.get_enriched_content_from_cache(article['url'])
+            return self.db.get_enriched_contents(urls)
+        except Exception as e:
+            logger.debug(f"Error pre-loading cache: {e}")
+            return {}
+    
+    def _apply_cached_content(self, article: Dict, cached: Dict) -> Dict:
+        article['content'] = cached['content']
+        article['extraction_quality'] = cached['extraction_quality']
+        article['from_cache'] = True
+        self._record_download(cached=True)
+        return article
+    
+    def _enrich_single_article(self, article: Dict, check_cache: bool = True) -> Optional[Dict]:
+        """
+        Enrichit un article individuel avec cache.
+        check_cache=False : cache déjà consulté par lot par l'appelant (_load_enriched_cache).
+        """
+        try:
+            # Vérifier le cache en premier (sauf réextraction hors ligne) ; session propre au thread
+            cached_content = None
+            if check_cache and not self.raw_html_offline and not self._recording:
+                cached_content = self.db.get_enriched_content_from_cache(article['url'])
             
             if cached_content:
-                article['content'] = cached_content['content']
-                article['extraction_quality'] = cached_content['extraction_quality']
-                article['from_cache'] = True
+                self._apply_cached_content(article, cached_content)
                 logger.debug(f"Content retrieved from cache for: {article['title'][:50]}")
-                thread_db.close()
                 return article
             
             # Extraire le contenu complet si pas dans le cache
             content = self._extract_full_content(article['url'])
-            
-            if content and len(content) > 200:
-                article['content'] = content
-                article['extraction_quality'] = 'full'
-                # Sauvegarder dans le cache avec une nouvelle session
-                try:
-                    thread_db.save_enriched_content_to_cache(
-                        url=article['url'],
-                        content=content,
-                        extraction_quality='full',
-                        cache_hours=48  # Cache pour 48 heures
-                    )
-                except Exception as cache_error:
-                    logger.debug(f"Cache save error for {article['url']}: {cache_error}")
-            else:
-                # Fallback sur le summary
-                article['content'] = article.get('summary', '')
-                article['extraction_quality'] = 'summary_only'
-                # Sauvegarder aussi les échecs pour éviter de réessayer
-                try:
-                    thread_db.save_enriched_content_to_cache(
-                        url=article['url'],
-                        content=article['content'],
-                        extraction_quality='summary_only',
-                        cache_hours=24  # Cache plus court pour les échecs
-                    )
-                except Exception as cache_error:
-                    logger.debug(f"Cache save error for {article['url']}: {cache_error}")
-            
-            article['from_cache'] = False
-            thread_db.close()
+            self._apply_extracted_content(article, content)
             return article
             
         except Exception as e:
@@ -606,6 +1327,36 @@ class EnhancedFullstackScraper:
             article['extraction_quality'] = 'error'
             article['from_cache'] = False
             return article
+        finally:
+            # Connexion rendue au pool entre deux articles
+            self.db.close()
+    
+    def _apply_extracted_content(self, article: Dict, content: Optional[str]) -> Dict:
+        """Applique le contenu extrait à l'article et dépose sa sauvegarde dans la file d'écriture du cache"""
+        if content and len(content) > 200:
+            article['content'] = content
+            article['extraction_quality'] = 'full'
+            cache_hours = 48  # Cache pour 48 heures
+        else:
+            # Fallback sur le summary
+            article['content'] = article.get('summary', '')
+            article['extraction_quality'] = 'summary_only'
+            # Sauvegarder aussi les échecs pour éviter de réessayer
+            cache_hours = 24  # Cache plus court pour les échecs
+            if content is None and self.raw_html_offline:
+                # Page absente du stockage local : pas d'échec mis en cache, un run en ligne la téléchargera
+                article['from_cache'] = False
+                return article
+        
+        self.cache_writer.put({
+            'url': article['url'],
+            'content': article['content'],
+            'extraction_quality': article['extraction_quality'],
+            'cache_hours': cache_hours
+        })
+        
+        article['from_cache'] = False
+        return article
     
     def _get_optimized_headers(self, url: str) -> Dict[str, str]:
         """Retourne des headers optimisés selon le site"""
@@ -627,146 +1378,114 @@ class EnhancedFullstackScraper:
         
         return base_headers
     
+    def _get_content_timeout(self, url: str) -> float:
+        """Timeout de téléchargement d'un article, sans dépasser l'échéance du run"""
+        # Augmenter le timeout pour les sites lents comme Azure
+        timeout = 30 if 'azure.microsoft.com' in url or 'microsoft.com' in url else self.request_timeout
+        return self._deadline.request_timeout(timeout)
+    
+    def _local_html(self, url: str) -> Optional[bytes]:
+        """Page brute stockée localement : toujours utilisée hors ligne, sinon seulement si elle est récente"""
+        if self._recording and not self.raw_html_offline:
+            return None
+        return self.raw_html.get(url, None if self.raw_html_offline else self.raw_html_reuse_hours)
+    
     def _extract_full_content(self, url: str) -> Optional[str]:
-        """Extraction complète du contenu avec readability"""
+        """Extraction complète du contenu avec readability (téléchargement borné)"""
         try:
-            # Augmenter le timeout pour les sites lents comme Azure
-            timeout = 30 if 'azure.microsoft.com' in url or 'microsoft.com' in url else self.request_timeout
-            headers = self._get_optimized_headers(url)
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            
-            # Utiliser readability pour extraction du contenu principal
-            doc = Document(response.content)
-            content = doc.summary()
-            
-            # Nettoyer avec BeautifulSoup
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Supprimer tous les éléments inutiles
-            for tag in soup.find_all([
-                'script', 'style', 'nav', 'aside', 'footer', 'header', 
-                'form', 'input', 'button', 'select', 'textarea',
-                'iframe', 'embed', 'object', 'applet', 'ads', 'advertisement'
-            ]):
-                tag.decompose()
+            body = self._local_html(url)
+            if body is not None:
+                return self._extract_content_from_html(body, url)
+            if self.raw_html_offline:
+                logger.debug(f"Offline enrichment: no stored page for {url}")
+                return None
             
-            # Supprimer les attributs inutiles
-            for tag in soup.find_all(True):
-                tag.attrs = {}
-            
-            # Extraire le texte proprement
-            text = soup.get_text(separator=' ', strip=True)
-            
-            # Nettoyage avancé
-            cleaned_text = self._advanced_text_cleaning(text)
+            headers = self._get_optimized_headers(url)
+            _, body, truncated = self.http.get_bounded(
+                url,
+                headers=headers,
+                timeout=self._get_content_timeout(url),
+                max_bytes=self.article_max_bytes,
+                allowed_types=self.article_content_types
+            )
+            self._record_download(body, truncated)
+            self.raw_html.put(url, body, truncated)
+            if truncated:
+                logger.debug(f"Article truncated at {self.article_max_bytes} bytes: {url}")
             
-            # Limiter la taille (15000 chars pour avoir assez de contenu)
-            return cleaned_text[:15000] if cleaned_text else None
+            return self._extract_content_from_html(body, url)
             
+        except ContentRejectedError as e:
+            # PDF, image, page démesurée : rien d'exploitable pour readability
+            logger.debug(f"Skipping {url}: {e}")
+            self._record_download(rejected=e.reason)
+            return None
         except Exception as e:
             logger.debug(f"Error extracting content from {url}: {e}")
             return None
     
-    def _advanced_text_cleaning(self, text: str) -> str:
-        """Nettoyage avancé du texte extrait"""
-        if not text:
-            return ""
-        
-        # Supprimer les patterns de navigation et UI
-        patterns_to_remove = [
-            r'Skip to main content',
-            r'Navigation|Menu|Search|Login|Sign up',
-            r'Subscribe|Newsletter|Follow us',
-            r'This website uses cookies',
-            r'Privacy policy|Terms of service',
-            r'Share on|Tweet|Facebook|LinkedIn',
-            r'Advertisement|Sponsored|Promotion',
-            r'[Aa]ds?\s*by',
-        ]
-        
-        for pattern in patterns_to_remove:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        # Supprimer toutes les URLs
-        # Pattern pour matcher différents types d'URLs
-        url_patterns = [
-            r'https?://[^\s<>"{}|\\^`\[\]]+',  # URLs HTTP/HTTPS
-            r'www\.[^\s<>"{}|\\^`\[\]]+',      # URLs commençant par www.
-            r'[a-zA-Z0-9][a-zA-Z0-9-]*\.(?:com|org|net|edu|gov|mil|int|co|io|dev|app|ai|ml|xyz|tech|info|biz|name|pro|aero|museum|coop|travel|jobs|mobi|cat|tel|asia|post|test|bitnet|csnet|arpa|nato|example|invalid|localhost|localdomain|onion|local|internal|private|corp|home|host|lan|wan|web|root|mail|users|admin|oracle|ibm|apple|sony|nasa|mit|stanford|oxford|cambridge|harvard|yale|princeton|berkeley|ucla|nyu|columbia|cornell|duke|rice|cmu|gatech|purdue|umich|unc|uw|ut|osu|psu|umd|rutgers|indiana|uiuc|wisc|iowa|msu|umn|missouri|arizona|colorado|oregon|washington|nevada|utah|idaho|montana|wyoming|alaska|hawaii|maine|vermont|newhampshire|massachusetts|rhodeisland|connecticut|newyork|newjersey|pennsylvania|delaware|maryland|virginia|westvirginia|northcarolina|southcarolina|georgia|florida|alabama|mississippi|tennessee|kentucky|ohio|michigan|indiana|illinois|wisconsin|minnesota|iowa|missouri|arkansas|louisiana|texas|oklahoma|kansas|nebraska|southdakota|northdakota|colorado|newmexico|arizona|utah|nevada|idaho|montana|wyoming|california|oregon|washington|alaska|hawaii)(?:[/\s,.:;!?)}\]"]|$)',  # Domaines isolés
-            r'(?:ftp|ftps|ssh|telnet|gopher|file|mailto|news|nntp|prospero|aim|webcal|xmpp|tel|sms|bitcoin|geo|magnet|urn|spotify|lastfm|skype|facetime|callto|discord|slack|zoom|teams|meet):[^\s<>"{}|\\^`\[\]]+',  # Autres protocoles
-            r'\[link\]|\[url\]|\[Link\]|\[URL\]|\(link\)|\(url\)',  # Marqueurs de liens
-            r'<a\s+[^>]*>.*?</a>',  # Balises HTML de liens qui pourraient rester
-        ]
-        
-        for pattern in url_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        # Normaliser les espaces après suppression des URLs
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\n+', '\n', text)
-        
-        # Supprimer les caractères de contrôle
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
-        
-        # Nettoyer les espaces multiples qui pourraient rester après suppression d'URLs
-        text = re.sub(r' {2,}', ' ', text)
-        text = re.sub(r'^\s+|\s+$', '', text, flags=re.MULTILINE)
-        
-        return text.strip()
+    def _extract_content_from_html(self, html: bytes, url: str = '') -> Optional[str]:
+        """Extrait le texte principal d'une page HTML déjà téléchargée"""
+        try:
+            # Parsing et nettoyage dans le pool de processus (le thread réseau attend sans tenir le GIL)
+            text, method = run_cpu_task(extract_article_text, html, url, self.content_extractor)
+            logger.debug(f"Content extracted via {method}: {url}")
+            return text
+            
+        except Exception as e:
+            logger.debug(f"Error parsing content from {url}: {e}")
+            return None
     
     def _score_articles(self, articles: List[Dict], domain: str) -> List[Dict]:
         """Score chaque article avec le nouveau système de qualité"""
-        scored = []
-        
-        for article in articles:
-            try:
-                score, score_breakdown = self.quality_scorer.calculate_quality_score(
-                    article, 
-                    article.get('source_config', {})
-                )
-                
-                article['quality_score'] = score
-                article['score_breakdown'] = score_breakdown
-                article['domain'] = domain
-                
-                scored.append(article)
-                
-            except Exception as e:
-                logger.debug(f"Error scoring article {article.get('title', 'Unknown')}: {e}")
-                # Donner un score par défaut
-                article['quality_score'] = 0
-                article['score_breakdown'] = {}
-                article['domain'] = domain
-                scored.append(article)
+        return [self._score_article(article, domain) for article in articles]
+    
+    def _score_article(self, article: Dict, domain: str) -> Dict:
+        """Score un article individuel"""
+        try:
+            score, score_breakdown = self.quality_scorer.calculate_quality_score(
+                article, 
+                article.get('source_config', {})
+            )
+            
+            article['quality_score'] = score
+            article['score_breakdown'] = score_breakdown
+            article['domain'] = domain
+            
+        except Exception as e:
+            logger.debug(f"Error scoring article {article.get('title', 'Unknown')}: {e}")
+            # Donner un score par défaut
+            article['quality_score'] = 0
+            article['score_breakdown'] = {}
+            article['domain'] = domain
         
-        return scored
+        return article
     
     def _prepare_for_generator(self, articles: List[Dict]) -> List[Dict]:
         """Prépare les articles pour le générateur (compatibilité)"""
         prepared = []
         
         for article in articles:
-            # Nettoyer le summary
-            clean_summary = self._clean_text(self._remove_html_tags(article.get('summary', '')))
+            # Résumé déjà nettoyé à la construction de l'article (_build_articles_from_entries)
+            summary = article.get('summary', '')
             
             prepared_article = {
                 'id': hashlib.sha256(article['url'].encode()).hexdigest()[:12],
                 'title': article['title'],
                 'url': article['url'],
                 'source': article.get('source_name', article.get('source', 'Unknown')),
-                'published': article.get('published', datetime.now()),
+                'published': article.get('published', utc_now()),
                 'relevance_score': article.get('quality_score', 0),  # Compatibilité
                 'domain': article.get('domain', 'general'),
                 
                 # Champs requis par le frontend
-                'summary': clean_summary,
+                'summary': summary,
                 'content': article.get('content', ''),
                 'domains': [article.get('domain', 'general')],
                 
                 # Métadonnées enrichies
                 'content_data': {
-                    'summary': clean_summary,
+                    'summary': summary,
                     'full_text': article.get('content', ''),
                     'extraction_quality': article.get('extraction_quality', 'unknown')
                 },
@@ -777,7 +1496,7 @@ class EnhancedFullstackScraper:
                     'quality_score': article.get('quality_score', 0),
                     'score_breakdown': article.get('score_breakdown', {}),
                     'technology': article.get('technology', 'general'),
-                    'freshness': self._calculate_freshness(article.get('published', datetime.now()))
+                    'freshness': self._calculate_freshness(article.get('published', utc_now()))
                 },
                 
                 'scraped_at': article.get('scraped_at', datetime.now())
@@ -787,39 +1506,12 @@ class EnhancedFullstackScraper:
         
         return prepared
     
-    def _remove_html_tags(self, text: str) -> str:
-        """Supprime les balises HTML"""
-        if not text:
-            return ""
-        
-        # Supprimer les balises HTML
-        text = re.sub(r'<[^>]+>', '', text)
-        # Décoder les entités HTML courantes
-        text = text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-        text = text.replace('&quot;', '"').replace('&#39;', "'").replace('&nbsp;', ' ')
-        
-        return text
-
-    def _clean_text(self, text: str) -> str:
-        """Nettoie le texte"""
-        if not text:
-            return ""
-        
-        # Supprimer les caractères de contrôle
-        text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
-        # Normaliser les espaces
-        text = re.sub(r'\s+', ' ', text)
-        # Supprimer les séparateurs répétitifs
-        text = re.sub(r'[-=_*]{4,}', '', text)
-        
-        return text.strip()
-    
     def _calculate_freshness(self, published: datetime) -> str:
         """Calcule la fraîcheur de l'article"""
-        if not isinstance(published, datetime):
+        age = age_of(published)
+        if age is None:
             return 'unknown'
         
-        age = datetime.now() - published
         hours = age.total_seconds() / 3600
         
         if hours < 6:
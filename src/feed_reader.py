@@ -0,0 +1,156 @@
+"""
+Lecture incrémentale des flux RSS 2.0, RSS 1.0 (RDF) et Atom
+iterparse lxml : chaque entrée est convertie puis libérée dès sa balise fermante, et la lecture
+s'arrête après le nombre d'entrées demandé (le reste du document n'est ni parsé ni gardé en mémoire).
+Les entrées ont les mêmes champs que celles de feedparser (parse_worker.ENTRY_FIELDS, alias compris) ;
+un flux mal formé ou non reconnu retourne None et l'appelant se replie sur feedparser.
+"""
+
+import re
+from io import BytesIO
+from typing import Dict, List, Optional
+
+from lxml import etree
+
+from .date_resolver import parse_date_string
+
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+ATOM03_NS = 'http://purl.org/atom/ns#'
+RSS10_NS = 'http://purl.org/rss/1.0/'
+RSS090_NS = 'http://my.netscape.com/rdf/simple/0.9/'
+DC_NS = 'http://purl.org/dc/elements/1.1/'
+DCTERMS_NS = 'http://purl.org/dc/terms/'
+CONTENT_NS = 'http://purl.org/rss/1.0/modules/content/'
+RDF_ABOUT = '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about'
+
+ENTRY_TAGS = ('item', f'{{{RSS10_NS}}}item', f'{{{RSS090_NS}}}item', f'{{{ATOM_NS}}}entry', f'{{{ATOM03_NS}}}entry')
+
+# (namespace, nom local) -> champ lu ; les éléments d'autres espaces de noms (media:title...) sont ignorés
+_FEED_NAMESPACES = ('', RSS10_NS, RSS090_NS, ATOM_NS, ATOM03_NS)
+CHILD_FIELDS = {
+    **{(ns, 'title'): 'title' for ns in _FEED_NAMESPACES},
+    **{(ns, 'link'): 'link' for ns in _FEED_NAMESPACES},
+    **{(ns, 'description'): 'summary' for ns in ('', RSS10_NS, RSS090_NS)},
+    **{(ns, 'summary'): 'summary' for ns in (ATOM_NS, ATOM03_NS)},
+    **{(ns, 'content'): 'content' for ns in (ATOM_NS, ATOM03_NS)},
+    **{(ns, 'id'): 'id' for ns in (ATOM_NS, ATOM03_NS)},
+    **{(ns, 'category'): 'tag' for ns in ('', ATOM_NS)},
+    ('', 'guid'): 'guid',
+    ('', 'pubDate'): 'published',
+    (ATOM_NS, 'published'): 'published',
+    (ATOM03_NS, 'issued'): 'published',
+    (DCTERMS_NS, 'issued'): 'published',
+    (ATOM_NS, 'updated'): 'updated',
+    (ATOM03_NS, 'modified'): 'updated',
+    (DC_NS, 'date'): 'updated',
+    (DCTERMS_NS, 'modified'): 'updated',
+    (DC_NS, 'subject'): 'tag',
+    (CONTENT_NS, 'encoded'): 'content',
+}
+
+# feedparser retire ces blocs (et leur contenu) des résumés
+_UNSAFE_BLOCKS = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_XMLNS_ATTRIBUTES = re.compile(r'\s+xmlns(?::\w+)?="[^"]*"')
+
+
+def _inner_markup(element) -> str:
+    """Contenu d'un élément : texte, ou HTML sérialisé s'il contient des balises (Atom type="xhtml")"""
+    if len(element) == 0:
+        return (element.text or '').strip()
+    # Conteneur <div> XHTML obligatoire en Atom : seul son contenu est gardé
+    if len(element) == 1 and not (element.text or '').strip() and etree.QName(element[0]).localname == 'div':
+        element = element[0]
+    markup = (element.text or '') + ''.join(
+        etree.tostring(child, encoding='unicode', with_tail=True) for child in element
+    )
+    return _XMLNS_ATTRIBUTES.sub('', markup).strip()
+
+
+def _parsed_date(raw: str):
+    date = parse_date_string(raw)
+    return date.utctimetuple() if date else None
+
+
+def _convert_entry(element) -> Dict:
+    """Entrée au format feedparser (parse_worker.ENTRY_FIELDS) à partir d'un <item> ou <entry>"""
+    values: Dict[str, str] = {}
+    tags: List[str] = []
+    guid_is_link = True
+
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue  # Commentaires, instructions de traitement
+        qname = etree.QName(child)
+        field = CHILD_FIELDS.get((qname.namespace or '', qname.localname))
+        if field is None:
+            continue
+
+        if field == 'link':
+            # Atom : href du premier lien "alternate" ; RSS : texte de l'élément
+            if child.get('href') is not None:
+                if child.get('rel', 'alternate') == 'alternate' and 'link' not in values:
+                    values['link'] = child.get('href').strip()
+            elif 'link' not in values and (child.text or '').strip():
+                values['link'] = child.text.strip()
+        elif field == 'tag':
+            term = child.get('term') or (child.text or '').strip()
+            if term:
+                tags.append(term)
+        elif field not in values:
+            if field == 'guid':
+                guid_is_link = child.get('isPermaLink', 'true').lower() != 'false'
+            values[field] = _inner_markup(child)
+
+    entry: Dict = {}
+    if values.get('title'):
+        entry['title'] = values['title']
+
+    identifier = values.get('guid') or values.get('id') or element.get(RDF_ABOUT)
+    link = values.get('link') or (values.get('guid') if guid_is_link else None)
+    if link:
+        entry['link'] = link
+    if identifier:
+        entry['id'] = entry['guid'] = identifier
+
+    summary = values.get('summary') or values.get('content')
+    if summary:
+        entry['summary'] = _UNSAFE_BLOCKS.sub('', summary)
+
+    published, updated = values.get('published'), values.get('updated')
+    if published:
+        entry['published'] = published
+        entry['published_parsed'] = _parsed_date(published)
+    if updated:
+        entry['updated'] = entry['date'] = updated
+        entry['updated_parsed'] = _parsed_date(updated)
+    elif published:
+        # Alias de feedparser : "updated" retombe sur la date de publication
+        entry['updated'] = published
+        entry['updated_parsed'] = entry['published_parsed']
+
+    if tags:
+        entry['tags'] = [{'term': term} for term in tags]
+    return {key: value for key, value in entry.items() if value}
+
+
+def read_feed_entries(content: bytes, max_entries: int = None) -> Optional[List[Dict]]:
+    """
+    Les max_entries premières entrées du flux, sans lire la suite du document.
+    None si le flux est mal formé ou sans entrée reconnue (repli sur feedparser).
+    """
+    entries = []
+    try:
+        for _, element in etree.iterparse(BytesIO(content), events=('end',), tag=ENTRY_TAGS,
+                                          resolve_entities=False, no_network=True):
+            entries.append(_convert_entry(element))
+            # Libère l'entrée et ses voisines déjà lues : la mémoire reste bornée à une entrée
+            element.clear()
+            parent = element.getparent()
+            while element.getprevious() is not None:
+                del parent[0]
+            if max_entries is not None and len(entries) >= max_entries:
+                break
+    except etree.XMLSyntaxError:
+        return None
+
+    return entries or None
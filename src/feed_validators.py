@@ -0,0 +1,142 @@
+"""
+Stockage des validateurs HTTP des flux RSS (ETag, Last-Modified, hash du corps, <updated>)
+Permet les requêtes conditionnelles et d'éviter de re-parser un flux inchangé
+"""
+
+import re
+import hashlib
+import threading
+from datetime import datetime
+from typing import Dict, Optional, List
+from loguru import logger
+
+# Date de mise à jour au niveau du flux (avant le premier <item>/<entry>)
+FEED_UPDATED_PATTERN = re.compile(
+    rb'<(?:lastBuildDate|updated|pubDate|dc:date)>\s*([^<]{1,100}?)\s*</',
+    re.IGNORECASE
+)
+FIRST_ENTRY_PATTERN = re.compile(rb'<(?:item|entry)[\s>]', re.IGNORECASE)
+
+
+def compute_content_hash(content: bytes) -> str:
+    """Calcule l'empreinte du corps brut d'un flux"""
+    return hashlib.sha256(content or b'').hexdigest()
+
+
+def extract_feed_updated(content: bytes) -> Optional[str]:
+    """Extrait la date de mise à jour du flux sans le parser entièrement"""
+    if not content:
+        return None
+
+    # Ne regarder que l'en-tête du flux, les dates des entrées ne comptent pas
+    header = content[:16384]
+    first_entry = FIRST_ENTRY_PATTERN.search(header)
+    if first_entry:
+        header = header[:first_entry.start()]
+
+    match = FEED_UPDATED_PATTERN.search(header)
+    if not match:
+        return None
+
+    try:
+        return match.group(1).decode('utf-8', errors='ignore').strip() or None
+    except Exception:
+        return None
+
+
+class FeedValidatorStore:
+    """Validateurs par flux chargés en début de run et persistés en fin de run"""
+
+    def __init__(self, db_manager):
+        self.db = db_manager
+        self.lock = threading.Lock()
+        self._validators: Dict[str, Dict] = {}
+        self._pending: Dict[str, Dict] = {}
+        self._skipped: Dict[str, str] = {}
+
+    def load(self) -> None:
+        """Charge les validateurs persistés et réinitialise les compteurs du run"""
+        try:
+            validators = self.db.get_feed_validators()
+        except Exception as e:
+            logger.warning(f"Could not load feed validators: {e}")
+            validators = {}
+
+        with self.lock:
+            self._validators = validators
+            self._pending = {}
+            self._skipped = {}
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Headers If-None-Match / If-Modified-Since pour une requête conditionnelle"""
+        validator = self._validators.get(url)
+        if not validator:
+            return {}
+
+        headers = {}
+        if validator.get('etag'):
+            headers['If-None-Match'] = validator['etag']
+        if validator.get('last_modified'):
+            headers['If-Modified-Since'] = validator['last_modified']
+        return headers
+
+    def unchanged_reason(self, url: str, content_hash: str, feed_updated: Optional[str]) -> Optional[str]:
+        """Retourne la raison pour laquelle le flux est inchangé, ou None s'il a changé"""
+        # Comparaison avec l'état du run précédent (pas les mises à jour du run courant)
+        validator = self._validators.get(url)
+        if not validator:
+            return None
+
+        if content_hash and validator.get('content_hash') == content_hash:
+            return 'unchanged_body'
+        if feed_updated and validator.get('feed_updated') == feed_updated:
+            return 'unchanged_updated'
+        return None
+
+    def update(self, url: str, etag: Optional[str], last_modified: Optional[str],
+               content_hash: str, feed_updated: Optional[str]) -> None:
+        """Enregistre les nouveaux validateurs d'un flux (persistés en fin de run)"""
+        with self.lock:
+            self._pending[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'content_hash': content_hash,
+                'feed_updated': feed_updated,
+                'checked_at': datetime.now()
+            }
+
+    def record_skip(self, url: str, reason: str) -> None:
+        """Note qu'un flux n'a pas été parsé pendant ce run"""
+        with self.lock:
+            self._skipped[url] = reason
+
+    def skip_reason(self, url: str) -> Optional[str]:
+        return self._skipped.get(url)
+
+    def skipped_count(self, urls: List[str] = None) -> int:
+        """Nombre de flux ignorés ce run (optionnellement restreint à une liste d'URLs)"""
+        with self.lock:
+            if urls is None:
+                return len(self._skipped)
+            return len(set(urls) & set(self._skipped))
+
+    def discard(self) -> None:
+        """Oublie les validateurs mis à jour pendant le run : ses flux ne seront pas ignorés comme inchangés"""
+        with self.lock:
+            self._pending = {}
+
+    def flush(self) -> None:
+        """Persiste les validateurs mis à jour pendant le run"""
+        with self.lock:
+            pending = self._pending
+            self._pending = {}
+
+        if not pending:
+            return
+
+        try:
+            self.db.save_feed_validators(pending)
+            with self.lock:
+                self._validators.update(pending)
+        except Exception as e:
+            logger.warning(f"Could not save feed validators: {e}")
@@ -0,0 +1,97 @@
+"""
+Plan de fetch compilé à partir de la configuration des sources
+Chaque URL de flux n'est téléchargée qu'une fois par run, puis ses entrées sont
+distribuées à toutes les liaisons (domaine, technologie, poids, focus) qui la référencent
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+def max_entries_for_weight(weight: int) -> int:
+    """Nombre d'entrées à prendre dans un flux selon le poids de la source"""
+    # Sources prioritaires = plus d'articles
+    return 5 if weight < 8 else 10 if weight < 9 else 15
+
+
+@dataclass
+class SourceBinding:
+    """Une référence à un flux dans la configuration"""
+    domain: str
+    technology: str
+    config: Dict
+
+    @property
+    def url(self) -> str:
+        return self.config['url']
+
+    @property
+    def max_entries(self) -> int:
+        return max_entries_for_weight(self.config.get('weight', 7))
+
+    def source_config(self) -> Dict:
+        """Configuration de source telle qu'attachée aux articles"""
+        source_config = self.config.copy()
+        source_config['technology'] = self.technology
+        return source_config
+
+
+@dataclass
+class FetchPlan:
+    """URLs uniques à télécharger et leurs liaisons"""
+    bindings_by_url: 'OrderedDict[str, List[SourceBinding]]' = field(default_factory=OrderedDict)
+
+    @property
+    def unique_urls(self) -> List[str]:
+        return list(self.bindings_by_url.keys())
+
+    @property
+    def total_bindings(self) -> int:
+        return sum(len(bindings) for bindings in self.bindings_by_url.values())
+
+    @property
+    def redundant_fetches(self) -> int:
+        """Fetchs évités par rapport à un fetch par liaison"""
+        return self.total_bindings - len(self.bindings_by_url)
+
+    def bindings_for(self, url: str, domain: str = None) -> List[SourceBinding]:
+        bindings = self.bindings_by_url.get(url, [])
+        if domain is None:
+            return list(bindings)
+        return [binding for binding in bindings if binding.domain == domain]
+
+    def urls_for_domain(self, domain: str) -> List[str]:
+        return [
+            url for url, bindings in self.bindings_by_url.items()
+            if any(binding.domain == domain for binding in bindings)
+        ]
+
+    def domain_bindings_count(self, domain: str) -> int:
+        return sum(len(self.bindings_for(url, domain)) for url in self.urls_for_domain(domain))
+
+    def max_entries(self, url: str) -> int:
+        """Entrées à extraire du flux pour satisfaire toutes ses liaisons"""
+        bindings = self.bindings_by_url.get(url, [])
+        return max((binding.max_entries for binding in bindings), default=0)
+
+
+def compile_fetch_plan(sources: Dict) -> FetchPlan:
+    """Compile la configuration des sources (SPECIALIZED_SOURCES) en plan de fetch"""
+    plan = FetchPlan()
+
+    for domain, domain_sources in sources.items():
+        # Les sources 'general' sont une liste directe, sans technologie
+        if isinstance(domain_sources, list):
+            domain_sources = {'general': domain_sources}
+
+        for technology, tech_sources in domain_sources.items():
+            for source in tech_sources:
+                url = source.get('url')
+                if not url:
+                    continue
+                plan.bindings_by_url.setdefault(url, []).append(
+                    SourceBinding(domain=domain, technology=technology, config=source)
+                )
+
+    return plan
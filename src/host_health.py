@@ -0,0 +1,249 @@
+"""
+Santé des hosts et des flux du scraping
+- Circuit breaker par host (en mémoire, partagé par le processus) : un host en échec répété
+  est ignoré immédiatement au lieu de consommer des workers et des timeouts
+- Quarantaine persistée des flux en échec sur plusieurs runs consécutifs
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+from loguru import logger
+
+from .sources_config import SCRAPING_CONFIG
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Requête refusée car le circuit du host est ouvert"""
+
+    def __init__(self, host: str, retry_in: float):
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__(f"Circuit open for {host} (retry in {retry_in:.0f}s)")
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+class CircuitBreaker:
+    """
+    Circuit par host : fermé -> ouvert après `failure_threshold` échecs consécutifs,
+    puis semi-ouvert après `open_seconds` (une seule requête de test autorisée)
+    """
+
+    def __init__(self, failure_threshold: int = None, open_seconds: float = None):
+        self.failure_threshold = failure_threshold or SCRAPING_CONFIG['circuit_failure_threshold']
+        self.open_seconds = open_seconds or SCRAPING_CONFIG['circuit_open_seconds']
+        self.lock = threading.Lock()
+        self._hosts: Dict[str, Dict] = {}
+
+    def _host_state(self, host: str) -> Dict:
+        return self._hosts.setdefault(host, {
+            'state': CLOSED,
+            'consecutive_failures': 0,
+            'total_failures': 0,
+            'total_successes': 0,
+            'rejected': 0,
+            'opened_at': None,
+            'last_error': None,
+            'probe_in_flight': False
+        })
+
+    def before_request(self, url: str) -> None:
+        """Lève CircuitOpenError si le host doit être ignoré"""
+        host = host_of(url)
+        with self.lock:
+            state = self._hosts.get(host)
+            if state is None or state['state'] == CLOSED:
+                return
+
+            if state['state'] == OPEN:
+                elapsed = time.monotonic() - state['opened_at']
+                if elapsed < self.open_seconds:
+                    state['rejected'] += 1
+                    raise CircuitOpenError(host, self.open_seconds - elapsed)
+                # Délai écoulé : laisser passer une requête de test
+                state['state'] = HALF_OPEN
+                state['probe_in_flight'] = False
+
+            if state['probe_in_flight']:
+                state['rejected'] += 1
+                raise CircuitOpenError(host, 0)
+            state['probe_in_flight'] = True
+
+    def release_probe(self, url: str) -> None:
+        """
+        Requête interrompue sans résultat (tâche annulée à l'échéance, erreur hors réseau) : ni succès ni échec,
+        mais la requête de test d'un circuit semi-ouvert est rendue pour qu'une autre puisse la remplacer
+        """
+        with self.lock:
+            state = self._hosts.get(host_of(url))
+            if state is not None:
+                state['probe_in_flight'] = False
+
+    def record_success(self, url: str) -> None:
+        host = host_of(url)
+        with self.lock:
+            state = self._host_state(host)
+            if state['state'] != CLOSED:
+                logger.info(f"Circuit closed for {host}")
+            state['state'] = CLOSED
+            state['consecutive_failures'] = 0
+            state['total_successes'] += 1
+            state['probe_in_flight'] = False
+
+    def record_failure(self, url: str, error: str) -> None:
+        host = host_of(url)
+        with self.lock:
+            state = self._host_state(host)
+            state['consecutive_failures'] += 1
+            state['total_failures'] += 1
+            state['last_error'] = str(error)[:200]
+            state['probe_in_flight'] = False
+
+            if state['state'] == HALF_OPEN or state['consecutive_failures'] >= self.failure_threshold:
+                if state['state'] != OPEN:
+                    logger.warning(f"Circuit opened for {host} after {state['consecutive_failures']} failures: {error}")
+                state['state'] = OPEN
+                state['opened_at'] = time.monotonic()
+
+    def get_states(self) -> List[Dict]:
+        """État des circuits connus, hosts non fermés en premier"""
+        now = time.monotonic()
+        with self.lock:
+            states = []
+            for host, state in self._hosts.items():
+                retry_in = None
+                if state['state'] == OPEN:
+                    retry_in = max(0.0, round(self.open_seconds - (now - state['opened_at']), 1))
+                states.append({
+                    'host': host,
+                    'state': state['state'],
+                    'consecutive_failures': state['consecutive_failures'],
+                    'total_failures': state['total_failures'],
+                    'total_successes': state['total_successes'],
+                    'rejected_requests': state['rejected'],
+                    'retry_in_seconds': retry_in,
+                    'last_error': state['last_error']
+                })
+
+        return sorted(states, key=lambda s: (s['state'] == CLOSED, s['host']))
+
+    def reset(self, host: str = None) -> None:
+        with self.lock:
+            if host is None:
+                self._hosts.clear()
+            else:
+                self._hosts.pop(host.lower(), None)
+
+
+_circuit_breaker = None
+_circuit_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Retourne le circuit breaker partagé du processus"""
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        with _circuit_breaker_lock:
+            if _circuit_breaker is None:
+                _circuit_breaker = CircuitBreaker()
+    return _circuit_breaker
+
+
+class FeedHealthStore:
+    """Échecs par flux sur les runs successifs ; les flux en échec répété sont mis en quarantaine"""
+
+    def __init__(self, db_manager, quarantine_after_runs: int = None, quarantine_hours: float = None):
+        self.db = db_manager
+        self.quarantine_after_runs = quarantine_after_runs or SCRAPING_CONFIG['feed_quarantine_after_runs']
+        self.quarantine_hours = quarantine_hours or SCRAPING_CONFIG['feed_quarantine_hours']
+        self.lock = threading.Lock()
+        self._health: Dict[str, Dict] = {}
+        self._outcomes: Dict[str, Optional[str]] = {}  # URL -> None (succès) ou erreur
+        self._quarantine_skips: set = set()
+
+    def load(self) -> None:
+        """Charge l'état persisté et réinitialise les résultats du run"""
+        try:
+            health = self.db.get_feed_health()
+        except Exception as e:
+            logger.warning(f"Could not load feed health: {e}")
+            health = {}
+
+        with self.lock:
+            self._health = health
+            self._outcomes = {}
+            self._quarantine_skips = set()
+
+    def is_quarantined(self, url: str) -> bool:
+        health = self._health.get(url)
+        quarantined_until = health.get('quarantined_until') if health else None
+        return bool(quarantined_until and quarantined_until > datetime.now())
+
+    def record_quarantine_skip(self, url: str) -> None:
+        with self.lock:
+            self._quarantine_skips.add(url)
+
+    def quarantine_skipped_count(self, urls: List[str] = None) -> int:
+        with self.lock:
+            if urls is None:
+                return len(self._quarantine_skips)
+            return len(set(urls) & self._quarantine_skips)
+
+    def record_success(self, url: str) -> None:
+        with self.lock:
+            self._outcomes[url] = None
+
+    def record_failure(self, url: str, error: str) -> None:
+        with self.lock:
+            self._outcomes[url] = str(error)
+
+    def get_quarantined(self) -> List[Dict]:
+        with self.lock:
+            return [
+                {'url': url, **health}
+                for url, health in self._health.items()
+                if health.get('quarantined_until') and health['quarantined_until'] > datetime.now()
+            ]
+
+    def flush(self) -> None:
+        """Met à jour les compteurs d'échecs consécutifs et persiste les flux touchés pendant le run"""
+        with self.lock:
+            outcomes = self._outcomes
+            self._outcomes = {}
+
+        if not outcomes:
+            return
+
+        now = datetime.now()
+        updates = {}
+        for url, error in outcomes.items():
+            health = dict(self._health.get(url) or {'consecutive_failures': 0})
+
+            if error is None:
+                if health.get('quarantined_until'):
+                    logger.info(f"Feed recovered, leaving quarantine: {url}")
+                health.update(consecutive_failures=0, last_success_at=now, quarantined_until=None)
+            else:
+                failures = health.get('consecutive_failures', 0) + 1
+                health.update(consecutive_failures=failures, last_error=error, last_failure_at=now)
+                if failures >= self.quarantine_after_runs:
+                    health['quarantined_until'] = now + timedelta(hours=self.quarantine_hours)
+                    logger.warning(f"Feed quarantined for {self.quarantine_hours}h after {failures} failed runs: {url}")
+
+            updates[url] = health
+
+        try:
+            self.db.save_feed_health(updates)
+            with self.lock:
+                self._health.update(updates)
+        except Exception as e:
+            logger.warning(f"Could not save feed health: {e}")
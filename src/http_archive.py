@@ -0,0 +1,313 @@
+"""
+Archive HTTP pour des runs de scraping reproductibles sans réseau
+En enregistrement, chaque réponse des flux et des articles (statut, headers, corps, durée) ou erreur
+réseau est capturée ; en rejeu, le client HTTP et le moteur asyncio sont servis depuis l'archive,
+avec une latence simulée par host. Une URL absente de l'archive échoue comme un host injoignable.
+
+Format : un seul fichier zip (index.json + corps dédupliqués par sha256, compressés), copiable
+tel quel vers une machine de CI. Les corps sont stockés décodés et complets (client à threads comme
+moteur asyncio) : le plafond de lecture et le filtrage par Content-Type s'appliquent au rejeu comme sur
+le réseau. Pendant l'enregistrement, le scraper n'envoie pas de requêtes conditionnelles et n'utilise ni
+les validateurs de flux ni les caches de contenu : l'archive se rejoue sur une machine sans données.
+"""
+
+import hashlib
+import io
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+import zipfile
+from dataclasses import dataclass
+from http.client import responses as HTTP_REASONS
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from loguru import logger
+
+from .sources_config import SCRAPING_CONFIG
+
+INDEX_FILE = 'index.json'
+ARCHIVE_MODES = ('record', 'replay')
+LATENCY_MODES = ('host', 'recorded', 'none')
+
+# Content-Types des réponses de flux (RSS, Atom, RDF)
+FEED_CONTENT_TYPES = ('rss', 'atom', 'rdf', 'xml')
+
+# Headers liés au transport d'origine : le corps archivé est déjà décodé et complet
+_TRANSPORT_HEADERS = {'content-encoding', 'transfer-encoding', 'connection', 'keep-alive', 'set-cookie'}
+
+
+@dataclass
+class ArchivedResponse:
+    """Réponse (ou erreur réseau) enregistrée pour une URL"""
+    url: str
+    status: int = 0
+    headers: Dict[str, str] = None
+    body: bytes = b''
+    elapsed: float = 0.0  # Secondes, corps compris
+    error: Optional[str] = None  # 'ReadTimeout: ...' si la requête a échoué sans réponse
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.url).netloc
+
+
+def archived_headers(headers) -> Dict[str, str]:
+    """Headers gardés dans l'archive (Content-Length retiré si le corps d'origine était compressé)"""
+    kept = {key: value for key, value in headers.items() if key.lower() not in _TRANSPORT_HEADERS}
+    if any(key.lower() == 'content-encoding' for key in headers):
+        kept = {key: value for key, value in kept.items() if key.lower() != 'content-length'}
+    return kept
+
+
+class HttpArchive:
+    """
+    Réponses archivées par URL, dans l'ordre où elles ont été reçues : un échec suivi d'un succès
+    au retry est rejoué tel quel. Au-delà de la dernière réponse d'une URL, celle-ci est resservie.
+    Partagée entre threads et boucle asyncio : l'index est protégé par un verrou.
+    """
+
+    def __init__(self, path: str = None, mode: str = None, latency: str = None, latency_scale: float = None):
+        self.path = path or SCRAPING_CONFIG['http_archive_path']
+        self.mode = mode or SCRAPING_CONFIG['http_archive_mode']
+        if self.mode not in ARCHIVE_MODES:
+            raise ValueError(f"Unknown HTTP archive mode: {self.mode!r} (expected one of {ARCHIVE_MODES})")
+        self.latency = latency or SCRAPING_CONFIG['http_replay_latency']
+        if self.latency not in LATENCY_MODES:
+            raise ValueError(f"Unknown replay latency mode: {self.latency!r} (expected one of {LATENCY_MODES})")
+        self.latency_scale = SCRAPING_CONFIG['http_replay_latency_scale'] if latency_scale is None else latency_scale
+
+        self.lock = threading.Lock()
+        self._entries: Dict[str, List[Dict]] = {}
+        self._bodies: Dict[str, bytes] = {}
+        self._cursors: Dict[str, int] = {}
+        self._recorded_urls = set()
+        self._host_latency: Dict[str, float] = {}
+        self._stats = {'recorded': 0, 'replayed': 0, 'misses': 0}
+        self._dirty = False
+        self.load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    def load(self) -> None:
+        """Charge l'archive existante (en enregistrement, les URLs non refetchées sont conservées)"""
+        if not os.path.exists(self.path):
+            if self.replaying:
+                logger.warning(f"HTTP archive {self.path} not found: every request will fail in replay mode")
+            return
+        try:
+            with zipfile.ZipFile(self.path) as archive:
+                index = json.loads(archive.read(INDEX_FILE))
+                bodies = {digest: archive.read(f'bodies/{digest}') for digest in index.get('bodies', [])}
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            logger.warning(f"Could not load HTTP archive {self.path}: {e}")
+            return
+
+        with self.lock:
+            self._entries = index.get('entries', {})
+            self._bodies = bodies
+            self._cursors = {}
+            self._host_latency = self._compute_host_latency()
+        logger.info(f"HTTP archive loaded: {len(self._entries)} URLs, {len(bodies)} bodies ({self.mode} mode)")
+
+    def _compute_host_latency(self) -> Dict[str, float]:
+        """Latence médiane enregistrée par host (rejeu stable, sans les pics d'une réponse isolée)"""
+        per_host: Dict[str, List[float]] = {}
+        for url, entries in self._entries.items():
+            host = urlparse(url).netloc
+            per_host.setdefault(host, []).extend(entry.get('elapsed', 0.0) for entry in entries)
+        return {host: statistics.median(values) for host, values in per_host.items() if values}
+
+    def record(self, url: str, status: int = 0, headers=None, body: bytes = b'',
+               elapsed: float = 0.0, error: str = None) -> None:
+        """Ajoute une réponse reçue ; la première de l'URL dans la session remplace les anciennes"""
+        entry = {'status': status, 'headers': archived_headers(headers or {}), 'elapsed': round(elapsed, 4)}
+        if error:
+            entry['error'] = error
+        elif body:
+            entry['body'] = hashlib.sha256(body).hexdigest()
+
+        with self.lock:
+            if url not in self._recorded_urls:
+                self._recorded_urls.add(url)
+                self._entries[url] = []
+            self._entries[url].append(entry)
+            if 'body' in entry:
+                self._bodies.setdefault(entry['body'], body)
+            self._stats['recorded'] += 1
+            self._dirty = True
+
+    def next_response(self, url: str) -> Optional[ArchivedResponse]:
+        """Prochaine réponse archivée de l'URL ; None si l'URL n'a jamais été enregistrée"""
+        with self.lock:
+            entries = self._entries.get(url)
+            if not entries:
+                self._stats['misses'] += 1
+                return None
+            position = self._cursors.get(url, 0)
+            self._cursors[url] = position + 1
+            entry = entries[min(position, len(entries) - 1)]
+            self._stats['replayed'] += 1
+            body = self._bodies.get(entry.get('body'), b'')
+
+        return ArchivedResponse(
+            url=url,
+            status=entry.get('status', 0),
+            headers=dict(entry.get('headers') or {}),
+            body=body,
+            elapsed=entry.get('elapsed', 0.0),
+            error=entry.get('error')
+        )
+
+    def simulated_latency(self, response: ArchivedResponse) -> float:
+        """Délai de rejeu d'une réponse : médiane de son host, sa durée enregistrée, ou aucun"""
+        if self.latency == 'none':
+            return 0.0
+        if self.latency == 'host':
+            elapsed = self._host_latency.get(response.host, response.elapsed)
+        else:
+            elapsed = response.elapsed
+        return elapsed * self.latency_scale
+
+    def feed_urls(self) -> List[str]:
+        """URLs dont la réponse archivée est un flux, d'après son Content-Type"""
+        urls = []
+        with self.lock:
+            for url, entries in self._entries.items():
+                headers = CaseInsensitiveDict(entries[-1].get('headers') or {})
+                content_type = (headers.get('Content-Type') or '').split(';')[0].lower()
+                if any(kind in content_type for kind in FEED_CONTENT_TYPES):
+                    urls.append(url)
+        return sorted(urls)
+
+    def rewind(self) -> None:
+        """Repart de la première réponse de chaque URL (plusieurs runs rejoués à l'identique)"""
+        with self.lock:
+            self._cursors = {}
+
+    def get_stats(self) -> Dict:
+        with self.lock:
+            return {'mode': self.mode, 'urls': len(self._entries), 'bodies': len(self._bodies), **self._stats}
+
+    def flush(self) -> None:
+        """Écrit l'archive (fichier temporaire puis renommage) si des réponses ont été enregistrées"""
+        with self.lock:
+            if not self.recording or not self._dirty:
+                return
+            entries = {url: list(values) for url, values in self._entries.items()}
+            used = {entry['body'] for values in entries.values() for entry in values if 'body' in entry}
+            bodies = {digest: body for digest, body in self._bodies.items() if digest in used}
+            self._dirty = False
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f, zipfile.ZipFile(f, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr(INDEX_FILE, json.dumps({'entries': entries, 'bodies': sorted(bodies)}))
+                for digest in sorted(bodies):
+                    archive.writestr(f'bodies/{digest}', bodies[digest])
+            os.replace(tmp_path, self.path)
+            logger.info(f"HTTP archive saved: {len(entries)} URLs, {len(bodies)} bodies -> {self.path}")
+        except OSError as e:
+            logger.warning(f"Could not save HTTP archive: {e}")
+            with self.lock:
+                self._dirty = True
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Adapter requests qui enregistre chaque réponse (corps lu en entier) ou erreur réseau"""
+
+    def __init__(self, archive: HttpArchive, **kwargs):
+        self.archive = archive
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+            body = response.content  # Lecture complète : le plafond du client s'applique ensuite
+        except requests.RequestException as e:
+            self.archive.record(request.url, elapsed=time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+            raise
+        self.archive.record(request.url, response.status_code, response.headers, body, time.perf_counter() - start)
+        return response
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Adapter requests servant les réponses de l'archive, sans aucune connexion réseau"""
+
+    def __init__(self, archive: HttpArchive, **kwargs):
+        self.archive = archive
+        super().__init__(**kwargs)
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        archived = self.archive.next_response(request.url)
+        if archived is None:
+            raise requests.ConnectionError(f"URL not in HTTP archive: {request.url}", request=request)
+
+        read_timeout = timeout[-1] if isinstance(timeout, tuple) else timeout
+        delay = self.archive.simulated_latency(archived)
+        if read_timeout is not None and delay > read_timeout:
+            time.sleep(read_timeout)
+            raise requests.exceptions.ReadTimeout(f"Replayed latency {delay:.2f}s exceeds timeout", request=request)
+        time.sleep(delay)
+
+        if archived.error:
+            name = archived.error.split(':', 1)[0]
+            error_class = getattr(requests.exceptions, name, requests.ConnectionError)
+            if not (isinstance(error_class, type) and issubclass(error_class, requests.RequestException)):
+                error_class = requests.ConnectionError
+            raise error_class(archived.error, request=request)
+
+        response = requests.Response()
+        response.status_code = archived.status
+        response.reason = HTTP_REASONS.get(archived.status, '')
+        response.headers = CaseInsensitiveDict(archived.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(archived.body)
+        # Corps déjà en mémoire : iter_content le découpe sans relire raw
+        response._content = archived.body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+
+def mount_archive(session: requests.Session, archive: HttpArchive, **adapter_kwargs) -> HTTPAdapter:
+    """Monte l'adapter d'enregistrement ou de rejeu sur la session et le retourne"""
+    adapter_class = RecordingAdapter if archive.recording else ReplayAdapter
+    adapter = adapter_class(archive, **adapter_kwargs)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return adapter
+
+
+_http_archive = None
+_http_archive_lock = threading.Lock()
+
+
+def get_http_archive() -> Optional[HttpArchive]:
+    """Archive du processus si SCRAPER_HTTP_ARCHIVE_MODE est 'record' ou 'replay', None sinon"""
+    global _http_archive
+    if not SCRAPING_CONFIG['http_archive_mode']:
+        return None
+    if _http_archive is None:
+        with _http_archive_lock:
+            if _http_archive is None:
+                _http_archive = HttpArchive()
+    return _http_archive
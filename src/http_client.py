@@ -0,0 +1,158 @@
+"""
+Client HTTP partagé pour le scraping
+Une seule session avec des pools de connexions keep-alive par host, utilisée par tous les threads
+"""
+
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Iterable, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from loguru import logger
+
+from .sources_config import SCRAPING_CONFIG
+from .host_health import CircuitBreaker, get_circuit_breaker
+from .http_archive import HttpArchive, get_http_archive, mount_archive
+
+READ_CHUNK_BYTES = 64 * 1024
+
+
+class ContentRejectedError(Exception):
+    """Réponse écartée d'après ses headers, avant la lecture du corps"""
+
+    def __init__(self, reason: str, detail: str):
+        self.reason = reason  # 'content_type' ou 'too_large'
+        super().__init__(f"Content rejected ({reason}): {detail}")
+
+
+def check_content_headers(headers, allowed_types: Optional[Iterable[str]] = None,
+                          max_bytes: Optional[int] = None) -> None:
+    """Lève ContentRejectedError si le type ou la taille annoncés sont hors limites"""
+    content_type = (headers.get('Content-Type') or '').split(';')[0].strip().lower()
+    # Sans Content-Type, on laisse le parseur juger
+    if allowed_types and content_type and content_type not in allowed_types:
+        raise ContentRejectedError('content_type', content_type)
+
+    content_length = (headers.get('Content-Length') or '').strip()
+    if max_bytes and content_length.isdigit() and int(content_length) > max_bytes:
+        raise ContentRejectedError('too_large', f"{content_length} bytes > {max_bytes}")
+
+
+def read_bounded(chunks: Iterable[bytes], max_bytes: Optional[int]) -> Tuple[bytes, bool]:
+    """Lit les morceaux jusqu'au plafond ; retourne (corps, tronqué)"""
+    body = bytearray()
+    for chunk in chunks:
+        body.extend(chunk)
+        if max_bytes and len(body) >= max_bytes:
+            return bytes(body[:max_bytes]), True
+    return bytes(body), False
+
+
+class HttpClient:
+    """Session requests partagée entre threads avec pools de connexions par host"""
+
+    def __init__(self, pool_connections: int = None, pool_maxsize: int = None, circuit_breaker: CircuitBreaker = None,
+                 archive: HttpArchive = None):
+        self.pool_connections = pool_connections or SCRAPING_CONFIG['http_pool_connections']
+        self.pool_maxsize = pool_maxsize or SCRAPING_CONFIG['http_pool_maxsize']
+
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker()
+
+        self.session = requests.Session()
+        # Pas de cookies persistés : c'est le seul état mutable partagé entre les threads
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        adapter_kwargs = dict(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=False
+        )
+        # Enregistrement ou rejeu : l'adapter de l'archive remplace le transport
+        self.archive = archive or get_http_archive()
+        if self.archive is not None:
+            self.adapter = mount_archive(self.session, self.archive, **adapter_kwargs)
+        else:
+            self.adapter = HTTPAdapter(**adapter_kwargs)
+            self.session.mount('http://', self.adapter)
+            self.session.mount('https://', self.adapter)
+
+        logger.info(f"HTTP client initialized (pools: {self.pool_connections} hosts x {self.pool_maxsize} connections"
+                    f"{f', {self.archive.mode} from {self.archive.path}' if self.archive is not None else ''})")
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10,
+            stream: bool = False) -> requests.Response:
+        """
+        GET en réutilisant une connexion du pool du host si disponible.
+        Lève CircuitOpenError sans requête si le circuit du host est ouvert.
+        """
+        self.circuit_breaker.before_request(url)
+        try:
+            response = self.session.get(url, headers=headers, timeout=timeout, stream=stream)
+        except requests.RequestException as e:
+            self.circuit_breaker.record_failure(url, f"{type(e).__name__}: {e}")
+            raise
+        except BaseException:
+            # Erreur hors réseau : la requête de test d'un circuit semi-ouvert est rendue
+            self.circuit_breaker.release_probe(url)
+            raise
+
+        # Les erreurs 4xx (hors 429) viennent de l'URL, pas de la santé du host
+        if response.status_code >= 500 or response.status_code == 429:
+            self.circuit_breaker.record_failure(url, f"HTTP {response.status_code}")
+        else:
+            self.circuit_breaker.record_success(url)
+        return response
+
+    def get_bounded(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10,
+                    max_bytes: Optional[int] = None,
+                    allowed_types: Optional[Iterable[str]] = None) -> Tuple[requests.Response, bytes, bool]:
+        """
+        GET en streaming : type et taille annoncés vérifiés avant de lire le corps,
+        lecture interrompue au plafond `max_bytes`. Retourne (réponse, corps, tronqué).
+        """
+        response = self.get(url, headers=headers, timeout=timeout, stream=True)
+        try:
+            response.raise_for_status()
+            check_content_headers(response.headers, allowed_types, max_bytes)
+            body, truncated = read_bounded(response.iter_content(chunk_size=READ_CHUNK_BYTES), max_bytes)
+        finally:
+            # Corps lu en entier : la connexion retourne au pool ; sinon elle est fermée
+            response.close()
+        return response, body, truncated
+
+    def get_stats(self) -> Dict[str, int]:
+        """Statistiques des pools : connexions ouvertes vs requêtes servies"""
+        stats = {'hosts': 0, 'connections_opened': 0, 'requests': 0}
+
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats['hosts'] += 1
+            stats['connections_opened'] += getattr(pool, 'num_connections', 0)
+            stats['requests'] += getattr(pool, 'num_requests', 0)
+
+        stats['connections_reused'] = max(stats['requests'] - stats['connections_opened'], 0)
+        return stats
+
+    def close(self) -> None:
+        """Ferme toutes les connexions du pool"""
+        try:
+            self.session.close()
+        except Exception as e:
+            logger.debug(f"Error closing HTTP session: {e}")
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Retourne le client HTTP partagé du processus"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = HttpClient()
+    return _http_client
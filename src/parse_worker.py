@@ -0,0 +1,58 @@
+"""
+Étape CPU du scraping : parsing des flux et extraction du texte des articles
+Fonctions pures exécutées dans le pool de processus (scrape_executor.run_cpu_task) : elles reçoivent
+les octets bruts téléchargés par les threads réseau et retournent des résultats compacts et picklables.
+Ce module n'importe ni la base ni le scraper, pour que les processus démarrent vite.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import feedparser
+
+from .content_extractor import extract_main_text, extract_text_legacy
+from .feed_reader import read_feed_entries
+from .text_cleaner import clean_article_text
+
+# Champs d'une entrée feedparser lus par le scraper (construction, empreinte, dates)
+ENTRY_FIELDS = (
+    'title', 'link', 'id', 'guid', 'summary', 'published', 'updated', 'date',
+    'published_parsed', 'updated_parsed',
+)
+
+# Taille maximale du texte extrait (assez de contenu pour le scoring et la génération)
+ARTICLE_TEXT_MAX_CHARS = 15000
+
+
+def compact_entry(entry) -> Dict:
+    """Entrée réduite aux champs utiles, en dict simple (les FeedParserDict sont lourds à transférer)"""
+    compact = {field: entry[field] for field in ENTRY_FIELDS if entry.get(field)}
+    tags = [tag.get('term') for tag in entry.get('tags') or () if tag.get('term')]
+    if tags:
+        compact['tags'] = [{'term': term} for term in tags]
+    return compact
+
+
+def parse_feed_entries(content: bytes, max_entries: int = None, reader: str = 'iterparse') -> List[Dict]:
+    """
+    Premières entrées d'un flux RSS/Atom brut.
+    reader : 'iterparse' (lecture arrêtée après max_entries, feedparser pour les flux mal formés) ou 'feedparser'.
+    """
+    if reader == 'iterparse':
+        entries = read_feed_entries(content, max_entries)
+        if entries is not None:
+            return entries
+    return [compact_entry(entry) for entry in feedparser.parse(content).entries[:max_entries]]
+
+
+def extract_article_text(html: bytes, url: str = '', extractor: str = 'lxml') -> Tuple[Optional[str], str]:
+    """
+    Texte principal nettoyé d'une page d'article et méthode d'extraction utilisée.
+    extractor : 'lxml' (un seul parsing, readability en dernier recours) ou 'readability' (ancien chemin).
+    """
+    if extractor == 'readability':
+        text, method = extract_text_legacy(html), 'legacy'
+    else:
+        text, method = extract_main_text(html, url)
+
+    cleaned_text = clean_article_text(text)
+    return (cleaned_text[:ARTICLE_TEXT_MAX_CHARS] if cleaned_text else None), method
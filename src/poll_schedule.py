@@ -0,0 +1,141 @@
+"""
+Fréquence de polling adaptative par flux
+La cadence de publication de chaque flux est estimée à partir des dates de ses entrées au fil des runs :
+un flux qui publie toutes les heures est relu à chaque run, un blog mensuel beaucoup plus rarement
+"""
+
+import statistics
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from loguru import logger
+
+from .date_resolver import feed_entry_date, utc_now
+from .sources_config import SCRAPING_CONFIG
+
+
+def entry_dates_from_feed(entries: List) -> List[datetime]:
+    """Dates (UTC) déclarées par le flux pour ses entrées"""
+    return [date for date in map(feed_entry_date, entries) if date]
+
+
+def observed_interval_hours(entry_dates: List[datetime]) -> Optional[float]:
+    """Intervalle médian entre deux publications, en heures"""
+    dates = sorted(set(entry_dates), reverse=True)[:20]
+    if len(dates) < 2:
+        return None
+
+    gaps = [(newer - older).total_seconds() / 3600 for newer, older in zip(dates, dates[1:])]
+    return max(statistics.median(gaps), 0.0)
+
+
+class PollScheduleStore:
+    """Prochaine date de polling par flux, chargée en début de run et persistée en fin de run"""
+
+    def __init__(self, db_manager, min_hours: float = None, max_hours: float = None,
+                 poll_factor: float = None, smoothing: float = 0.3):
+        self.db = db_manager
+        self.min_hours = min_hours or SCRAPING_CONFIG['poll_min_hours']
+        self.max_hours = max_hours or SCRAPING_CONFIG['poll_max_hours']
+        # Relire un flux plusieurs fois par intervalle de publication pour ne pas rater de nouveauté
+        self.poll_factor = poll_factor or SCRAPING_CONFIG['poll_interval_factor']
+        self.smoothing = smoothing
+        self.lock = threading.Lock()
+        self._schedule: Dict[str, Dict] = {}
+        self._pending: Dict[str, Dict] = {}
+        self._not_due: set = set()
+        self._run_started_at = datetime.now()
+
+    def load(self) -> None:
+        """Charge les plannings persistés et réinitialise les compteurs du run"""
+        try:
+            schedule = self.db.get_feed_poll_schedule()
+        except Exception as e:
+            logger.warning(f"Could not load feed poll schedule: {e}")
+            schedule = {}
+
+        with self.lock:
+            self._schedule = schedule
+            self._pending = {}
+            self._not_due = set()
+            # Heure de référence du run : un run plus long que prévu ne décale pas le run suivant
+            self._run_started_at = datetime.now()
+
+    def is_due(self, url: str) -> bool:
+        """Un flux inconnu est toujours dû"""
+        entry = self._schedule.get(url)
+        next_poll_at = entry.get('next_poll_at') if entry else None
+        return next_poll_at is None or next_poll_at <= self._run_started_at
+
+    def record_not_due(self, url: str) -> None:
+        with self.lock:
+            self._not_due.add(url)
+
+    def not_due_count(self, urls: List[str] = None) -> int:
+        with self.lock:
+            if urls is None:
+                return len(self._not_due)
+            return len(set(urls) & self._not_due)
+
+    def record_poll(self, url: str, entry_dates: List[datetime]) -> None:
+        """
+        Met à jour la cadence estimée après un polling réussi.
+        `entry_dates` est vide si le flux n'a pas changé depuis le run précédent.
+        """
+        now = self._run_started_at
+        now_utc = utc_now()
+        entry = dict(self._schedule.get(url) or {})
+        avg_interval = entry.get('avg_interval_hours')
+        last_entry_at = entry.get('last_entry_at')
+
+        observed = observed_interval_hours(entry_dates)
+        if entry_dates:
+            newest = max(entry_dates)
+            last_entry_at = max(newest, last_entry_at) if last_entry_at else newest
+
+        if observed is None and last_entry_at:
+            # Rien de neuf : le silence depuis la dernière publication allonge la cadence estimée
+            silence = (now_utc - last_entry_at).total_seconds() / 3600
+            if avg_interval is None or silence > avg_interval:
+                observed = silence
+
+        if observed is not None:
+            avg_interval = observed if avg_interval is None else (
+                self.smoothing * observed + (1 - self.smoothing) * avg_interval
+            )
+
+        # Cadence inconnue (entrées sans date) : relire à chaque run
+        poll_hours = self.min_hours if avg_interval is None else avg_interval * self.poll_factor
+        poll_hours = min(max(poll_hours, self.min_hours), self.max_hours)
+
+        entry.update(
+            last_polled_at=now,
+            next_poll_at=now + timedelta(hours=poll_hours),
+            avg_interval_hours=avg_interval,
+            last_entry_at=last_entry_at,
+            polls=entry.get('polls', 0) + 1
+        )
+
+        with self.lock:
+            self._pending[url] = entry
+
+    def discard(self) -> None:
+        """Oublie les plannings mis à jour pendant le run : ses flux restent dus"""
+        with self.lock:
+            self._pending = {}
+
+    def flush(self) -> None:
+        """Persiste les plannings mis à jour pendant le run"""
+        with self.lock:
+            pending = self._pending
+            self._pending = {}
+
+        if not pending:
+            return
+
+        try:
+            self.db.save_feed_poll_schedule(pending)
+            with self.lock:
+                self._schedule.update(pending)
+        except Exception as e:
+            logger.warning(f"Could not save feed poll schedule: {e}")
@@ -5,8 +5,8 @@ Focus sur le contenu, la profondeur technique et les nouveautés
 
 import re
 from typing import Dict, List, Tuple, Optional
-from datetime import datetime, timedelta
 from .sources_config import NOVELTY_KEYWORDS, QUALITY_CONFIG
+from .date_resolver import article_age
 
 class QualityScorer:
     def __init__(self):
@@ -209,14 +209,13 @@ class QualityScorer:
     
     def _score_balanced_freshness(self, article: Dict) -> float:
         """Fraîcheur équilibrée, pas surdimensionnée"""
-        published = article.get('published_parsed')
-        if not published:
+        age = article_age(article)
+        if age is None:
             # Si pas de date, supposer récent mais pas optimal
             return 0.6
             
         try:
-            publish_date = datetime(*published[:6])
-            age_hours = (datetime.now() - publish_date).total_seconds() / 3600
+            age_hours = age.total_seconds() / 3600
             
             # Courbe de fraîcheur plus équilibrée
             if age_hours < 6:
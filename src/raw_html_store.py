@@ -0,0 +1,271 @@
+"""
+Stockage local des pages HTML brutes téléchargées
+Adressage par contenu (sha256 du HTML) : une page identique n'est écrite qu'une fois, quelle que soit l'URL.
+Blobs compressés (gzip, ou zstd si le module zstandard est installé) répartis en sous-dossiers ab/cd/,
+lus par mmap. L'index URL -> blob est un fichier JSON à côté des blobs, pour que le dossier se suffise
+à lui-même (copie vers une autre machine, benchmark hors ligne) ; au-delà de la taille maximale,
+les blobs les moins récemment lus sont évincés.
+"""
+
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional
+from loguru import logger
+
+from .sources_config import SCRAPING_CONFIG
+
+try:
+    import zstandard
+except ImportError:  # Dépendance optionnelle, gzip sinon
+    zstandard = None
+
+INDEX_FILE = 'index.json'
+CODEC_EXTENSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+
+# Après dépassement, l'éviction descend sous cette fraction du plafond (évite d'évincer à chaque écriture)
+EVICTION_TARGET_RATIO = 0.9
+
+
+def is_zstd_available() -> bool:
+    return zstandard is not None
+
+
+def content_digest(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+def compress(body: bytes, codec: str) -> bytes:
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    # mtime fixe : deux écritures du même contenu produisent le même fichier
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def decompress(data, codec: str) -> bytes:
+    """Décompresse un buffer (bytes ou mmap) sans copie préalable"""
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError('zstandard is required to read .zst blobs')
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompressobj(wbits=31).decompress(data)
+
+
+class RawHtmlStore:
+    """
+    Pages brutes indexées par URL, chargées en début de run et index persisté en fin de run.
+    Utilisé depuis les threads d'enrichissement : l'index est protégé par un verrou,
+    les blobs sont écrits de façon atomique (fichier temporaire puis renommage).
+    """
+
+    def __init__(self, root: str = None, max_bytes: int = None, enabled: bool = None, codec: str = None):
+        self.root = root or SCRAPING_CONFIG['raw_html_dir']
+        self.max_bytes = max_bytes or SCRAPING_CONFIG['raw_html_max_mb'] * 1024 * 1024
+        self.enabled = SCRAPING_CONFIG['raw_html_store'] if enabled is None else enabled
+        self.codec = codec or SCRAPING_CONFIG['raw_html_codec']
+        if self.codec == 'zstd' and not is_zstd_available():
+            logger.warning("zstandard is not installed, raw HTML store falls back to gzip")
+            self.codec = 'gzip'
+        self.lock = threading.Lock()
+        self._urls: Dict[str, Dict] = {}
+        self._blobs: Dict[str, Dict] = {}
+        self._disk_bytes = 0
+        self._dirty = False
+        self._loaded = False
+        self._stats = self._new_stats()
+
+    @staticmethod
+    def _new_stats() -> Dict[str, int]:
+        return {'hits': 0, 'misses': 0, 'stored': 0, 'deduplicated': 0, 'evicted': 0}
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.root, INDEX_FILE)
+
+    def _blob_path(self, digest: str, codec: str) -> str:
+        return os.path.join(self.root, digest[:2], digest[2:4], digest + CODEC_EXTENSIONS[codec])
+
+    def load(self) -> None:
+        """Charge l'index depuis le disque et réinitialise les compteurs du run"""
+        index = {}
+        if self.enabled and os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, encoding='utf-8') as f:
+                    index = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load raw HTML index, starting empty: {e}")
+
+        with self.lock:
+            self._urls = index.get('urls', {})
+            self._blobs = index.get('blobs', {})
+            self._disk_bytes = sum(blob['size'] for blob in self._blobs.values())
+            self._dirty = False
+            self._loaded = True
+            self._stats = self._new_stats()
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def __contains__(self, url: str) -> bool:
+        self._ensure_loaded()
+        with self.lock:
+            return url in self._urls
+
+    def urls(self) -> List[str]:
+        """URLs dont la page brute est disponible localement"""
+        self._ensure_loaded()
+        with self.lock:
+            return list(self._urls)
+
+    def put(self, url: str, body: bytes, truncated: bool = False) -> Optional[str]:
+        """Enregistre la page brute d'une URL ; retourne l'empreinte du blob"""
+        if not self.enabled or not body:
+            return None
+        self._ensure_loaded()
+        digest = content_digest(body)
+        now = time.time()
+
+        with self.lock:
+            known = digest in self._blobs
+        size = None
+        if not known:
+            try:
+                size = self._write_blob(digest, compress(body, self.codec))
+            except OSError as e:
+                logger.debug(f"Could not store raw HTML for {url}: {e}")
+                return None
+
+        with self.lock:
+            if size is None and digest not in self._blobs:
+                # Blob évincé entre-temps par un autre thread : la page n'est pas indexée
+                return None
+            if digest in self._blobs:
+                self._stats['deduplicated'] += 1
+                self._blobs[digest]['last_access'] = now
+            else:
+                self._blobs[digest] = {'codec': self.codec, 'size': size, 'raw_size': len(body), 'last_access': now}
+                self._disk_bytes += size
+                self._stats['stored'] += 1
+            self._urls[url] = {'digest': digest, 'fetched_at': now, 'truncated': truncated}
+            self._dirty = True
+            over_budget = self._disk_bytes > self.max_bytes
+
+        if over_budget:
+            self.evict()
+        return digest
+
+    def _write_blob(self, digest: str, data: bytes) -> int:
+        path = self._blob_path(digest, self.codec)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return len(data)
+
+    def get(self, url: str, max_age_hours: float = None) -> Optional[bytes]:
+        """Page brute d'une URL si elle est stockée (et assez récente si max_age_hours est donné)"""
+        if not self.enabled:
+            return None
+        self._ensure_loaded()
+        with self.lock:
+            entry = self._urls.get(url)
+            fresh = entry is not None and (
+                max_age_hours is None or time.time() - entry['fetched_at'] <= max_age_hours * 3600
+            )
+            blob = self._blobs.get(entry['digest']) if fresh else None
+            if blob is None:
+                self._stats['misses'] += 1
+                return None
+
+        try:
+            body = self._read_blob(entry['digest'], blob['codec'])
+        except (OSError, ValueError, RuntimeError, zlib.error) as e:
+            # Blob supprimé ou corrompu : l'entrée est oubliée, la page sera retéléchargée
+            logger.debug(f"Raw HTML blob unreadable for {url}: {e}")
+            self._forget_blob(entry['digest'])
+            with self.lock:
+                self._stats['misses'] += 1
+            return None
+
+        with self.lock:
+            blob['last_access'] = time.time()
+            self._stats['hits'] += 1
+            self._dirty = True
+        return body
+
+    def _read_blob(self, digest: str, codec: str) -> bytes:
+        with open(self._blob_path(digest, codec), 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return decompress(mapped, codec)
+
+    def _forget_blob(self, digest: str) -> None:
+        with self.lock:
+            blob = self._blobs.pop(digest, None)
+            if blob is None:
+                return
+            self._disk_bytes -= blob['size']
+            for url in [url for url, entry in self._urls.items() if entry['digest'] == digest]:
+                del self._urls[url]
+            self._dirty = True
+
+        try:
+            os.unlink(self._blob_path(digest, blob['codec']))
+        except FileNotFoundError:
+            pass
+
+    def evict(self) -> int:
+        """Supprime les blobs les moins récemment lus jusqu'à repasser sous le plafond"""
+        target = self.max_bytes * EVICTION_TARGET_RATIO
+        with self.lock:
+            if self._disk_bytes <= self.max_bytes:
+                return 0
+            by_age = sorted(self._blobs.items(), key=lambda item: item[1]['last_access'])
+            victims, freed = [], 0
+            for digest, blob in by_age:
+                if self._disk_bytes - freed <= target:
+                    break
+                victims.append(digest)
+                freed += blob['size']
+
+        for digest in victims:
+            self._forget_blob(digest)
+        with self.lock:
+            self._stats['evicted'] += len(victims)
+        logger.debug(f"Raw HTML store: evicted {len(victims)} blobs ({freed} bytes)")
+        return len(victims)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {**self._stats, 'pages': len(self._urls), 'blobs': len(self._blobs), 'disk_bytes': self._disk_bytes}
+
+    def flush(self) -> None:
+        """Persiste l'index (écriture atomique) s'il a changé pendant le run"""
+        with self.lock:
+            if not self.enabled or not self._dirty:
+                return
+            data = json.dumps({'urls': self._urls, 'blobs': self._blobs})
+            self._dirty = False
+
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Could not save raw HTML index: {e}")
+            with self.lock:
+                self._dirty = True
@@ -0,0 +1,89 @@
+"""
+Budget de temps d'un run (scraping, puis génération pour le scheduler)
+L'échéance est propagée à chaque étape : attentes sur les pools, timeouts des requêtes, moteur asyncio.
+À expiration, le travail en attente est annulé, celui en cours abandonné, et le run retourne
+ce qui est déjà terminé, marqué partiel.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Dict, Iterable, Iterator, Optional
+from loguru import logger
+
+# Timeout minimal d'une requête lancée juste avant l'échéance (en dessous, elle échouerait de toute façon)
+MIN_REQUEST_TIMEOUT = 1.0
+
+
+class RunDeadline:
+    """Échéance partagée par toutes les étapes d'un run ; sans budget, aucune limite"""
+
+    def __init__(self, seconds: Optional[float] = None, expires_at: Optional[float] = None):
+        if expires_at is None and seconds:
+            expires_at = time.monotonic() + seconds
+        self.expires_at = expires_at
+        self.lock = threading.Lock()
+        self._abandoned: Dict[str, int] = {}
+
+    def sub_deadline(self, seconds: Optional[float]) -> 'RunDeadline':
+        """Échéance d'une étape : son propre budget, sans dépasser celui du run"""
+        own = RunDeadline(seconds)
+        if own.expires_at is None or (self.expires_at is not None and self.expires_at < own.expires_at):
+            return RunDeadline(expires_at=self.expires_at)
+        return own
+
+    def extended(self, seconds: float) -> 'RunDeadline':
+        """Même échéance repoussée de `seconds` (délai de grâce), comptes d'abandons partagés"""
+        extended = RunDeadline(expires_at=None if self.expires_at is None else self.expires_at + seconds)
+        extended.lock, extended._abandoned = self.lock, self._abandoned
+        return extended
+
+    def remaining(self, cap: Optional[float] = None) -> Optional[float]:
+        """Secondes restantes, plafonnées par `cap` ; None si ni budget ni plafond"""
+        if self.expires_at is None:
+            return cap
+        left = max(0.0, self.expires_at - time.monotonic())
+        return left if cap is None else min(cap, left)
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def request_timeout(self, timeout: float) -> float:
+        """Timeout d'une requête réseau, réduit pour ne pas dépasser l'échéance"""
+        return max(MIN_REQUEST_TIMEOUT, self.remaining(timeout))
+
+    def record_abandoned(self, stage: str, count: int) -> None:
+        if count <= 0:
+            return
+        with self.lock:
+            self._abandoned[stage] = self._abandoned.get(stage, 0) + count
+
+    @property
+    def abandoned(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self._abandoned)
+
+    @property
+    def partial(self) -> bool:
+        """Vrai si une étape a été interrompue (échéance du run ou plafond de l'étape)"""
+        with self.lock:
+            return bool(self._abandoned)
+
+
+def completed_within(futures: Iterable[Future], deadline: RunDeadline, cap: Optional[float] = None,
+                     stage: str = 'tasks') -> Iterator[Future]:
+    """
+    as_completed borné par l'échéance du run (et le plafond de l'étape) : à expiration, les tâches
+    pas encore démarrées sont annulées, les autres abandonnées, sans lever d'exception.
+    """
+    futures = list(futures)
+    try:
+        for future in as_completed(futures, timeout=deadline.remaining(cap)):
+            yield future
+    except FuturesTimeoutError:
+        pending = [future for future in futures if not future.done()]
+        for future in pending:
+            future.cancel()
+        deadline.record_abandoned(stage, len(pending))
+        logger.warning(f"Deadline reached: {len(pending)} {stage} abandoned, keeping completed results")
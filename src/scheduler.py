@@ -6,6 +6,8 @@ import os
 from src.enhanced_scraper import EnhancedFullstackScraper
 from src.specialized_generator import SpecializedPostGenerator
 from src.database import DatabaseManager
+from src.run_budget import RunDeadline
+from src.sources_config import SCRAPING_CONFIG
 from src.api_docs import run_web_interface
 import threading
 
@@ -21,17 +23,23 @@ class PostScheduler:
     def generate_posts(self):
         logger.info("Starting post generation process")
         
+        # Budget du run : le scraping a sa part, la génération dispose du reste
+        scrape_seconds = SCRAPING_CONFIG['run_deadline_seconds']
+        generation_seconds = SCRAPING_CONFIG['generation_deadline_seconds']
+        deadline = RunDeadline((scrape_seconds + generation_seconds) if scrape_seconds and generation_seconds else None)
+        
         try:
             # Scrape articles
-            articles = self.scraper.scrape_all_sources(self.max_articles)
-            logger.info(f"Scraped {len(articles)} articles")
+            articles = self.scraper.scrape_all_sources(self.max_articles, deadline=deadline.sub_deadline(scrape_seconds))
+            logger.info(f"Scraped {len(articles)} articles"
+                        + (" (partial: run deadline reached)" if self.scraper.last_run_stats.get('partial') else ""))
             
             if not articles:
                 logger.warning("No articles found during scraping")
                 return
             
             # Generate specialized posts by domain
-            specialized_posts = self.generator.generate_specialized_posts(articles)
+            specialized_posts = self.generator.generate_specialized_posts(articles, deadline=deadline)
             logger.info(f"Generated {len(specialized_posts)} specialized post(s)")
             
             # Save to database
@@ -0,0 +1,100 @@
+"""
+Exécuteurs partagés du scraping
+Des pools de threads longue durée pour tout le processus, au lieu d'un pool par domaine et par étape :
+le nombre de requêtes simultanées est borné globalement même quand plusieurs domaines tournent en parallèle.
+Le parsing (feedparser, lxml, readability) passe par un pool de processus : les threads ne font que l'I/O.
+
+Les processus démarrent en 'spawn' et réimportent le module __main__ du parent : le point d'entrée
+(main.py, scripts de benchmark) doit être importable sans effet de bord, imports de l'application et
+initialisations (base, Flask, logs) dans main() ou sous `if __name__ == '__main__'`. Sinon chaque
+processus de parsing rechargerait toute l'application.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+from loguru import logger
+
+from .sources_config import SCRAPING_CONFIG
+
+_io_executor = None
+_domain_executor = None
+_cpu_executor = None
+_cpu_disabled = False
+_executors_lock = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """Pool partagé pour les tâches réseau (flux et enrichissement des articles)"""
+    global _io_executor
+    if _io_executor is None:
+        with _executors_lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(
+                    max_workers=SCRAPING_CONFIG['io_max_workers'],
+                    thread_name_prefix='scrape-io'
+                )
+    return _io_executor
+
+
+def get_domain_executor() -> ThreadPoolExecutor:
+    """
+    Pool des pipelines de domaine. Séparé du pool réseau : un pipeline attend ses tâches réseau
+    et ne doit pas occuper un slot dont elles ont besoin.
+    """
+    global _domain_executor
+    if _domain_executor is None:
+        with _executors_lock:
+            if _domain_executor is None:
+                _domain_executor = ThreadPoolExecutor(
+                    max_workers=SCRAPING_CONFIG['max_concurrent_domains'],
+                    thread_name_prefix='scrape-domain'
+                )
+    return _domain_executor
+
+
+def cpu_worker_count() -> int:
+    """Processus du pool CPU : configuré, sinon un par cœur"""
+    return SCRAPING_CONFIG['cpu_max_workers'] or os.cpu_count() or 1
+
+
+def get_cpu_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    Pool de processus pour le parsing, ou None s'il est désactivé. Avec un seul processus
+    (machine à un cœur), le transfert entre processus ne serait compensé par aucun parallélisme.
+    Démarrage 'spawn' : un fork d'un processus qui a déjà des threads (pools réseau, verrous) peut bloquer.
+    """
+    global _cpu_executor
+    if _cpu_executor is None and SCRAPING_CONFIG['parse_in_processes'] and not _cpu_disabled and cpu_worker_count() > 1:
+        with _executors_lock:
+            if _cpu_executor is None:
+                _cpu_executor = ProcessPoolExecutor(
+                    max_workers=cpu_worker_count(),
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+    return _cpu_executor
+
+
+def run_cpu_task(fn: Callable, *args) -> Any:
+    """
+    Exécute une fonction CPU (module parse_worker) dans le pool de processus et attend son résultat ;
+    le thread appelant libère le GIL pendant l'attente. Repli dans le thread si le pool est indisponible.
+    """
+    global _cpu_executor, _cpu_disabled
+    executor = get_cpu_executor()
+    if executor is None:
+        return fn(*args)
+
+    try:
+        return executor.submit(fn, *args).result()
+    except BrokenProcessPool as e:
+        # Processus tué (OOM) ou pool arrêté : parsing dans le thread pour le reste du processus
+        logger.warning(f"CPU process pool unavailable, parsing in threads from now on: {e}")
+        with _executors_lock:
+            _cpu_disabled = True
+            _cpu_executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        return fn(*args)
@@ -0,0 +1,240 @@
+"""
+Index persistant des entrées de flux déjà traitées
+Chaque entrée est identifiée par son GUID (ou son lien canonique) et une empreinte de son contenu :
+une entrée inchangée depuis un run précédent n'est ni reconstruite ni enrichie.
+Les articles acceptés sont conservés par domaine, réhydratés puis seulement rescorés, y compris quand
+leur flux n'est pas relu (304, corps ou date inchangés, flux pas encore dû).
+Seules les entrées tranchées par le post-filtrage (acceptées ou rejetées) sont persistées : une entrée
+abandonnée à l'échéance du run, ou dont l'enrichissement a échoué, repasse dans le pipeline au run suivant.
+"""
+
+import hashlib
+import json
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from loguru import logger
+
+from .sources_config import SCRAPING_CONFIG
+
+# Champs propres à un run ou recalculés à la liaison, jamais persistés
+TRANSIENT_FIELDS = {'source_config', 'published_parsed', 'entry_key', 'rehydrated', 'from_cache'}
+DATETIME_FIELDS = ('published', 'scraped_at')
+
+
+def canonical_link(link: str) -> str:
+    """Lien sans fragment, paramètres de tracking ni slash final ; host en minuscules"""
+    parts = urlsplit(link.strip())
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_')
+    ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/') or '/', query, ''))
+
+
+def entry_key(feed_url: str, entry: Dict) -> Optional[str]:
+    """Clé stable d'une entrée : GUID du flux, sinon lien canonique (les GUID ne sont uniques que par flux)"""
+    identifier = entry.get('id') or entry.get('guid')
+    if not identifier and entry.get('link'):
+        identifier = canonical_link(entry['link'])
+    if not identifier:
+        return None
+    return hashlib.sha256(f"{feed_url}\n{identifier}".encode('utf-8')).hexdigest()
+
+
+def entry_fingerprint(entry: Dict) -> str:
+    """Empreinte du contenu publié d'une entrée : change si le titre, le résumé ou la date de mise à jour changent"""
+    parts = (
+        entry.get('title', ''),
+        entry.get('link', ''),
+        entry.get('summary', ''),
+        entry.get('updated', '') or entry.get('published', ''),
+    )
+    return hashlib.sha256('\x00'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+
+def serialize_article(article: Dict) -> Dict:
+    """Copie JSON d'un article (dates en ISO 8601), sans les champs propres au run"""
+    data = {key: value for key, value in article.items() if key not in TRANSIENT_FIELDS}
+    for field in DATETIME_FIELDS:
+        if isinstance(data.get(field), datetime):
+            data[field] = data[field].isoformat()
+    return json.loads(json.dumps(data, default=str))
+
+
+def deserialize_article(data: Dict) -> Dict:
+    article = dict(data)
+    for field in DATETIME_FIELDS:
+        if isinstance(article.get(field), str):
+            try:
+                article[field] = datetime.fromisoformat(article[field])
+            except ValueError:
+                article.pop(field)
+    return article
+
+
+class SeenEntryIndex:
+    """
+    Empreintes des entrées vues, chargées en début de run et persistées en fin de run.
+    Les articles acceptés (volumineux) ne sont lus qu'à la demande, pour les entrées inchangées.
+    """
+
+    def __init__(self, db_manager, enabled: bool = None, retention_days: int = None):
+        self.db = db_manager
+        self.enabled = SCRAPING_CONFIG['seen_entry_index'] if enabled is None else enabled
+        self.retention_days = retention_days or SCRAPING_CONFIG['seen_entry_retention_days']
+        self.lock = threading.Lock()
+        self._fingerprints: Dict[str, str] = {}
+        self._pending: Dict[str, Dict] = {}
+        self._touched: set = set()
+        self._accepted: Dict[str, Dict[str, Dict]] = {}
+        self._decided: set = set()
+        self._failed: set = set()
+        self._unchanged_by_feed: Dict[str, int] = {}
+        self._stats = self._new_stats()
+
+    @staticmethod
+    def _new_stats() -> Dict[str, int]:
+        return {'new': 0, 'changed': 0, 'unchanged': 0, 'rehydrated': 0}
+
+    def load(self) -> None:
+        """Charge les empreintes persistées et réinitialise l'état du run"""
+        fingerprints = {}
+        if self.enabled:
+            try:
+                fingerprints = self.db.get_seen_entry_fingerprints()
+            except Exception as e:
+                logger.warning(f"Could not load seen entry index: {e}")
+
+        with self.lock:
+            self._fingerprints = fingerprints
+            self._pending = {}
+            self._touched = set()
+            self._accepted = {}
+            self._decided = set()
+            self._failed = set()
+            self._unchanged_by_feed = {}
+            self._stats = self._new_stats()
+
+    def classify(self, feed_url: str, entry: Dict) -> Tuple[Optional[str], str, bool]:
+        """Retourne (clé, empreinte, inchangée) et enregistre l'entrée comme vue pendant ce run"""
+        key = entry_key(feed_url, entry)
+        fingerprint = entry_fingerprint(entry)
+        if key is None:
+            return None, fingerprint, False
+
+        with self.lock:
+            previous = self._fingerprints.get(key)
+            if previous == fingerprint:
+                self._touched.add(key)
+                self._stats['unchanged'] += 1
+                self._unchanged_by_feed[feed_url] = self._unchanged_by_feed.get(feed_url, 0) + 1
+                return key, fingerprint, True
+
+            self._stats['new' if previous is None else 'changed'] += 1
+            self._pending[key] = {
+                'feed_url': feed_url,
+                'article_url': entry.get('link', ''),
+                'fingerprint': fingerprint,
+                # Une entrée modifiée repasse dans le pipeline : ses anciennes acceptations ne valent plus
+                'reset_accepted': previous is not None
+            }
+        return key, fingerprint, False
+
+    def accepted_articles(self, keys: List[str]) -> Dict[str, Dict[str, Dict]]:
+        """Articles acceptés lors des runs précédents pour des entrées inchangées : clé -> domaine -> article"""
+        if not keys:
+            return {}
+        try:
+            stored = self.db.get_seen_entry_articles(keys)
+        except Exception as e:
+            logger.warning(f"Could not load accepted articles from seen entry index: {e}")
+            return {}
+
+        return {
+            key: {domain: deserialize_article(data) for domain, data in by_domain.items()}
+            for key, by_domain in stored.items()
+        }
+
+    def accepted_articles_for_feed(self, feed_url: str) -> Dict[str, Dict[str, Dict]]:
+        """
+        Articles acceptés lors des runs précédents pour les entrées d'un flux qui n'a pas été relu :
+        clé -> domaine -> article. Les entrées restent marquées comme vues (pas d'expiration).
+        """
+        if not self.enabled:
+            return {}
+        try:
+            stored = self.db.get_seen_entry_articles_for_feeds([feed_url]).get(feed_url, {})
+        except Exception as e:
+            logger.warning(f"Could not load accepted articles for {feed_url} from seen entry index: {e}")
+            return {}
+
+        with self.lock:
+            self._touched.update(stored)
+        return {
+            key: {domain: deserialize_article(data) for domain, data in by_domain.items()}
+            for key, by_domain in stored.items()
+        }
+
+    def record_rehydrated(self, count: int = 1) -> None:
+        with self.lock:
+            self._stats['rehydrated'] += count
+
+    def record_decided(self, article: Dict, failed: bool = False) -> None:
+        """Entrée tranchée par le post-filtrage ; failed : décision prise sans contenu (enrichissement en erreur)"""
+        key = article.get('entry_key')
+        if not self.enabled or not key or article.get('rehydrated'):
+            return
+        with self.lock:
+            (self._failed if failed else self._decided).add(key)
+
+    def record_accepted(self, article: Dict, domain: str) -> None:
+        """Mémorise un article accepté par le pipeline d'un domaine (sérialisé tout de suite : le dict évolue ensuite)"""
+        key = article.get('entry_key')
+        if not self.enabled or not key or article.get('rehydrated'):
+            return
+        data = serialize_article(article)
+        with self.lock:
+            self._accepted.setdefault(key, {})[domain] = data
+
+    def unchanged_count(self, urls: List[str] = None) -> int:
+        """Entrées inchangées depuis un run précédent, pour tous les flux ou ceux demandés"""
+        with self.lock:
+            if urls is None:
+                return sum(self._unchanged_by_feed.values())
+            return sum(self._unchanged_by_feed.get(url, 0) for url in urls)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self._stats)
+
+    def flush(self, partial: bool = False) -> None:
+        """
+        Persiste les entrées nouvelles ou modifiées tranchées pendant le run, leurs acceptations et la date de
+        dernier passage. Run partiel (échéance atteinte) : aucune nouvelle empreinte n'est gardée.
+        """
+        with self.lock:
+            pending, touched, accepted = self._pending, self._touched, self._accepted
+            decided = self._decided - self._failed
+            self._pending, self._touched, self._accepted = {}, set(), {}
+            self._decided, self._failed = set(), set()
+
+        if not self.enabled:
+            return
+
+        kept = {} if partial else {key: entry for key, entry in pending.items() if key in decided}
+        if len(kept) < len(pending):
+            logger.debug(f"{len(pending) - len(kept)} undecided entries not saved to the seen entry index")
+        pending = kept
+        accepted = {key: by_domain for key, by_domain in accepted.items() if key in pending}
+
+        if not (pending or touched or accepted):
+            return
+
+        try:
+            self.db.save_seen_entries(pending, accepted, touched)
+            with self.lock:
+                self._fingerprints.update({key: entry['fingerprint'] for key, entry in pending.items()})
+        except Exception as e:
+            logger.warning(f"Could not save seen entry index: {e}")
@@ -3,6 +3,8 @@ Configuration des sources RSS spécialisées par technologie
 Focus sur les nouveautés et articles de qualité
 """
 
+import os
+
 SPECIALIZED_SOURCES = {
     'frontend': {
         'react': [
@@ -217,4 +219,60 @@ QUALITY_CONFIG = {
         'underrepresented_bonus': 1.3,   # Bonus pour technologies sous-représentées
         'overrepresented_penalty': 0.7   # Malus pour technologies sur-représentées
     }
-}
\ No newline at end of file
+}
+
+# Configuration des performances du scraping
+SCRAPING_CONFIG = {
+    'http_pool_connections': int(os.getenv('SCRAPER_HTTP_POOL_CONNECTIONS', 64)),  # Nombre de hosts gardés en pool
+    'http_pool_maxsize': int(os.getenv('SCRAPER_HTTP_POOL_MAXSIZE', 10)),          # Connexions keep-alive par host
+    'fetch_engine': os.getenv('SCRAPER_FETCH_ENGINE', 'threads'),                  # 'threads' ou 'async' (aiohttp)
+    'async_max_in_flight': int(os.getenv('SCRAPER_ASYNC_MAX_IN_FLIGHT', 200)),     # Requêtes simultanées max
+    'async_per_host_limit': int(os.getenv('SCRAPER_ASYNC_PER_HOST', 8)),           # Requêtes simultanées max par host
+    'max_concurrent_domains': int(os.getenv('SCRAPER_MAX_CONCURRENT_DOMAINS', 3)), # Domaines scrapés en parallèle
+    'io_max_workers': int(os.getenv('SCRAPER_IO_MAX_WORKERS', 24)),                # Threads réseau partagés par tous les domaines
+    'pipeline_mode': os.getenv('SCRAPER_PIPELINE_MODE', 'stages'),                 # 'stages' ou 'streaming' (article par article)
+    'pipeline_queue_size': int(os.getenv('SCRAPER_PIPELINE_QUEUE_SIZE', 32)),      # Articles en cours max par domaine en streaming
+    'circuit_failure_threshold': int(os.getenv('SCRAPER_CIRCUIT_FAILURES', 3)),    # Échecs consécutifs avant ouverture du circuit d'un host
+    'circuit_open_seconds': float(os.getenv('SCRAPER_CIRCUIT_OPEN_SECONDS', 300)), # Durée d'ouverture avant une requête de test
+    'feed_quarantine_after_runs': int(os.getenv('SCRAPER_QUARANTINE_AFTER_RUNS', 3)), # Runs consécutifs en échec avant quarantaine
+    'feed_quarantine_hours': float(os.getenv('SCRAPER_QUARANTINE_HOURS', 24)),     # Durée de la quarantaine d'un flux
+    'adaptive_polling': os.getenv('SCRAPER_ADAPTIVE_POLLING', 'true').lower() == 'true', # Ne relire que les flux dus
+    'poll_min_hours': float(os.getenv('SCRAPER_POLL_MIN_HOURS', 1)),               # Intervalle de polling minimal d'un flux
+    'poll_max_hours': float(os.getenv('SCRAPER_POLL_MAX_HOURS', 72)),              # Intervalle de polling maximal d'un flux
+    'poll_interval_factor': float(os.getenv('SCRAPER_POLL_FACTOR', 0.5)),          # Fraction de l'intervalle de publication estimé
+    'article_max_bytes': int(os.getenv('SCRAPER_ARTICLE_MAX_BYTES', 1_500_000)),   # Plafond de lecture d'une page d'article
+    'article_content_types': ('text/html', 'application/xhtml+xml'),                # Types de contenu enrichis (les autres sont ignorés)
+    'content_extractor': os.getenv('SCRAPER_CONTENT_EXTRACTOR', 'lxml'),           # 'lxml' (un seul parsing) ou 'readability' (ancien chemin)
+    'feed_reader': os.getenv('SCRAPER_FEED_READER', 'iterparse'),                  # 'iterparse' (arrêt après les entrées utiles) ou 'feedparser'
+    'seen_entry_index': os.getenv('SCRAPER_SEEN_ENTRY_INDEX', 'true').lower() == 'true', # Ne retraiter que les entrées nouvelles ou modifiées
+    'seen_entry_retention_days': int(os.getenv('SCRAPER_SEEN_ENTRY_RETENTION_DAYS', 30)), # Oubli des entrées disparues des flux
+    'raw_html_store': os.getenv('SCRAPER_RAW_HTML_STORE', 'true').lower() == 'true', # Conserver les pages brutes téléchargées
+    'raw_html_dir': os.getenv('SCRAPER_RAW_HTML_DIR', 'data/raw_html'),            # Dossier du stockage des pages brutes
+    'raw_html_max_mb': int(os.getenv('SCRAPER_RAW_HTML_MAX_MB', 512)),             # Taille maximale sur disque (éviction LRU)
+    'raw_html_codec': os.getenv('SCRAPER_RAW_HTML_CODEC', 'gzip'),                 # 'gzip' ou 'zstd' (nécessite zstandard)
+    'raw_html_reuse_hours': float(os.getenv('SCRAPER_RAW_HTML_REUSE_HOURS', 24)),  # Page locale réutilisée au lieu d'être retéléchargée
+    'raw_html_offline': os.getenv('SCRAPER_RAW_HTML_OFFLINE', 'false').lower() == 'true', # Réextraction depuis les pages locales uniquement
+    'parse_in_processes': os.getenv('SCRAPER_PARSE_IN_PROCESSES', 'true').lower() == 'true', # Parsing des flux et des pages hors du GIL
+    'cpu_max_workers': int(os.getenv('SCRAPER_CPU_MAX_WORKERS', 0)),               # Processus de parsing (0 = un par cœur, 1 = dans les threads)
+    'run_deadline_seconds': float(os.getenv('SCRAPER_RUN_DEADLINE_SECONDS', 240)), # Budget d'un run de scraping (0 = sans limite)
+    'generation_deadline_seconds': float(os.getenv('GENERATION_DEADLINE_SECONDS', 300)), # Budget de la génération des posts (appels LLM)
+    'http_archive_mode': os.getenv('SCRAPER_HTTP_ARCHIVE_MODE', '').lower(),       # '' (réseau), 'record' ou 'replay' (sans réseau)
+    'http_archive_path': os.getenv('SCRAPER_HTTP_ARCHIVE', 'data/http_archive.zip'), # Archive des réponses HTTP enregistrées
+    'http_replay_latency': os.getenv('SCRAPER_HTTP_REPLAY_LATENCY', 'host'),       # 'host' (médiane du host), 'recorded' ou 'none'
+    'http_replay_latency_scale': float(os.getenv('SCRAPER_HTTP_REPLAY_LATENCY_SCALE', 1.0)), # Multiplicateur de la latence simulée
+}
+
+# Base de données : un moteur et un pool de connexions par fichier pour tout le processus
+DATABASE_CONFIG = {
+    'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),                               # Connexions gardées ouvertes dans le pool
+    'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 40)),                         # Connexions supplémentaires en pointe (threads du scraper)
+    'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', 30)),                       # Attente maximale d'une connexion libre
+    'sqlite_journal_mode': os.getenv('DB_JOURNAL_MODE', 'wal'),                    # 'wal' : lectures et écriture simultanées ('delete' : journal par défaut)
+    'sqlite_synchronous': os.getenv('DB_SYNCHRONOUS', 'normal'),                   # 'normal' suffit en WAL (durable hors coupure de courant)
+    'sqlite_busy_timeout_ms': int(os.getenv('DB_BUSY_TIMEOUT_MS', 10000)),         # Attente du verrou d'écriture avant "database is locked"
+    'sqlite_cache_mb': int(os.getenv('DB_CACHE_MB', 16)),                          # Cache de pages par connexion
+    'sqlite_mmap_mb': int(os.getenv('DB_MMAP_MB', 256)),                           # Lecture du fichier par mmap (0 = désactivé)
+    'write_behind': os.getenv('DB_WRITE_BEHIND', 'true').lower() == 'true',        # Cache enrichi écrit par un thread unique (sinon par chaque worker)
+    'write_batch_rows': int(os.getenv('DB_WRITE_BATCH_ROWS', 100)),                # Lignes max par transaction du thread écrivain
+    'write_flush_ms': float(os.getenv('DB_WRITE_FLUSH_MS', 200)),                  # Attente max d'une ligne avant l'écriture de son lot
+}
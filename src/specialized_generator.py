@@ -6,6 +6,7 @@ import json
 from datetime import datetime
 import random
 from .post_style_variations import PostStyleVariations
+from .run_budget import RunDeadline
 
 class SpecializedPostGenerator:
     def __init__(self):
@@ -60,14 +61,23 @@ class SpecializedPostGenerator:
             except Exception as e:
                 logger.debug(f"Error emitting progress: {e}")
         
-    def generate_specialized_posts(self, articles: List[Dict]) -> List[Dict]:
-        """Génère des posts spécialisés pour chaque domaine ayant suffisamment d'articles"""
+    def generate_specialized_posts(self, articles: List[Dict], deadline: RunDeadline = None) -> List[Dict]:
+        """
+        Génère des posts spécialisés pour chaque domaine ayant suffisamment d'articles.
+        Après l'échéance, aucun nouvel appel LLM : les posts déjà générés sont retournés.
+        """
         specialized_posts = []
         
         # Organiser les articles par domaine
         articles_by_domain = self._organize_articles_by_domain(articles)
         
-        for domain_key, domain_articles in articles_by_domain.items():
+        for index, (domain_key, domain_articles) in enumerate(articles_by_domain.items()):
+            if deadline is not None and deadline.expired():
+                skipped = len(articles_by_domain) - index
+                deadline.record_abandoned('posts', skipped)
+                logger.warning(f"Generation deadline reached, skipping {skipped} remaining domain(s)")
+                break
+            
             # Générer un post seulement si on a au moins 3 articles dans le domaine
             if len(domain_articles) >= 3:
                 post = self._generate_domain_post(domain_key, domain_articles)
@@ -0,0 +1,132 @@
+"""
+Nettoyage du texte des articles
+Motifs compilés une fois au chargement du module et fusionnés (alternatives factorisées en trie) :
+un passage de regex pour le bruit d'interface, un pour les URLs, une table de traduction
+pour les caractères de contrôle et un passage pour les espaces
+"""
+
+import re
+from typing import Dict, Iterable
+
+# Bruit d'interface (navigation, partage, publicité), insensible à la casse
+UI_NOISE_PHRASES = (
+    'skip to main content', 'navigation', 'menu', 'search', 'login', 'sign up',
+    'subscribe', 'newsletter', 'follow us', 'this website uses cookies',
+    'privacy policy', 'terms of service', 'share on', 'tweet', 'facebook', 'linkedin',
+    'advertisement', 'sponsored', 'promotion',
+)
+
+# Suffixes traités comme des domaines isolés ("example.io", "foo.oregon")
+DOMAIN_SUFFIXES = (
+    'com', 'org', 'net', 'edu', 'gov', 'mil', 'int', 'co', 'io', 'dev', 'app', 'ai', 'ml', 'xyz', 'tech',
+    'info', 'biz', 'name', 'pro', 'aero', 'museum', 'coop', 'travel', 'jobs', 'mobi', 'cat', 'tel', 'asia',
+    'post', 'test', 'bitnet', 'csnet', 'arpa', 'nato', 'example', 'invalid', 'localhost', 'localdomain',
+    'onion', 'local', 'internal', 'private', 'corp', 'home', 'host', 'lan', 'wan', 'web', 'root', 'mail',
+    'users', 'admin', 'oracle', 'ibm', 'apple', 'sony', 'nasa', 'mit', 'stanford', 'oxford', 'cambridge',
+    'harvard', 'yale', 'princeton', 'berkeley', 'ucla', 'nyu', 'columbia', 'cornell', 'duke', 'rice', 'cmu',
+    'gatech', 'purdue', 'umich', 'unc', 'uw', 'ut', 'osu', 'psu', 'umd', 'rutgers', 'indiana', 'uiuc',
+    'wisc', 'iowa', 'msu', 'umn', 'missouri', 'arizona', 'colorado', 'oregon', 'washington', 'nevada',
+    'utah', 'idaho', 'montana', 'wyoming', 'alaska', 'hawaii', 'maine', 'vermont', 'newhampshire',
+    'massachusetts', 'rhodeisland', 'connecticut', 'newyork', 'newjersey', 'pennsylvania', 'delaware',
+    'maryland', 'virginia', 'westvirginia', 'northcarolina', 'southcarolina', 'georgia', 'florida',
+    'alabama', 'mississippi', 'tennessee', 'kentucky', 'ohio', 'michigan', 'illinois', 'wisconsin',
+    'minnesota', 'arkansas', 'louisiana', 'texas', 'oklahoma', 'kansas', 'nebraska', 'southdakota',
+    'northdakota', 'newmexico', 'california',
+)
+
+URL_SCHEMES = (
+    'ftp', 'ftps', 'ssh', 'telnet', 'gopher', 'file', 'mailto', 'news', 'nntp', 'prospero', 'aim', 'webcal',
+    'xmpp', 'tel', 'sms', 'bitcoin', 'geo', 'magnet', 'urn', 'spotify', 'lastfm', 'skype', 'facetime',
+    'callto', 'discord', 'slack', 'zoom', 'teams', 'meet',
+)
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """
+    Alternative regex factorisée en trie ("co|com|cmu" -> "c(?:mu|om?)") :
+    le moteur ne reteste pas les préfixes communs pour chaque mot
+    """
+    trie: Dict = {}
+    for word in set(words):
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        optional = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if optional:
+            return ('(?:' + body + ')?') if len(branches) > 1 or len(body) > 1 else body + '?'
+        return body
+
+    return build(trie)
+
+
+def _first_chars(words: Iterable[str]) -> str:
+    return '[' + ''.join(sorted({re.escape(word[0]) for word in words})) + ']'
+
+
+# Le lookahead sur la première lettre évite d'essayer toutes les alternatives à chaque position
+UI_NOISE = re.compile(
+    '(?=' + _first_chars(UI_NOISE_PHRASES) + ')(?:' + trie_pattern(UI_NOISE_PHRASES) + r'|ads?\s*by)',
+    re.IGNORECASE
+)
+
+_URL_CHARS = r'[^\s<>"{}|\\^`\[\]]+'
+
+URLS = re.compile(
+    r'https?://' + _URL_CHARS + '|'
+    + r'www\.' + _URL_CHARS + '|'
+    # Domaines isolés ; le lookbehind évite de retenter le motif à chaque caractère d'un mot
+    + r'(?<![a-z0-9-])[a-z0-9][a-z0-9-]*\.' + trie_pattern(DOMAIN_SUFFIXES) + r'(?:[/\s,.:;!?)}\]"]|$)|'
+    # Autres protocoles, cherchés aussi en milieu de mot comme avant ("hotel:x" perd "tel:x")
+    + trie_pattern(URL_SCHEMES) + ':' + _URL_CHARS + '|'
+    + r'\[(?:link|url)\]|\((?:link|url)\)|'
+    + r'<a\s+[^>]*>.*?</a>',
+    re.IGNORECASE
+)
+
+WHITESPACE = re.compile(r'\s+')
+
+# Caractères de contrôle supprimés en une passe ; ceux qui sont des espaces sont gérés par WHITESPACE
+_ARTICLE_CONTROL_CHARS = str.maketrans('', '', ''.join(
+    chr(code) for code in (*range(0x00, 0x20), *range(0x7f, 0xa0))
+    if not chr(code).isspace()
+))
+_SUMMARY_CONTROL_CHARS = str.maketrans('', '', ''.join(
+    chr(code) for code in (*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), 0x7f)
+))
+
+HTML_TAG = re.compile(r'<[^>]+>')
+HTML_ENTITIES = {'&lt;': '<', '&gt;': '>', '&amp;': '&', '&quot;': '"', '&#39;': "'", '&nbsp;': ' '}
+HTML_ENTITY = re.compile('|'.join(HTML_ENTITIES))
+REPEATED_SEPARATORS = re.compile(r'[-=_*]{4,}')
+
+
+def clean_article_text(text: str) -> str:
+    """Texte extrait d'une page : sans bruit d'interface, URLs ni caractères de contrôle, espaces normalisés"""
+    if not text:
+        return ""
+
+    text = URLS.sub('', UI_NOISE.sub('', text))
+    text = text.translate(_ARTICLE_CONTROL_CHARS)
+    return WHITESPACE.sub(' ', text).strip()
+
+
+def clean_summary(html: str) -> str:
+    """Résumé d'un flux : balises retirées, entités décodées, espaces et séparateurs normalisés"""
+    if not html:
+        return ""
+
+    text = HTML_TAG.sub('', html)
+    if '&' in text:
+        # Entités courantes décodées en un passage
+        text = HTML_ENTITY.sub(lambda match: HTML_ENTITIES[match.group(0)], text)
+    # Le contrôle \x0b/\x0c est supprimé (pas remplacé par une espace), comme avant
+    text = text.translate(_SUMMARY_CONTROL_CHARS)
+    text = WHITESPACE.sub(' ', text)
+    return REPEATED_SEPARATORS.sub('', text).strip()
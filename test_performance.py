@@ -1,91 +1,255 @@
 #!/usr/bin/env python3
 """
-Script pour tester les performances du scraping
-Compare avant/après les optimisations
+Benchmark de bout en bout du scraping, sans réseau
+Un serveur local sert un corpus généré (N flux x M entrées, latence, taux d'erreur et taille des pages
+configurables), ou une archive HTTP enregistrée est rejouée (--replay), et scrape_all_sources est
+exécuté plusieurs fois dans un dossier de travail temporaire : base, caches et pages brutes sont isolés
+des données réelles. Le premier run part de caches vides, les suivants mesurent les caches chauds.
+
+Chaque run force la relecture des flux (force_poll : ni requêtes conditionnelles, ni flux ignorés comme
+inchangés ou pas encore dus) : un run à chaud mesure un scraping complet avec caches chauds, pas un run vide.
+Un run qui ne collecte rien est signalé (champ nothing_collected, avertissement).
+
+Rapport : durée, durées par étape et par domaine, requêtes/s, pic de RSS et taux de succès des caches ;
+le détail est écrit en JSON avec le commit courant pour comparer les résultats d'un commit à l'autre.
+
+Usage : python test_performance.py --feeds 60 --entries 10 --latency-ms 50 --runs 2 --json logs/perf.json
+        python test_performance.py --replay data/http_archive.zip --runs 3
 """
 
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
 import time
 from datetime import datetime
-from src.enhanced_scraper import EnhancedFullstackScraper
-from src.database import DatabaseManager
+from typing import Dict, List, Optional
+
 from loguru import logger
 
-def measure_scraping_performance():
-    """Mesure les performances du scraping"""
-    logger.info("Starting performance test...")
-    
-    # Initialiser le scraper
-    db = DatabaseManager()
-    scraper = EnhancedFullstackScraper(db)
-    
-    # Mesurer le temps de scraping
-    start_time = time.time()
-    start_datetime = datetime.now()
-    
+DOMAINS = ('backend', 'frontend', 'ai')
+
+
+def git_commit() -> Optional[str]:
     try:
-        # Scraper 20 articles (comme d'habitude)
-        articles = scraper.scrape_all_sources(max_articles=20)
-        
-        end_time = time.time()
-        duration = end_time - start_time
-        
-        # Statistiques
-        logger.info(f"\n{'='*50}")
-        logger.info("PERFORMANCE REPORT")
-        logger.info(f"{'='*50}")
-        logger.info(f"Start time: {start_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info(f"Duration: {duration:.2f} seconds ({duration/60:.2f} minutes)")
-        logger.info(f"Articles collected: {len(articles)}")
-        
-        if articles:
-            # Compter les articles depuis le cache
-            cached_articles = sum(1 for a in articles if a.get('from_cache', False))
-            enriched_articles = sum(1 for a in articles if a.get('extraction_quality') == 'full')
-            
-            logger.info(f"Articles from cache: {cached_articles}/{len(articles)} ({cached_articles/len(articles)*100:.1f}%)")
-            logger.info(f"Articles enriched: {enriched_articles}/{len(articles)} ({enriched_articles/len(articles)*100:.1f}%)")
-            
-            # Temps moyen par article
-            avg_time_per_article = duration / len(articles)
-            logger.info(f"Average time per article: {avg_time_per_article:.2f} seconds")
-        
-        logger.info(f"{'='*50}\n")
-        
-        # Afficher les statistiques du cache
-        cache_stats = db.get_cache_stats()
-        logger.info("Cache Statistics:")
-        logger.info(f"Total cached articles: {cache_stats['total_articles']}")
-        logger.info(f"Fresh articles: {cache_stats['fresh_articles']}")
-        logger.info(f"Expired articles: {cache_stats['expired_articles']}")
-        
-        return {
-            'duration': duration,
-            'articles_count': len(articles),
-            'cached_articles': cached_articles if articles else 0,
-            'enriched_articles': enriched_articles if articles else 0,
-            'cache_stats': cache_stats
-        }
-        
-    except Exception as e:
-        logger.error(f"Error during performance test: {e}")
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
         return None
 
-if __name__ == "__main__":
-    # Configuration des logs pour le test
+
+def peak_rss_mb() -> float:
+    """Pic de mémoire résidente du processus (les processus de parsing ne sont pas comptés)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kio sous Linux, octets sous macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def ratio(part: int, total: int) -> Optional[float]:
+    return round(part / total, 3) if total else None
+
+
+def spread_sources(feeds: List[Dict]) -> Dict[str, Dict[str, List[Dict]]]:
+    """Flux répartis sur les trois domaines, au format de SPECIALIZED_SOURCES"""
+    sources = {domain: {'benchmark': []} for domain in DOMAINS}
+    for index, source in enumerate(feeds):
+        sources[DOMAINS[index % len(DOMAINS)]]['benchmark'].append(source)
+    return sources
+
+
+def replay_sources(archive) -> Optional[Dict[str, Dict[str, List[Dict]]]]:
+    """
+    Sources d'un run rejoué : configuration par défaut si l'archive a été enregistrée depuis les sources
+    réelles (None), sinon les flux de l'archive (enregistrement du serveur local avec --record)
+    """
+    from src.fetch_plan import compile_fetch_plan
+    from src.sources_config import SPECIALIZED_SOURCES
+
+    feeds = archive.feed_urls()
+    if set(feeds) <= set(compile_fetch_plan(SPECIALIZED_SOURCES).unique_urls):
+        return None
+    return spread_sources([{'url': url, 'weight': 7, 'type': 'blog', 'focus': 'benchmark'} for url in feeds])
+
+
+def cache_rates(stats: Dict) -> Dict[str, Optional[float]]:
+    """Taux de succès des caches du run (None si le cache n'a pas été sollicité)"""
+    downloads = stats.get('downloads', {})
+    raw_html = stats.get('raw_html', {})
+    seen = stats.get('seen_entries', {})
+    http = stats.get('http', {})
+    feeds = stats.get('feeds', 0)
+    return {
+        'feeds_unchanged': ratio(stats.get('feeds_skipped_unchanged', 0), feeds),
+        'enriched_content': ratio(
+            downloads.get('cache_hits', 0),
+            downloads.get('cache_hits', 0) + downloads.get('pages_downloaded', 0) + raw_html.get('hits', 0)
+        ),
+        'raw_html_store': ratio(raw_html.get('hits', 0), raw_html.get('hits', 0) + raw_html.get('misses', 0)),
+        'seen_entries': ratio(
+            seen.get('unchanged', 0) + seen.get('rehydrated', 0),
+            sum(seen.get(key, 0) for key in ('new', 'changed', 'unchanged', 'rehydrated'))
+        ),
+        'connections_reused': ratio(http.get('connections_reused', 0), http.get('requests', 0)),
+    }
+
+
+def run_once(scraper, max_articles: int, deadline_seconds: float, count_requests) -> Dict:
+    """Un run complet de scrape_all_sources et ses mesures (flux relus même inchangés ou pas encore dus)"""
+    from src.run_budget import RunDeadline
+
+    requests_before = count_requests()
+    start = time.perf_counter()
+    articles = scraper.scrape_all_sources(
+        max_articles=max_articles, force_poll=True, deadline=RunDeadline(deadline_seconds or None)
+    )
+    duration = time.perf_counter() - start
+    requests_made = count_requests() - requests_before
+    stats = dict(scraper.last_run_stats or {}, feeds=len(scraper.fetch_plan.unique_urls))
+
+    return {
+        'duration_seconds': round(duration, 3),
+        'feeds': stats['feeds'],
+        'articles': len(articles),
+        'enriched_full': sum(
+            1 for article in articles if article.get('content_data', {}).get('extraction_quality') == 'full'
+        ),
+        'requests': requests_made,
+        'requests_per_second': round(requests_made / duration, 1) if duration else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'stage_seconds': stats.get('stage_seconds', {}),
+        'cache_hit_rates': cache_rates(stats),
+        'collected': stats.get('total_collected', 0),
+        # Run sans mesure utile (sources injoignables, archive incomplète) : à ne pas comparer
+        'nothing_collected': not stats.get('total_collected', 0),
+        'after_filtering': stats.get('after_filtering', 0),
+        'rejections': stats.get('rejections', {}),
+        'downloads': stats.get('downloads', {}),
+        'cache_writes': stats.get('cache_writes', {}),
+        'http': stats.get('http', {}),
+        'partial': stats.get('partial', False),
+        'abandoned': stats.get('abandoned', {}),
+    }
+
+
+def run_suite(args) -> Dict:
+    """Exécute les runs dans un dossier temporaire (data/ relatif au dossier courant)"""
+    # La configuration est lue à l'import : les variables d'environnement sont posées avant
+    from benchmarks.fixture_server import FixtureConfig, FixtureServer
+    from src.database import DatabaseManager
+    from src.enhanced_scraper import EnhancedFullstackScraper
+    from src.http_archive import get_http_archive
+
+    server = None
+    if not args.replay:
+        server = FixtureServer(
+            FixtureConfig(entries_per_feed=args.entries, latency_ms=args.latency_ms,
+                          error_rate=args.error_rate, page_paragraphs=args.paragraphs),
+            hosts=args.hosts
+        ).start()
+
+    cwd = os.getcwd()
+    runs = []
+    with tempfile.TemporaryDirectory() as workdir:
+        os.makedirs(os.path.join(workdir, 'data'))
+        os.chdir(workdir)
+        try:
+            db = DatabaseManager(db_path=os.path.join(workdir, 'data', 'linkedin_posts.db'))
+            if server is not None:
+                scraper = EnhancedFullstackScraper(db, sources=spread_sources(server.sources(args.feeds)))
+                count_requests = lambda: sum(server.stats[key] for key in ('feed_requests', 'article_requests'))
+            else:
+                archive = get_http_archive()
+                scraper = EnhancedFullstackScraper(db, sources=replay_sources(archive))
+                count_requests = lambda: archive.get_stats()['replayed'] + archive.get_stats()['misses']
+
+            for index in range(args.runs):
+                result = run_once(scraper, args.max_articles, args.deadline, count_requests)
+                result['run'] = index + 1
+                result['cache'] = 'cold' if index == 0 else 'warm'
+                runs.append(result)
+                print_run(result)
+
+            counters = server.stats if server is not None else get_http_archive().get_stats()
+            db.close()
+        finally:
+            os.chdir(cwd)
+            if server is not None:
+                server.stop()
+
+    return {'runs': runs, 'source_counters': counters}
+
+
+def print_run(result: Dict) -> None:
+    rates = ', '.join(
+        f"{name} {value:.0%}" for name, value in result['cache_hit_rates'].items() if value is not None
+    ) or 'none'
+    print(f"run {result['run']} ({result['cache']}): {result['duration_seconds']:.2f}s, "
+          f"{result['articles']} articles ({result['enriched_full']} full), {result['collected']} collected, "
+          f"{result['requests']} requests ({result['requests_per_second']} req/s), "
+          f"peak RSS {result['peak_rss_mb']} MiB{', PARTIAL' if result['partial'] else ''}")
+    if result['nothing_collected']:
+        print(f"    WARNING: run {result['run']} collected no articles, its timings do not measure a scrape")
+    for domain, stages in result['stage_seconds'].items():
+        if stages:
+            print(f"    {domain:<9} " + '  '.join(f"{stage} {seconds:.2f}s" for stage, seconds in stages.items()))
+    print(f"    cache hits: {rates}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--feeds', type=int, default=30, help='Flux générés (répartis sur les trois domaines)')
+    parser.add_argument('--entries', type=int, default=10, help='Entrées par flux')
+    parser.add_argument('--latency-ms', type=float, default=50, help='Latence du serveur par requête')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Part des requêtes en erreur 503')
+    parser.add_argument('--paragraphs', type=int, default=40, help='Paragraphes par page (taille des pages)')
+    parser.add_argument('--hosts', type=int, default=1, help='Hosts simulés (alias 127.0.0.x)')
+    parser.add_argument('--max-articles', type=int, default=20)
+    parser.add_argument('--runs', type=int, default=2, help='Runs successifs (le premier à froid)')
+    parser.add_argument('--deadline', type=float, default=0, help='Budget de chaque run en secondes (0 = sans limite)')
+    parser.add_argument('--engine', choices=('threads', 'async'), help='Moteur de fetch (défaut : configuration)')
+    parser.add_argument('--pipeline', choices=('stages', 'streaming'), help='Mode du pipeline (défaut : configuration)')
+    parser.add_argument('--replay', help='Archive HTTP à rejouer à la place du serveur local')
+    parser.add_argument('--record', help='Enregistre les réponses du serveur local dans cette archive')
+    parser.add_argument('--json', help='Fichier de résultats (défaut : logs/performance_<date>.json)')
+    parser.add_argument('--log-level', default='WARNING')
+    args = parser.parse_args()
+
     logger.remove()
-    logger.add("logs/performance_test_{time}.log", rotation="10 MB")
-    logger.add(lambda msg: print(msg), colorize=True)
-    
-    # Lancer le test
-    results = measure_scraping_performance()
-    
-    if results:
-        logger.success("\nPerformance test completed successfully!")
-        logger.info("\nOptimizations applied:")
-        logger.info("✓ RSS collection workers: 5 → 15")
-        logger.info("✓ Content enrichment workers: 3 → 10")
-        logger.info("✓ Content caching implemented")
-        logger.info("✓ Reduced articles for low-priority sources")
-        logger.info("✓ Date filtering before enrichment (30 days)")
-    else:
-        logger.error("\nPerformance test failed!")
\ No newline at end of file
+    logger.add(sys.stderr, level=args.log_level)
+
+    if args.replay and args.record:
+        parser.error('--replay and --record are mutually exclusive')
+    if args.replay or args.record:
+        os.environ['SCRAPER_HTTP_ARCHIVE_MODE'] = 'replay' if args.replay else 'record'
+        os.environ['SCRAPER_HTTP_ARCHIVE'] = os.path.abspath(args.replay or args.record)
+    if args.engine:
+        os.environ['SCRAPER_FETCH_ENGINE'] = args.engine
+    if args.pipeline:
+        os.environ['SCRAPER_PIPELINE_MODE'] = args.pipeline
+
+    suite = run_suite(args)
+
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+        'config': vars(args),
+        **suite,
+    }
+    output = args.json or os.path.join('logs', f"performance_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Circuit breaker par host : la requête de test d'un circuit semi-ouvert ne doit jamais rester réservée
+quand elle est interrompue sans résultat (annulation à l'échéance du run, erreur hors réseau)
+
+Usage : python -m pytest tests
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src import async_fetcher
+from src.host_health import CircuitBreaker, CircuitOpenError
+
+URL = 'http://slow.example/feed.xml'
+
+
+def half_open_breaker() -> CircuitBreaker:
+    """Circuit ouvert après un échec, dont le délai d'ouverture est déjà écoulé"""
+    breaker = CircuitBreaker(failure_threshold=1, open_seconds=0.01)
+    breaker.record_failure(URL, 'connection refused')
+    time.sleep(0.02)
+    return breaker
+
+
+def test_single_probe_while_half_open():
+    breaker = half_open_breaker()
+    breaker.before_request(URL)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+
+def test_released_probe_allows_a_new_one():
+    breaker = half_open_breaker()
+    breaker.before_request(URL)
+    breaker.release_probe(URL)
+    breaker.before_request(URL)
+
+
+@pytest.mark.skipif(not async_fetcher.is_available(), reason='aiohttp is not installed')
+def test_cancelled_async_probe_is_released():
+    breaker = half_open_breaker()
+    engine = async_fetcher.AsyncFetchEngine(max_retries=1, circuit_breaker=breaker)
+
+    async def never_answers(session, request):
+        await asyncio.sleep(60)
+
+    engine._fetch_once = never_answers
+    # Échéance atteinte pendant la requête de test : la tâche est annulée
+    assert engine.run([async_fetcher.FetchRequest(url=URL)], timeout=0.1) == [None]
+    assert len(engine.abandoned) == 1
+
+    # Le host n'est pas refusé pour toute la vie du processus : une nouvelle requête de test passe
+    breaker.before_request(URL)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)